@@ -7,11 +7,29 @@ Usage in notebooks or scripts:
     with mlflow.start_run(run_name="rf-v200-f015"):
         mlflow.log_params({"model": "RandomForest", "n_estimators": 100})
         mlflow.log_metrics({"r2": 0.85, "mape": 0.12, "rmse": 2.3})
+
+For sweeps, log through the buffered writer instead; it batches the file
+store writes on a background thread:
+
+    with BufferedRunLogger() as logger:
+        with logger.start_run(run_name="rf-v200-f015") as run:
+            run.log_params({"model_type": "RandomForest", "cv_folds": 5})
+            run.log_metrics({"r2": 0.85, "mape": 0.12, "rmse": 2.3})
+            run.log_artifact("data/processed/merged.csv", "dataset.csv")
+
+``log_artifact`` stores the file once in the content-addressed store under
+results/artifacts/ and tags the run with a ``cas://<digest>`` pointer.
 """
 
 import mlflow
 
 from src.machinability.utils.config import MLFLOW_EXPERIMENT_NAME, MLFLOW_TRACKING_URI
+from src.machinability.utils.tracking import (  # noqa: F401 - re-exported
+    CUTTING_PARAMS_SCHEMA,
+    MODEL_PARAMS_SCHEMA,
+    BufferedRunLogger,
+    allow_file_store,
+)
 
 
 def init_tracking(
@@ -32,24 +50,7 @@ def init_tracking(
     str
         Experiment ID.
     """
+    allow_file_store(tracking_uri)
     mlflow.set_tracking_uri(tracking_uri)
     experiment = mlflow.set_experiment(experiment_name)
     return experiment.experiment_id
-
-
-# Standard parameter sets for logging
-CUTTING_PARAMS_SCHEMA = {
-    "cutting_speed_m_min": "Cutting speed (m/min)",
-    "feed_mm_rev": "Feed rate (mm/rev)",
-    "depth_mm": "Depth of cut (mm)",
-    "tool_material": "Tool material / ISO code",
-    "coolant": "Coolant type (dry, flood, MQL)",
-}
-
-MODEL_PARAMS_SCHEMA = {
-    "model_type": "Algorithm name (RF, SVR, ANN, LinearRegression, etc.)",
-    "target_metric": "Target variable (tool_life_min, Ra_um, VB_mm, Fc_N)",
-    "features": "Input features used (comma-separated)",
-    "cv_folds": "Number of cross-validation folds",
-    "steel_grades_train": "Steel grades in training set",
-}
@@ -22,8 +22,11 @@ from gui.utils import (
     display_markdown_file,
     get_project_stats,
     list_literature_notes,
+    render_diagnostics,
     styled_metric_card,
 )
+from src.machinability.utils.instrument import REGISTRY, stage
+from src.machinability.utils.profiling import maybe_profile, profiling_requested
 
 # ── Page configuration ──────────────────────────────────────────────────────
 st.set_page_config(
@@ -549,4 +552,14 @@ PAGE_MAP: dict[str, callable] = {
     "Dissertation": render_dissertation,
 }
 
-PAGE_MAP[page]()
+# Profiling: MACHINABILITY_PROFILE=1 or ?profile=1 writes a flame graph per rerun
+rerun_mark = REGISTRY.mark()
+with maybe_profile(
+    f"page-{page}",
+    enabled=profiling_requested(st.query_params),
+    metadata={"page": page, "query_params": st.query_params.to_dict()},
+) as profiler, stage(f"page.{page}"):
+    PAGE_MAP[page]()
+if profiler is not None:
+    st.sidebar.caption(f"Profile written to `{profiler.paths['speedscope']}`")
+render_diagnostics(since=rerun_mark)
@@ -0,0 +1,62 @@
+"""Shared fixtures for the benchmark suite (pytest-benchmark).
+
+Dataset sizes are parametrised from the synthetic generator: ``n`` rows
+(specimens) for data handling, correlation and plots, ``n_fit`` for model
+fitting and ``n_entries`` for the literature parsers. ``--quick`` keeps
+only the smallest size of each.
+
+Run through the Makefile, which stores every run as JSON under
+``results/benchmarks/``::
+
+    make bench            # run and save to the history
+    make bench-compare    # run and compare with the latest saved run
+    make bench-history    # table of all saved runs
+"""
+
+import functools
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from src.machinability.data.synthetic import generate_specimens, write_raw_csvs  # noqa: E402
+from src.machinability.utils.cache import disable_cache  # noqa: E402
+
+ROW_SIZES = (1_000, 10_000, 100_000)
+FIT_SIZES = (200, 2_000)
+ENTRY_SIZES = (100, 1_000, 10_000)
+
+
+def pytest_addoption(parser):
+    parser.addoption("--quick", action="store_true", help="Benchmark the smallest sizes only")
+
+
+def pytest_generate_tests(metafunc):
+    quick = metafunc.config.getoption("quick")
+    for name, sizes in {"n": ROW_SIZES, "n_fit": FIT_SIZES, "n_entries": ENTRY_SIZES}.items():
+        if name in metafunc.fixturenames:
+            metafunc.parametrize(name, sizes[:1] if quick else sizes)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _uncached():
+    """Measure the functions themselves, not the memoization cache."""
+    disable_cache()
+
+
+@functools.cache
+def _specimens(n: int):
+    return generate_specimens(n, seed=0)
+
+
+@pytest.fixture
+def specimens(n):
+    return _specimens(n)
+
+
+@pytest.fixture
+def raw_dir(n, tmp_path_factory):
+    path = tmp_path_factory.getbasetemp() / f"raw-{n}"
+    if not path.is_dir():
+        write_raw_csvs(path, n=n, seed=0)
+    return path
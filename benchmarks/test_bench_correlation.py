@@ -0,0 +1,22 @@
+"""Benchmarks for the RQ1 correlation functions."""
+
+from src.machinability.analysis.correlation import (
+    correlation_matrix,
+    pearson_correlation,
+    spearman_correlation,
+)
+
+
+def test_pearson_correlation(benchmark, specimens):
+    result = benchmark(pearson_correlation, specimens["conductivity"], specimens["tool_life"])
+    assert result["n"] == len(specimens)
+
+
+def test_spearman_correlation(benchmark, specimens):
+    result = benchmark(spearman_correlation, specimens["conductivity"], specimens["tool_life"])
+    assert result["n"] == len(specimens)
+
+
+def test_correlation_matrix(benchmark, specimens):
+    matrix = benchmark(correlation_matrix, specimens)
+    assert "conductivity" in matrix.columns
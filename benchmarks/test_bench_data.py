@@ -0,0 +1,38 @@
+"""Benchmarks for the CSV loaders and the conductivity-machining merge."""
+
+import pandas as pd
+
+from src.machinability.data.loader import (
+    load_conductivity_data,
+    load_evidence_matrix,
+    load_machining_data,
+)
+from src.machinability.data.preprocessing import merge_conductivity_machining
+from src.machinability.utils.config import EVIDENCE_MATRIX
+
+
+def test_load_conductivity_data(benchmark, raw_dir):
+    df = benchmark(load_conductivity_data, raw_dir / "conductivity.csv")
+    assert not df.empty
+
+
+def test_load_machining_data(benchmark, raw_dir):
+    df = benchmark(load_machining_data, raw_dir / "machining.csv")
+    assert not df.empty
+
+
+def test_load_evidence_matrix(benchmark, n, tmp_path):
+    matrix = load_evidence_matrix(EVIDENCE_MATRIX)
+    path = tmp_path / "evidence_matrix.csv"
+    matrix.sample(n, replace=True, random_state=0).to_csv(path, index=False)
+    df = benchmark(load_evidence_matrix, path)
+    assert len(df) == n
+
+
+def test_merge_conductivity_machining(benchmark, specimens):
+    ids = pd.Series([f"S{i:06d}" for i in range(len(specimens))])
+    conductivity = specimens[["conductivity", "hardness"]].assign(specimen_id=ids)
+    machining = specimens[["tool_life", "Ra", "Fc"]].assign(specimen_id=ids)
+    machining = machining.sample(frac=1.0, random_state=0)
+    merged = benchmark(merge_conductivity_machining, conductivity, machining)
+    assert len(merged) == len(specimens)
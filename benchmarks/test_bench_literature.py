@@ -0,0 +1,38 @@
+"""Benchmarks for the literature-note and BibTeX parsers."""
+
+import pytest
+
+from src.machinability.data.literature import (
+    load_bibtex,
+    load_notes,
+    note_files,
+    parse_bib_entries,
+)
+
+
+@pytest.fixture
+def bib_text(n_entries):
+    entries = parse_bib_entries(load_bibtex())
+    blocks = [
+        entries[i % len(entries)]["_raw"].replace(entries[i % len(entries)]["key"], f"entry{i}", 1)
+        for i in range(n_entries)
+    ]
+    return "\n\n".join(blocks) + "\n"
+
+
+@pytest.fixture
+def notes_dir(n_entries, tmp_path):
+    notes = [path.read_text(encoding="utf-8") for path in note_files()]
+    for i in range(n_entries):
+        (tmp_path / f"note_{i:05d}.md").write_text(notes[i % len(notes)], encoding="utf-8")
+    return tmp_path
+
+
+def test_parse_bib_entries(benchmark, bib_text, n_entries):
+    entries = benchmark(parse_bib_entries, bib_text)
+    assert len(entries) == n_entries
+
+
+def test_load_notes(benchmark, notes_dir, n_entries):
+    notes = benchmark(load_notes, notes_dir)
+    assert len(notes) == n_entries
@@ -0,0 +1,29 @@
+"""Benchmarks for fitting and predicting with every factory model (RQ4)."""
+
+import pytest
+
+from src.machinability.data.synthetic import generate_specimens
+from src.machinability.models.factory import MODEL_MAP, make_model
+
+FEATURES = ["conductivity", "hardness", "composition_C", "composition_Mn", "composition_Cr"]
+
+
+@pytest.fixture
+def xy(n_fit):
+    df = generate_specimens(n_fit, seed=0)
+    return df[FEATURES].to_numpy(), df["tool_life"].to_numpy()
+
+
+@pytest.mark.parametrize("name", list(MODEL_MAP))
+def test_fit(benchmark, name, xy):
+    X, y = xy
+    model = benchmark(lambda: make_model(name).fit(X, y))
+    assert model.predict(X[:1]).shape == (1,)
+
+
+@pytest.mark.parametrize("name", list(MODEL_MAP))
+def test_predict(benchmark, name, xy):
+    X, y = xy
+    model = make_model(name).fit(X, y)
+    y_pred = benchmark(model.predict, X)
+    assert y_pred.shape == y.shape
@@ -0,0 +1,22 @@
+"""Benchmarks for rendering the research figures (Agg backend)."""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+from src.machinability.visualization.plots import scatter_with_regression  # noqa: E402
+
+
+def _render(x, y):
+    fig, ax = plt.subplots(figsize=(8, 6))
+    scatter_with_regression(x, y, ylabel="Tool life (min)", ax=ax)
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def test_scatter_with_regression(benchmark, specimens):
+    x = specimens["conductivity"].to_numpy()
+    y = specimens["tool_life"].to_numpy()
+    benchmark(_render, x, y)
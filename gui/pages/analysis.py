@@ -13,13 +13,14 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 from scipy import stats
 
+from src.machinability.data.synthetic import generate_specimens
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -47,6 +48,15 @@ _COL_LABELS: dict[str, str] = {
 
 _RNG_SEED = 42
 
+# generate_specimens() column -> page column
+_DEMO_COLUMNS = {
+    "conductivity": "conductivity_%IACS",
+    "tool_life": "tool_life_min",
+    "Ra": "Ra_um",
+    "Fc": "Fc_N",
+    "hardness": "hardness_HV",
+}
+
 # ---------------------------------------------------------------------------
 # Data helpers
 # ---------------------------------------------------------------------------
@@ -72,69 +82,12 @@ def _load_real_data() -> pd.DataFrame | None:
 def _generate_demo_data(n: int = 50) -> pd.DataFrame:
     """Generate physically-plausible synthetic data for three steel grades.
 
-    The synthetic relationships mirror established metallurgical trends:
-    * Higher-alloy steels (4340) have lower conductivity and are harder to
-      machine (lower tool life, higher forces, rougher surfaces).
-    * Conductivity is inversely correlated with hardness within each grade.
-    * Tool life drops with conductivity (harder material -> lower conductivity
-      -> shorter tool life) with realistic scatter.
+    Uses the package generator (:func:`generate_specimens`) so the demo data
+    match the models page; columns are renamed to the evidence-matrix
+    naming used on this page.
     """
-    rng = np.random.default_rng(_RNG_SEED)
-
-    grade_params: dict[str, dict[str, tuple[float, float]]] = {
-        "AISI 1045": {
-            "conductivity": (5.5, 0.50),
-            "hardness": (210, 20),
-        },
-        "AISI 4140": {
-            "conductivity": (4.0, 0.45),
-            "hardness": (290, 25),
-        },
-        "AISI 4340": {
-            "conductivity": (3.0, 0.40),
-            "hardness": (350, 30),
-        },
-    }
-
-    rows: list[dict] = []
-    per_grade = n // len(_STEEL_GRADES)
-    remainder = n - per_grade * len(_STEEL_GRADES)
-
-    for idx, grade in enumerate(_STEEL_GRADES):
-        count = per_grade + (1 if idx < remainder else 0)
-        p = grade_params[grade]
-
-        cond = rng.normal(p["conductivity"][0], p["conductivity"][1], size=count)
-        cond = np.clip(cond, 2.0, 7.0)
-
-        hv = rng.normal(p["hardness"][0], p["hardness"][1], size=count)
-        hv = np.clip(hv, 150, 450)
-
-        # Tool life inversely related to hardness (and thus to lower conductivity)
-        tool_life = 80 - 0.15 * hv + rng.normal(0, 3.5, size=count)
-        tool_life = np.clip(tool_life, 5, 70)
-
-        # Surface roughness increases with hardness
-        ra = 0.3 + 0.004 * hv + rng.normal(0, 0.18, size=count)
-        ra = np.clip(ra, 0.3, 3.5)
-
-        # Cutting force increases with hardness
-        fc = 200 + 1.8 * hv + rng.normal(0, 40, size=count)
-        fc = np.clip(fc, 200, 1200)
-
-        for i in range(count):
-            rows.append(
-                {
-                    "steel_grade": grade,
-                    "conductivity_%IACS": round(float(cond[i]), 2),
-                    "tool_life_min": round(float(tool_life[i]), 1),
-                    "Ra_um": round(float(ra[i]), 2),
-                    "Fc_N": round(float(fc[i]), 1),
-                    "hardness_HV": round(float(hv[i]), 0),
-                }
-            )
-
-    return pd.DataFrame(rows)
+    df = generate_specimens(n, seed=_RNG_SEED, grades=_STEEL_GRADES)
+    return df.rename(columns=_DEMO_COLUMNS)[["steel_grade", *_NUMERIC_COLS]]
 
 
 def _get_data(use_demo: bool) -> pd.DataFrame:
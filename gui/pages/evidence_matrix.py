@@ -13,6 +13,8 @@ import numpy as np
 import pandas as pd
 import streamlit as st
 
+from src.machinability.analysis import evidence
+
 # ---------------------------------------------------------------------------
 # Path helpers
 # ---------------------------------------------------------------------------
@@ -314,7 +316,7 @@ def _render_data_quality(df: pd.DataFrame) -> None:
     )
 
     # Build a boolean presence matrix (True = has data)
-    presence = df.notna() & (df.astype(str).str.strip() != "")
+    presence = evidence.presence(df)
 
     # We create a styled dataframe with green/red background.
     def _colour_cell(val: bool) -> str:
@@ -327,7 +329,8 @@ def _render_data_quality(df: pd.DataFrame) -> None:
 
     # Use paper_id (+ index) as the row label for readability
     if "paper_id" in df.columns:
-        labels = df["paper_id"].astype(str).head(200)
+        head = df.head(200)
+        labels = head["paper_id"].astype(str) + " #" + head.index.astype(str)
         display_presence = display_presence.copy()
         display_presence.index = labels
 
@@ -336,14 +339,7 @@ def _render_data_quality(df: pd.DataFrame) -> None:
 
     # ---- Missing data percentage per column ----
     st.markdown("#### Missing Data Percentage per Column")
-    total_rows = len(df)
-    missing_counts = total_rows - presence.sum()
-    missing_pct = (missing_counts / total_rows * 100).round(1)
-    missing_summary = pd.DataFrame(
-        {"missing_count": missing_counts, "missing_pct": missing_pct}
-    ).sort_values("missing_pct", ascending=False)
-
-    st.dataframe(missing_summary, use_container_width=True)
+    st.dataframe(evidence.missing_summary(df), use_container_width=True)
 
     # ---- Gap analysis ----
     st.markdown("#### Gap Analysis")
@@ -356,32 +352,14 @@ def _render_data_quality(df: pd.DataFrame) -> None:
     with col_a:
         st.markdown("**Rows per steel grade**")
         if "steel_grade" in df.columns:
-            grade_counts = (
-                df["steel_grade"]
-                .fillna("(blank)")
-                .astype(str)
-                .str.strip()
-                .replace("", "(blank)")
-                .value_counts()
-                .sort_values()
-            )
-            st.bar_chart(grade_counts)
+            st.bar_chart(evidence.rows_per(df, "steel_grade"))
         else:
             st.info("No `steel_grade` column found.")
 
     with col_b:
         st.markdown("**Rows per conductivity method**")
         if "conductivity_method" in df.columns:
-            method_counts = (
-                df["conductivity_method"]
-                .fillna("(blank)")
-                .astype(str)
-                .str.strip()
-                .replace("", "(blank)")
-                .value_counts()
-                .sort_values()
-            )
-            st.bar_chart(method_counts)
+            st.bar_chart(evidence.rows_per(df, "conductivity_method"))
         else:
             st.info("No `conductivity_method` column found.")
 
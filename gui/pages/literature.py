@@ -11,26 +11,25 @@ Provides:
 
 from __future__ import annotations
 
-import re
 from collections import Counter
 from pathlib import Path
-from typing import Any
 
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
+from src.machinability.data import literature
+
 # ---------------------------------------------------------------------------
 # Paths
 # ---------------------------------------------------------------------------
 _BASE = Path(__file__).resolve().parents[2]  # …/AI_Research
 _NOTES_DIR = _BASE / "01_LITERATURE" / "notes"
 _BIB_FILE = _BASE / "01_LITERATURE" / "library.bib"
-_TEMPLATE = "PAPER_NOTE_TEMPLATE.md"
 
 # Research questions
-_RQS = ["RQ1", "RQ2", "RQ3", "RQ4"]
+_RQS = literature.RQS
 _RQ_LABELS = {
     "RQ1": "RQ1 (Conductivity-Machinability)",
     "RQ2": "RQ2 (Microstructural Mediation)",
@@ -48,125 +47,19 @@ _PILLAR_LABELS = {
 }
 
 # ---------------------------------------------------------------------------
-# Parsing helpers
+# Data loading (parsing lives in src.machinability.data.literature)
 # ---------------------------------------------------------------------------
 
-def _note_files() -> list[Path]:
-    """Return all .md note files, excluding the template."""
-    if not _NOTES_DIR.is_dir():
-        return []
-    return sorted(
-        p for p in _NOTES_DIR.glob("*.md") if p.name != _TEMPLATE
-    )
-
-
-def _extract_field(text: str, field: str) -> str:
-    """Extract a '- **Field:** value' line from markdown text."""
-    pattern = rf"\*\*{re.escape(field)}:\*\*\s*(.*)"
-    m = re.search(pattern, text)
-    return m.group(1).strip() if m else ""
-
-
-def _extract_rq_scores(text: str) -> dict[str, int]:
-    """Parse 'RQ1: 4/5 | RQ2: 3/5 ...' into a dict of ints."""
-    scores: dict[str, int] = {}
-    relevance_line = _extract_field(text, "RQ Relevance")
-    if not relevance_line:
-        return {rq: 0 for rq in _RQS}
-    for rq in _RQS:
-        m = re.search(rf"{rq}:\s*(\d+)/5", relevance_line)
-        scores[rq] = int(m.group(1)) if m else 0
-    return scores
-
-
-def _extract_tags(text: str) -> list[str]:
-    """Extract backtick-delimited tags from the '## Tags' section."""
-    m = re.search(r"## Tags\s*\n(.+)", text)
-    if not m:
-        return []
-    return re.findall(r"`([^`]+)`", m.group(1))
-
-
-def _extract_pillar(text: str) -> str:
-    """Extract pillar letter(s) from the Classification section."""
-    raw = _extract_field(text, "Pillar")
-    if not raw:
-        return ""
-    # Normalise: "Multi (B + D)" -> "Multi", "A" -> "A"
-    raw_upper = raw.strip().upper()
-    if raw_upper.startswith("MULTI"):
-        return "Multi"
-    # Take the first single letter that matches known pillars
-    for ch in "ABCD":
-        if ch in raw_upper:
-            return ch
-    return raw.strip()
-
-
-def _parse_note(path: Path) -> dict[str, Any]:
-    """Parse a single paper note into a metadata dict."""
-    text = path.read_text(encoding="utf-8")
-    rq_scores = _extract_rq_scores(text)
-    tags = _extract_tags(text)
-    pillar = _extract_pillar(text)
-    year_raw = _extract_field(text, "Year")
-    # Try to pull a 4-digit year
-    year_match = re.search(r"\d{4}", year_raw)
-    year = int(year_match.group()) if year_match else None
-
-    return {
-        "file": path.name,
-        "path": str(path),
-        "title": _extract_field(text, "Title"),
-        "authors": _extract_field(text, "Authors"),
-        "year": year,
-        "journal": _extract_field(text, "Journal/Publisher"),
-        "pillar": pillar,
-        "paper_type": _extract_field(text, "Paper Type"),
-        **rq_scores,
-        "relevance_total": sum(rq_scores.values()),
-        "tags": tags,
-        "tags_str": ", ".join(tags),
-        "raw": text,
-    }
-
-
 @st.cache_data(show_spinner="Scanning literature notes...")
 def _load_all_notes() -> pd.DataFrame:
     """Load and parse every paper note into a DataFrame."""
-    files = _note_files()
-    if not files:
-        return pd.DataFrame()
-    records = [_parse_note(p) for p in files]
-    return pd.DataFrame(records)
+    return literature.load_notes(_NOTES_DIR)
 
 
 @st.cache_data(show_spinner="Loading BibTeX library...")
 def _load_bibtex() -> str:
     """Return the raw text of library.bib."""
-    if _BIB_FILE.is_file():
-        return _BIB_FILE.read_text(encoding="utf-8")
-    return ""
-
-
-def _parse_bib_entries(bib_text: str) -> list[dict[str, str]]:
-    """Lightweight parser: split bib_text into individual entries."""
-    entries: list[dict[str, str]] = []
-    # Match each @type{key, ... } block
-    pattern = re.compile(
-        r"@(\w+)\{([^,]+),\s*(.*?)\n\}", re.DOTALL
-    )
-    for m in pattern.finditer(bib_text):
-        entry_type = m.group(1)
-        cite_key = m.group(2).strip()
-        body = m.group(3)
-        # Extract fields
-        fields: dict[str, str] = {"type": entry_type, "key": cite_key}
-        for fm in re.finditer(r"(\w+)\s*=\s*\{(.*?)\}", body, re.DOTALL):
-            fields[fm.group(1).lower()] = fm.group(2).strip()
-        fields["_raw"] = m.group(0)
-        entries.append(fields)
-    return entries
+    return literature.load_bibtex(_BIB_FILE)
 
 
 # ---------------------------------------------------------------------------
@@ -292,7 +185,7 @@ def _section_bibtex(bib_text: str) -> None:
         st.warning("`01_LITERATURE/library.bib` not found.")
         return
 
-    entries = _parse_bib_entries(bib_text)
+    entries = literature.parse_bib_entries(bib_text)
     st.markdown(f"**{len(entries)}** entries in `library.bib`")
 
     search = st.text_input(
@@ -9,164 +9,82 @@ import time
 
 import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import streamlit as st
-from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
-from sklearn.linear_model import LinearRegression
-from sklearn.model_selection import cross_val_score, train_test_split
-from sklearn.svm import SVR
 
-from src.machinability.models.baseline import HardnessOnlyBaseline, evaluate_model
+from src.machinability.data.synthetic import generate_specimens
+from src.machinability.models.factory import MODEL_MAP, TREE_MODELS, fit_model, make_model
+from src.machinability.models.hypotheses import HYPOTHESES, SUPPORTED, evaluate_hypotheses
+from src.machinability.models.store import ModelStore, data_hash, model_key
+from src.machinability.utils.config import MLFLOW_EXPERIMENT_NAME
+from src.machinability.utils.instrument import stage
 
-
-# ---------------------------------------------------------------------------
-# Synthetic data generation
-# ---------------------------------------------------------------------------
-
-def _generate_synthetic_data(n: int = 80, seed: int = 42) -> pd.DataFrame:
-    """Generate synthetic machinability data for demonstration.
-
-    Produces *n* specimens spread across three AISI steel grades with
-    realistic correlations between features and targets.
-
-    Parameters
-    ----------
-    n : int
-        Number of specimens (default 80).
-    seed : int
-        Random seed for reproducibility.
-
-    Returns
-    -------
-    pd.DataFrame
-        DataFrame with columns: steel_grade, conductivity, hardness,
-        composition_C, composition_Mn, composition_Cr, tool_life, Ra, Fc.
-    """
-    rng = np.random.default_rng(seed)
-
-    grades = np.array(["AISI 1045", "AISI 4140", "AISI 4340"])
-    grade_assignment = rng.choice(grades, size=n)
-
-    # Grade-specific base properties
-    grade_props = {
-        "AISI 1045": {"cond": 7.5, "hard": 200, "C": 0.45, "Mn": 0.75, "Cr": 0.04},
-        "AISI 4140": {"cond": 5.1, "hard": 280, "C": 0.40, "Mn": 0.87, "Cr": 1.00},
-        "AISI 4340": {"cond": 4.3, "hard": 320, "C": 0.40, "Mn": 0.70, "Cr": 0.80},
-    }
-
-    records = []
-    for i in range(n):
-        g = grade_assignment[i]
-        p = grade_props[g]
-
-        conductivity = p["cond"] + rng.normal(0, 0.4)
-        hardness = p["hard"] + rng.normal(0, 15)
-        comp_C = np.clip(p["C"] + rng.normal(0, 0.02), 0.10, 0.70)
-        comp_Mn = np.clip(p["Mn"] + rng.normal(0, 0.05), 0.30, 1.20)
-        comp_Cr = np.clip(p["Cr"] + rng.normal(0, 0.05), 0.0, 1.50)
-
-        # Targets with realistic correlations
-        tool_life = (
-            120
-            + 8.0 * conductivity
-            - 0.35 * hardness
-            - 40 * comp_C
-            + 10 * comp_Mn
-            - 15 * comp_Cr
-            + rng.normal(0, 6)
-        )
-        Ra = (
-            0.3
-            - 0.03 * conductivity
-            + 0.003 * hardness
-            + 0.5 * comp_C
-            + rng.normal(0, 0.08)
-        )
-        Fc = (
-            300
-            - 12 * conductivity
-            + 1.5 * hardness
-            + 100 * comp_C
-            + 50 * comp_Cr
-            + rng.normal(0, 20)
-        )
-
-        records.append(
-            {
-                "steel_grade": g,
-                "conductivity": round(conductivity, 3),
-                "hardness": round(hardness, 1),
-                "composition_C": round(comp_C, 4),
-                "composition_Mn": round(comp_Mn, 4),
-                "composition_Cr": round(comp_Cr, 4),
-                "tool_life": round(max(tool_life, 5), 2),
-                "Ra": round(max(Ra, 0.05), 4),
-                "Fc": round(max(Fc, 50), 2),
-            }
-        )
-
-    return pd.DataFrame(records)
+# scikit-learn and plotly are imported where a model is trained or a chart
+# is drawn, so the page's first render does not pay for them.
 
 
 # ---------------------------------------------------------------------------
-# Model factory
+# Experiment tracking
 # ---------------------------------------------------------------------------
 
-_MODEL_MAP = {
-    "Linear Regression": LinearRegression,
-    "SVR": SVR,
-    "Random Forest": RandomForestRegressor,
-    "Gradient Boosting": GradientBoostingRegressor,
-}
-
-
-def _make_model(name: str):
-    """Instantiate an sklearn estimator by display name."""
-    cls = _MODEL_MAP[name]
-    if name == "SVR":
-        return cls(kernel="rbf", C=10.0, epsilon=0.1)
-    if name == "Random Forest":
-        return cls(n_estimators=100, random_state=42)
-    if name == "Gradient Boosting":
-        return cls(n_estimators=100, learning_rate=0.1, random_state=42)
-    return cls()
+def _log_run(result: dict, metrics: dict, baseline_metrics: dict, cv_scores, cv_folds) -> None:
+    """Log one trained model to the project's MLflow experiment."""
+    from src.machinability.utils.tracking import BufferedRunLogger
+
+    with BufferedRunLogger() as logger:
+        with logger.start_run(
+            run_name=f"{result['model']}-{result['target']}",
+            tags={"data_hash": result["data_hash"]},
+        ) as run:
+            run.log_params(
+                {
+                    "model_type": result["model"],
+                    "target_metric": result["target"],
+                    "features": result["features"],
+                    "cv_folds": cv_folds,
+                }
+            )
+            run.log_metrics(
+                {
+                    **metrics,
+                    "cv_mean_r2": float(np.mean(cv_scores)),
+                    "baseline_r2": baseline_metrics["r2"],
+                    "baseline_mape": baseline_metrics["mape"],
+                }
+            )
 
 
-# ---------------------------------------------------------------------------
-# Hypothesis criteria (RQ4)
-# ---------------------------------------------------------------------------
+def _tracked_results() -> list[dict]:
+    """Best tracked run per (model, features, target), in comparison-table form."""
+    from src.machinability.utils.run_index import RunIndex
 
-_HYPOTHESES = {
-    "H4a": {
-        "description": (
-            "Conductivity-based features improve predictive accuracy for "
-            "tool life beyond hardness-only baselines."
-        ),
-        "criterion": "MAPE < 15% AND R\u00b2 > 0.75 for tool_life target",
-    },
-    "H4b": {
-        "description": (
-            "ML models incorporating conductivity achieve > 10% lower MAPE "
-            "than the HardnessOnly baseline."
-        ),
-        "criterion": "Relative MAPE improvement > 10% vs baseline",
-    },
-    "H4c": {
-        "description": (
-            "Random Forest or Gradient Boosting outperforms linear models "
-            "when conductivity features are included."
-        ),
-        "criterion": "Non-linear model R\u00b2 exceeds linear model R\u00b2",
-    },
-    "H4d": {
-        "description": (
-            "Feature importance analysis ranks conductivity among the top-3 "
-            "predictors."
-        ),
-        "criterion": "Conductivity in top-3 features by importance",
-    },
-}
+    with RunIndex() as index:
+        index.update()
+        runs = index.best_runs(
+            "r2",
+            by=["model_type", "features", "target_metric"],
+            experiment=MLFLOW_EXPERIMENT_NAME,
+        )
+    if runs.empty:
+        return []
+
+    def column(name):
+        return runs[name] if name in runs else pd.Series(np.nan, index=runs.index)
+
+    table = pd.DataFrame(
+        {
+            "model": runs["params.model_type"],
+            "features": runs["params.features"],
+            "target": runs["params.target_metric"],
+            "R2": column("metrics.r2").round(4),
+            "MAPE": (column("metrics.mape") * 100).round(2),
+            "RMSE": column("metrics.rmse").round(4),
+            "CV_mean_R2": column("metrics.cv_mean_r2").round(4),
+            "Baseline_R2": column("metrics.baseline_r2").round(4),
+            "Baseline_MAPE": (column("metrics.baseline_mape") * 100).round(2),
+            "data_hash": column("tags.data_hash"),
+        }
+    )
+    return table.dropna(subset=["MAPE"]).to_dict("records")
 
 
 # ---------------------------------------------------------------------------
@@ -185,6 +103,9 @@ def render() -> None:
     # Initialise session state for model comparison history
     if "model_results" not in st.session_state:
         st.session_state["model_results"] = []
+    if "model_store" not in st.session_state:
+        st.session_state["model_store"] = ModelStore()
+    store: ModelStore = st.session_state["model_store"]
 
     # ------------------------------------------------------------------
     # Sidebar: Model configuration
@@ -196,7 +117,7 @@ def render() -> None:
     with col_cfg1:
         model_name = st.selectbox(
             "Model type",
-            list(_MODEL_MAP.keys()),
+            list(MODEL_MAP.keys()),
             help="Choose the regression algorithm to train.",
         )
 
@@ -237,6 +158,27 @@ def render() -> None:
             step=1,
         )
 
+        interval_level = st.slider(
+            "Prediction interval coverage",
+            min_value=0.50,
+            max_value=0.95,
+            value=0.90,
+            step=0.05,
+            help="Target coverage of the CV+ conformal intervals.",
+        )
+
+        save_to_registry = st.checkbox(
+            "Save trained model to registry",
+            value=False,
+            help="Persist the fitted model under results/models/ for batch scoring.",
+        )
+
+        log_to_mlflow = st.checkbox(
+            "Log run to MLflow",
+            value=False,
+            help="Record parameters and metrics in mlruns/ for cross-session comparison.",
+        )
+
     # ------------------------------------------------------------------
     # Training
     # ------------------------------------------------------------------
@@ -248,9 +190,18 @@ def render() -> None:
             st.error("Please select at least one input feature.")
             return
 
+        import plotly.express as px
+        import plotly.graph_objects as go
+        from sklearn.model_selection import cross_validate, train_test_split
+
+        from src.machinability.models.baseline import HardnessOnlyBaseline, evaluate_model
+        from src.machinability.models.conformal import CVPlusRegressor, interval_coverage
+        from src.machinability.models.drift import DriftReference, save_reference
+        from src.machinability.models.registry import default_model_name, save_model
+
         # --- Load or generate data ---
         progress = st.progress(0, text="Preparing data...")
-        df = _generate_synthetic_data()
+        df = generate_specimens()
         time.sleep(0.15)
         progress.progress(10, text="Data ready. Splitting...")
 
@@ -263,18 +214,34 @@ def render() -> None:
         progress.progress(20, text="Training model...")
 
         # --- Train selected model ---
-        model = _make_model(model_name)
-        model.fit(X_train, y_train)
+        model = fit_model(model_name, X_train, y_train)
         progress.progress(50, text="Generating predictions...")
 
         y_pred = model.predict(X_test)
         metrics = evaluate_model(y_test, y_pred)
-        progress.progress(65, text="Cross-validating...")
 
-        # --- Cross-validation ---
-        cv_scores = cross_val_score(
-            _make_model(model_name), X, y, cv=cv_folds, scoring="r2"
+        # --- Register in the model store (importances computed once, here) ---
+        train_digest = data_hash(X_train, y_train)
+        store_key = store.put(
+            model_name, selected_features, target_variable, train_digest,
+            model, X_test=X_test, y_test=y_test,
         )
+        if model_name in TREE_MODELS:
+            progress.progress(58, text="Computing permutation importance and TreeSHAP...")
+            with stage("models_page.importances", rows=len(X_test)):
+                store.permutation_importances(store_key)
+                store.shap_values(store_key)
+        progress.progress(65, text="Cross-validating...")
+
+        # --- Cross-validation (fold models are reused for CV+ intervals) ---
+        with stage("models_page.cross_validate", rows=len(X_train)):
+            cv_results = cross_validate(
+                make_model(model_name), X_train, y_train, cv=cv_folds, scoring="r2",
+                return_estimator=True, return_indices=True,
+            )
+        cv_scores = cv_results["test_score"]
+        cvplus = CVPlusRegressor.from_cv_results(cv_results, X_train, y_train)
+        _, y_lower, y_upper = cvplus.predict_interval(X_test, alpha=1.0 - interval_level)
         progress.progress(80, text="Training baseline...")
 
         # --- Baseline comparison ---
@@ -300,6 +267,21 @@ def render() -> None:
         time.sleep(0.25)
         progress.empty()
 
+        if save_to_registry:
+            saved_dir = save_model(
+                model,
+                default_model_name(model_name, target_variable, train_digest),
+                selected_features,
+                target_variable,
+                metrics=metrics,
+                data_digest=train_digest,
+                model_type=model_name,
+            )
+            save_reference(
+                DriftReference.from_data(X_train, selected_features), saved_dir.name
+            )
+            st.caption(f"Model saved to registry: `{saved_dir.name}`")
+
         # ----------------------------------------------------------
         # Store results
         # ----------------------------------------------------------
@@ -313,8 +295,15 @@ def render() -> None:
             "CV_mean_R2": round(float(np.mean(cv_scores)), 4),
             "Baseline_R2": round(baseline_metrics["r2"], 4),
             "Baseline_MAPE": round(baseline_metrics["mape"] * 100, 2),
+            "data_hash": train_digest,
         }
 
+        if log_to_mlflow:
+            try:
+                _log_run(result, metrics, baseline_metrics, cv_scores, cv_folds)
+            except Exception as exc:  # tracking is optional; keep the results
+                st.warning(f"MLflow logging failed: {exc}")
+
         # Avoid exact duplicates
         existing_keys = [
             (r["model"], r["features"], r["target"])
@@ -369,6 +358,18 @@ def render() -> None:
                 title=f"Actual vs Predicted - {model_name}",
                 opacity=0.7,
             )
+            # Conformal interval bands: one NaN-separated segment per point
+            finite = np.isfinite(y_lower) & np.isfinite(y_upper)
+            gap = np.full(int(finite.sum()), np.nan)
+            fig_pred.add_trace(
+                go.Scattergl(
+                    x=np.column_stack([y_test[finite], y_test[finite], gap]).ravel(),
+                    y=np.column_stack([y_lower[finite], y_upper[finite], gap]).ravel(),
+                    mode="lines",
+                    line=dict(color="rgba(31, 119, 180, 0.35)", width=2),
+                    name=f"{interval_level:.0%} CV+ interval",
+                )
+            )
             # Perfect prediction line
             axis_min = min(float(y_test.min()), float(y_pred.min()))
             axis_max = max(float(y_test.max()), float(y_pred.max()))
@@ -383,6 +384,12 @@ def render() -> None:
             )
             fig_pred.update_layout(showlegend=True)
             st.plotly_chart(fig_pred, use_container_width=True)
+            st.caption(
+                f"Empirical coverage on the test split: "
+                f"{interval_coverage(y_test, y_lower, y_upper):.0%} "
+                f"(target {interval_level:.0%})  |  "
+                f"Mean interval width = {np.mean(y_upper - y_lower):.4g}"
+            )
 
         # --- Residuals plot ---
         with tab_resid:
@@ -399,22 +406,66 @@ def render() -> None:
 
         # --- Feature importance (RF / GB only) ---
         with tab_imp:
-            if model_name in ("Random Forest", "Gradient Boosting"):
-                importances = model.feature_importances_
+            if model_name in TREE_MODELS:
+                impurity = store.feature_importances(store_key)
+                permutation = store.permutation_importances(store_key)
                 imp_df = pd.DataFrame(
-                    {"feature": selected_features, "importance": importances}
-                ).sort_values("importance", ascending=True)
+                    {
+                        "feature": selected_features * 2,
+                        "importance": (
+                            [impurity[f] for f in selected_features]
+                            + [permutation[f] for f in selected_features]
+                        ),
+                        "method": (
+                            ["Impurity"] * len(selected_features)
+                            + ["Permutation (test split)"] * len(selected_features)
+                        ),
+                    }
+                )
 
                 fig_imp = px.bar(
                     imp_df,
                     x="importance",
                     y="feature",
+                    color="method",
+                    barmode="group",
                     orientation="h",
                     title=f"Feature Importance - {model_name}",
                     labels={"importance": "Importance", "feature": "Feature"},
                 )
                 fig_imp.update_layout(yaxis=dict(categoryorder="total ascending"))
                 st.plotly_chart(fig_imp, use_container_width=True)
+
+                # Per-specimen attributions (cached in the model store)
+                phi, base_value = store.shap_values(store_key)
+                span = np.ptp(X_test, axis=0)
+                scaled = (X_test - X_test.min(axis=0)) / np.where(span > 0, span, 1.0)
+                shap_long = pd.DataFrame(
+                    {
+                        "feature": np.tile(selected_features, len(X_test)),
+                        "SHAP value": phi.ravel(),
+                        "Feature value (scaled)": scaled.ravel(),
+                    }
+                )
+                fig_shap = px.scatter(
+                    shap_long,
+                    x="SHAP value",
+                    y="feature",
+                    color="Feature value (scaled)",
+                    color_continuous_scale="RdBu_r",
+                    title=f"TreeSHAP attributions on the test split - {model_name}",
+                    labels={"feature": "Feature"},
+                )
+                fig_shap.add_vline(x=0, line_dash="dash", line_color="grey")
+                st.plotly_chart(fig_shap, use_container_width=True)
+
+                shap_table = pd.DataFrame(phi, columns=selected_features)
+                shap_table.insert(0, f"Predicted {target_variable}", y_pred)
+                st.dataframe(shap_table.round(4), use_container_width=True)
+                st.caption(
+                    f"Base value = {base_value:.4f}; base value + attributions = "
+                    f"prediction for each specimen."
+                )
             else:
                 st.info(
                     "Feature importance is available for **Random Forest** and "
@@ -430,7 +481,10 @@ def render() -> None:
                 cv_df,
                 y="R2",
                 points="all",
-                title=f"Cross-Validation R\u00b2 ({cv_folds}-fold) - {model_name}",
+                title=(
+                    f"Cross-Validation R\u00b2 ({cv_folds}-fold, training split) - "
+                    f"{model_name}"
+                ),
                 labels={"R2": "R\u00b2 Score"},
             )
             fig_cv.update_layout(showlegend=False)
@@ -444,12 +498,34 @@ def render() -> None:
     # ------------------------------------------------------------------
     # Model Comparison (always visible if results exist)
     # ------------------------------------------------------------------
-    if st.session_state["model_results"]:
-        st.divider()
+    st.divider()
+    source = st.radio(
+        "Compare",
+        ["This session", "Tracked MLflow runs"],
+        horizontal=True,
+        help=(
+            "Tracked runs are read from the local run index (results/run_index.sqlite): "
+            "the best run by R\u00b2 per model, feature set and target."
+        ),
+    )
+    if source == "This session":
+        results = st.session_state["model_results"]
+    else:
+        results = _tracked_results()
+        if not results:
+            st.info("No tracked runs yet. Enable **Log run to MLflow** when training.")
+
+    if results:
+        import plotly.express as px
+
         st.subheader("Model Comparison")
 
-        comp_df = pd.DataFrame(st.session_state["model_results"])
-        st.dataframe(comp_df, use_container_width=True, hide_index=True)
+        comp_df = pd.DataFrame(results)
+        st.dataframe(
+            comp_df.drop(columns=["data_hash"], errors="ignore"),
+            use_container_width=True,
+            hide_index=True,
+        )
 
         # --- Comparison bar charts ---
         comp_col1, comp_col2 = st.columns(2)
@@ -487,8 +563,9 @@ def render() -> None:
             st.plotly_chart(fig_mape, use_container_width=True)
 
         # --- Clear history button ---
-        if st.button("Clear comparison history"):
+        if source == "This session" and st.button("Clear comparison history"):
             st.session_state["model_results"] = []
+            store.clear()
             st.rerun()
 
     # ------------------------------------------------------------------
@@ -497,10 +574,17 @@ def render() -> None:
     st.divider()
     st.subheader("Hypotheses Status (RQ4)")
 
-    # Gather best results per hypothesis check
-    results = st.session_state["model_results"]
+    def top_features(result: dict) -> list[str] | None:
+        # Importances were computed at training time; look up the stored model
+        key = model_key(
+            result["model"], result["features"], result["target"], result["data_hash"]
+        )
+        if key not in store:
+            return None
+        return store.top_features(key, k=3, kind="permutation")
 
-    for hyp_id, hyp in _HYPOTHESES.items():
+    evaluated = evaluate_hypotheses(results, top_features) if results else {}
+    for hyp_id, hyp in HYPOTHESES.items():
         with st.expander(f"{hyp_id}: {hyp['description']}", expanded=True):
             st.caption(f"Criterion: {hyp['criterion']}")
 
@@ -508,116 +592,10 @@ def render() -> None:
                 st.warning("No models trained yet. Train a model to evaluate hypotheses.")
                 continue
 
-            if hyp_id == "H4a":
-                # MAPE < 15% AND R2 > 0.75 for tool_life
-                tool_life_results = [r for r in results if r["target"] == "tool_life"]
-                if not tool_life_results:
-                    st.warning("No models trained on tool_life target yet.")
-                else:
-                    best = min(tool_life_results, key=lambda r: r["MAPE"])
-                    passed = best["MAPE"] < 15.0 and best["R2"] > 0.75
-                    if passed:
-                        st.success(
-                            f"SUPPORTED -- Best model ({best['model']}): "
-                            f"MAPE = {best['MAPE']:.2f}%, R\u00b2 = {best['R2']:.4f}"
-                        )
-                    else:
-                        st.error(
-                            f"NOT SUPPORTED -- Best model ({best['model']}): "
-                            f"MAPE = {best['MAPE']:.2f}%, R\u00b2 = {best['R2']:.4f}"
-                        )
-
-            elif hyp_id == "H4b":
-                # > 10% relative MAPE improvement vs baseline
-                improvements = []
-                for r in results:
-                    if r["Baseline_MAPE"] > 0:
-                        rel_imp = (r["Baseline_MAPE"] - r["MAPE"]) / r["Baseline_MAPE"] * 100
-                        improvements.append((r, rel_imp))
-                if not improvements:
-                    st.warning("No baseline comparisons available.")
-                else:
-                    best_r, best_imp = max(improvements, key=lambda x: x[1])
-                    passed = best_imp > 10.0
-                    if passed:
-                        st.success(
-                            f"SUPPORTED -- Best improvement ({best_r['model']} on "
-                            f"{best_r['target']}): {best_imp:.1f}% MAPE reduction "
-                            f"vs baseline"
-                        )
-                    else:
-                        st.error(
-                            f"NOT SUPPORTED -- Best improvement ({best_r['model']} on "
-                            f"{best_r['target']}): {best_imp:.1f}% MAPE reduction "
-                            f"vs baseline (need > 10%)"
-                        )
-
-            elif hyp_id == "H4c":
-                # Non-linear model R2 > linear model R2
-                linear_results = [
-                    r for r in results if r["model"] in ("Linear Regression", "SVR")
-                ]
-                nonlinear_results = [
-                    r for r in results
-                    if r["model"] in ("Random Forest", "Gradient Boosting")
-                ]
-                if not linear_results or not nonlinear_results:
-                    st.warning(
-                        "Need at least one linear model (Linear Regression/SVR) and "
-                        "one non-linear model (Random Forest/Gradient Boosting) "
-                        "trained on the same target to evaluate."
-                    )
-                else:
-                    best_linear = max(linear_results, key=lambda r: r["R2"])
-                    best_nonlinear = max(nonlinear_results, key=lambda r: r["R2"])
-                    passed = best_nonlinear["R2"] > best_linear["R2"]
-                    if passed:
-                        st.success(
-                            f"SUPPORTED -- {best_nonlinear['model']} "
-                            f"(R\u00b2 = {best_nonlinear['R2']:.4f}) > "
-                            f"{best_linear['model']} "
-                            f"(R\u00b2 = {best_linear['R2']:.4f})"
-                        )
-                    else:
-                        st.error(
-                            f"NOT SUPPORTED -- {best_nonlinear['model']} "
-                            f"(R\u00b2 = {best_nonlinear['R2']:.4f}) <= "
-                            f"{best_linear['model']} "
-                            f"(R\u00b2 = {best_linear['R2']:.4f})"
-                        )
-
-            elif hyp_id == "H4d":
-                # Conductivity in top-3 features by importance
-                tree_results = [
-                    r for r in results
-                    if r["model"] in ("Random Forest", "Gradient Boosting")
-                    and "conductivity" in r["features"]
-                ]
-                if not tree_results:
-                    st.warning(
-                        "Need a Random Forest or Gradient Boosting model trained "
-                        "with conductivity in the feature set to evaluate."
-                    )
-                else:
-                    # Re-train the best tree model to extract importance
-                    best_tree = max(tree_results, key=lambda r: r["R2"])
-                    feats = [f.strip() for f in best_tree["features"].split(",")]
-                    df_synth = _generate_synthetic_data()
-                    X_all = df_synth[feats].values
-                    y_all = df_synth[best_tree["target"]].values
-                    temp_model = _make_model(best_tree["model"])
-                    temp_model.fit(X_all, y_all)
-                    imp_order = np.argsort(temp_model.feature_importances_)[::-1]
-                    top3_features = [feats[i] for i in imp_order[:3]]
-                    passed = "conductivity" in top3_features
-                    if passed:
-                        st.success(
-                            f"SUPPORTED -- Top-3 features for "
-                            f"{best_tree['model']}: {top3_features}"
-                        )
-                    else:
-                        st.error(
-                            f"NOT SUPPORTED -- Top-3 features for "
-                            f"{best_tree['model']}: {top3_features} "
-                            f"(conductivity not in top 3)"
-                        )
+            outcome = evaluated[hyp_id]
+            if outcome.passed is None:
+                st.warning(outcome.message)
+            elif outcome.status == SUPPORTED:
+                st.success(f"SUPPORTED -- {outcome.message}")
+            else:
+                st.error(f"NOT SUPPORTED -- {outcome.message}")
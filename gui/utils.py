@@ -12,6 +12,10 @@ from pathlib import Path
 import pandas as pd
 import streamlit as st
 
+from src.machinability.analysis import evidence
+from src.machinability.data import loader
+from src.machinability.utils.instrument import REGISTRY
+
 # ---------------------------------------------------------------------------
 # Path constants
 # ---------------------------------------------------------------------------
@@ -68,8 +72,7 @@ def load_evidence_matrix() -> pd.DataFrame:
             "machining_process", "tool", "cutting_params",
             "machinability_metric", "key_findings", "tags", "link_or_doi",
         ])
-    df = pd.read_csv(EVIDENCE_MATRIX_PATH)
-    return df
+    return loader.load_evidence_matrix(EVIDENCE_MATRIX_PATH)
 
 
 def count_literature_notes() -> int:
@@ -99,45 +102,28 @@ def get_unique_papers(df: pd.DataFrame | None = None) -> int:
     """Return the number of unique paper IDs in the evidence matrix."""
     if df is None:
         df = load_evidence_matrix()
-    if df.empty:
-        return 0
-    return df["paper_id"].nunique()
+    return evidence.unique_papers(df)
 
 
 def get_unique_steel_grades(df: pd.DataFrame | None = None) -> list[str]:
     """Return sorted list of unique steel grades present in the matrix."""
     if df is None:
         df = load_evidence_matrix()
-    if df.empty or "steel_grade" not in df.columns:
-        return []
-    grades = df["steel_grade"].dropna().unique().tolist()
-    return sorted(grades)
+    return evidence.steel_grades(df)
 
 
 def get_pillar_counts(df: pd.DataFrame | None = None) -> dict[str, int]:
     """Count evidence-matrix rows tagged with each research pillar."""
     if df is None:
         df = load_evidence_matrix()
-    counts: dict[str, int] = {}
-    if df.empty or "tags" not in df.columns:
-        return {p: 0 for p in PILLAR_LABELS}
-    for pillar in PILLAR_LABELS:
-        counts[pillar] = int(
-            df["tags"].fillna("").str.contains(pillar, case=False).sum()
-        )
-    return counts
+    return evidence.pillar_counts(df, PILLAR_LABELS)
 
 
 def get_year_range(df: pd.DataFrame | None = None) -> tuple[int, int] | None:
     """Return (min_year, max_year) from the evidence matrix."""
     if df is None:
         df = load_evidence_matrix()
-    if df.empty or "year" not in df.columns:
-        return None
-    years = pd.to_numeric(df["year"], errors="coerce").dropna()
-    if years.empty:
-        return None
-    return int(years.min()), int(years.max())
+    return evidence.year_range(df)
 
 
 def get_project_stats() -> dict:
@@ -247,6 +233,47 @@ def styled_metric_card(label: str, value, description: str = "") -> str:
     """
 
 
+def render_diagnostics(since: int) -> None:
+    """Sidebar panel with the instrumented stage timings of this rerun.
+
+    ``since`` is ``REGISTRY.mark()`` taken at the start of the rerun; only
+    records from the current session's script thread are shown in start
+    order, nested stages indented under their parent. The total counts only
+    outermost stages, so nested time is not added twice. Cumulative metrics
+    for the process can be downloaded as JSON or Prometheus text.
+    """
+    import threading
+
+    records = REGISTRY.records(since=since, thread=threading.get_ident())
+    records.sort(key=lambda r: r.start)  # parents are recorded after their children
+    with st.sidebar.expander(f"Diagnostics ({len(records)} stages)", expanded=False):
+        if records:
+            table = pd.DataFrame(
+                {
+                    "stage": ["\u2003" * r.depth + r.name for r in records],
+                    "wall ms": [r.wall_s * 1e3 for r in records],
+                    "cpu ms": [r.cpu_s * 1e3 for r in records],
+                    "rows": [r.rows for r in records],
+                    "alloc MB": [
+                        None if r.alloc_peak_bytes is None else r.alloc_peak_bytes / 2**20
+                        for r in records
+                    ],
+                }
+            )
+            st.dataframe(table.round(2), hide_index=True, use_container_width=True)
+            total_ms = sum(r.wall_s for r in records if r.depth == 0) * 1e3
+            st.caption(f"Total instrumented wall time: {total_ms:.1f} ms")
+        else:
+            st.caption("No instrumented stages ran in this rerun.")
+        col_json, col_prom = st.columns(2)
+        col_json.download_button(
+            "JSON", REGISTRY.to_json(), "metrics.json", "application/json"
+        )
+        col_prom.download_button(
+            "Prometheus", REGISTRY.to_prometheus(), "metrics.prom", "text/plain"
+        )
+
+
 def apply_custom_css() -> None:
     """Inject lightweight custom CSS into the Streamlit app."""
     st.markdown(
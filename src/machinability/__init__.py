@@ -1,3 +1,10 @@
 """Machinability prediction from electrical conductivity measurements."""
 
+from src.machinability._lazy import attach
+
 __version__ = "0.1.0"
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["analysis", "cli", "data", "models", "pipeline", "utils", "visualization"],
+)
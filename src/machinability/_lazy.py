@@ -0,0 +1,55 @@
+"""Lazy submodule and attribute access for package ``__init__`` modules.
+
+Used by the package ``__init__``s so that ``import src.machinability.models``
+is cheap: submodules (and the public names they define) are imported on
+first attribute access (PEP 562) rather than at package import time.
+
+Usage, in a package ``__init__``::
+
+    from src.machinability._lazy import attach
+
+    __getattr__, __dir__, __all__ = attach(
+        __name__,
+        submodules=["factory"],
+        attributes={"factory": ["make_model"]},
+    )
+"""
+
+import importlib
+import sys
+
+
+def attach(package: str, submodules=(), attributes: dict | None = None):
+    """Build ``__getattr__``, ``__dir__`` and ``__all__`` for a package.
+
+    Parameters
+    ----------
+    package : str
+        The package's ``__name__``.
+    submodules : iterable of str
+        Submodules exposed as attributes.
+    attributes : dict, optional
+        ``{submodule: [name, ...]}`` of names re-exported from submodules.
+
+    Returns
+    -------
+    tuple
+        ``(__getattr__, __dir__, __all__)``.
+    """
+    submodules = set(submodules)
+    origin = {name: module for module, names in (attributes or {}).items() for name in names}
+    names = sorted(submodules | set(origin))
+
+    def __getattr__(name: str):
+        if name in submodules:
+            return importlib.import_module(f"{package}.{name}")
+        if name in origin:
+            value = getattr(importlib.import_module(f"{package}.{origin[name]}"), name)
+            setattr(sys.modules[package], name, value)  # later lookups skip __getattr__
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__():
+        return names
+
+    return __getattr__, __dir__, names
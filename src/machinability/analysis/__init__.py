@@ -1 +1,13 @@
 """Statistical analysis and correlation studies."""
+
+from src.machinability._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["correlation", "evidence", "power"],
+    attributes={
+        "correlation": ["correlation_matrix", "pearson_correlation", "spearman_correlation"],
+        "evidence": ["evidence_summary"],
+        "power": ["power_curve", "required_sample_size"],
+    },
+)
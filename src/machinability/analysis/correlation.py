@@ -1,9 +1,12 @@
 """Correlation analysis between conductivity and machinability indicators (RQ1)."""
 
 import pandas as pd
-from scipy import stats
 
+from src.machinability.utils.cache import memoize
+from src.machinability.utils.instrument import timed
 
+
+@timed
 def pearson_correlation(x: pd.Series, y: pd.Series) -> dict:
     """Compute Pearson correlation with p-value.
 
@@ -17,12 +20,15 @@ def pearson_correlation(x: pd.Series, y: pd.Series) -> dict:
     dict
         Keys: r, p_value, n
     """
+    from scipy import stats
+
     mask = x.notna() & y.notna()
     x_clean, y_clean = x[mask], y[mask]
     r, p = stats.pearsonr(x_clean, y_clean)
     return {"r": r, "p_value": p, "n": len(x_clean)}
 
 
+@timed
 def spearman_correlation(x: pd.Series, y: pd.Series) -> dict:
     """Compute Spearman rank correlation with p-value.
 
@@ -36,12 +42,16 @@ def spearman_correlation(x: pd.Series, y: pd.Series) -> dict:
     dict
         Keys: rho, p_value, n
     """
+    from scipy import stats
+
     mask = x.notna() & y.notna()
     x_clean, y_clean = x[mask], y[mask]
     rho, p = stats.spearmanr(x_clean, y_clean)
     return {"rho": rho, "p_value": p, "n": len(x_clean)}
 
 
+@timed(rows="df")
+@memoize
 def correlation_matrix(df: pd.DataFrame, columns: list[str] | None = None) -> pd.DataFrame:
     """Compute pairwise Pearson correlation matrix for selected numeric columns.
 
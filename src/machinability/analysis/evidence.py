@@ -0,0 +1,84 @@
+"""Summary statistics of the literature evidence matrix.
+
+Pure-pandas versions of the dashboard's evidence-matrix figures, shared by
+the home page, the evidence-matrix page and ``machinability evidence``.
+"""
+
+import pandas as pd
+
+PILLARS = ("pillar_A", "pillar_B", "pillar_C", "pillar_D")
+
+
+def unique_papers(df: pd.DataFrame) -> int:
+    """Number of distinct paper IDs."""
+    if df.empty or "paper_id" not in df.columns:
+        return 0
+    return int(df["paper_id"].nunique())
+
+
+def steel_grades(df: pd.DataFrame) -> list[str]:
+    """Sorted distinct steel grades."""
+    if df.empty or "steel_grade" not in df.columns:
+        return []
+    return sorted(df["steel_grade"].dropna().unique().tolist())
+
+
+def pillar_counts(df: pd.DataFrame, pillars=PILLARS) -> dict[str, int]:
+    """Rows tagged with each research pillar."""
+    if df.empty or "tags" not in df.columns:
+        return {p: 0 for p in pillars}
+    tags = df["tags"].fillna("")
+    return {p: int(tags.str.contains(p, case=False).sum()) for p in pillars}
+
+
+def year_range(df: pd.DataFrame) -> tuple[int, int] | None:
+    """(earliest, latest) publication year, or ``None`` without years."""
+    if df.empty or "year" not in df.columns:
+        return None
+    years = pd.to_numeric(df["year"], errors="coerce").dropna()
+    if years.empty:
+        return None
+    return int(years.min()), int(years.max())
+
+
+def presence(df: pd.DataFrame) -> pd.DataFrame:
+    """Boolean frame: True where a cell holds a non-blank value."""
+    return df.notna() & (df.astype(str).apply(lambda s: s.str.strip()) != "")
+
+
+def missing_summary(df: pd.DataFrame) -> pd.DataFrame:
+    """Blank or missing cells per column, most incomplete first.
+
+    Returns
+    -------
+    pd.DataFrame
+        Indexed by column with ``missing_count`` and ``missing_pct``.
+    """
+    missing = len(df) - presence(df).sum()
+    pct = (missing / len(df) * 100).round(1) if len(df) else missing.astype(float)
+    return pd.DataFrame({"missing_count": missing, "missing_pct": pct}).sort_values(
+        "missing_pct", ascending=False
+    )
+
+
+def rows_per(df: pd.DataFrame, column: str) -> pd.Series:
+    """Row counts per value of *column* (blanks as ``"(blank)"``), ascending."""
+    if column not in df.columns:
+        return pd.Series(dtype=int)
+    values = df[column].fillna("(blank)").astype(str).str.strip().replace("", "(blank)")
+    return values.value_counts().sort_values()
+
+
+def evidence_summary(df: pd.DataFrame) -> dict:
+    """All evidence-matrix statistics as JSON-serialisable types."""
+    years = year_range(df)
+    return {
+        "rows": len(df),
+        "unique_papers": unique_papers(df),
+        "steel_grades": steel_grades(df),
+        "pillar_counts": pillar_counts(df),
+        "year_range": list(years) if years else None,
+        "rows_per_steel_grade": rows_per(df, "steel_grade").to_dict(),
+        "rows_per_conductivity_method": rows_per(df, "conductivity_method").to_dict(),
+        "missing_pct": missing_summary(df)["missing_pct"].to_dict(),
+    }
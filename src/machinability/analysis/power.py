@@ -0,0 +1,329 @@
+"""Monte Carlo power analysis for the hypothesis table (04_MODELS/hypotheses.md).
+
+Every test simulates all datasets of one sample size at once as an array
+of shape ``(n_effects, n_sims, ..., n)`` and evaluates its test statistic
+along the last axes with NumPy reductions; SciPy is only called once per
+sample size for the critical value. Power for 5 effect sizes x 2000
+datasets x 10 sample sizes therefore takes well under a second for the
+correlation tests.
+
+The functions return power as an ``(n_effects, n_sizes)`` array;
+:func:`power_curve` wraps them in a tidy table per hypothesis and
+:func:`required_sample_size` reads off the smallest n reaching a target
+power (conventionally 0.80).
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+_ALTERNATIVES = ("two-sided", "greater", "less")
+
+
+def _rng(seed) -> np.random.Generator:
+    return seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+
+
+def _correlation(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Pearson r along the last axis."""
+    xc = x - x.mean(axis=-1, keepdims=True)
+    yc = y - y.mean(axis=-1, keepdims=True)
+    return (xc * yc).sum(axis=-1) / np.sqrt((xc**2).sum(axis=-1) * (yc**2).sum(axis=-1))
+
+
+def _correlated_pairs(rho: np.ndarray, shape: tuple, rng: np.random.Generator):
+    x = rng.standard_normal(shape)
+    noise = rng.standard_normal(shape)
+    rho = rho.reshape(rho.shape + (1,) * (len(shape) - rho.ndim))
+    return x, rho * x + np.sqrt(1 - rho**2) * noise
+
+
+def _t_reject(t: np.ndarray, df: int, alpha: float, alternative: str) -> np.ndarray:
+    if alternative not in _ALTERNATIVES:
+        raise ValueError(f"alternative must be one of {_ALTERNATIVES}")
+    if alternative == "two-sided":
+        return np.abs(t) > stats.t.ppf(1 - alpha / 2, df)
+    crit = stats.t.ppf(1 - alpha, df)
+    return t > crit if alternative == "greater" else t < -crit
+
+
+def pearson_power(
+    effects,
+    sizes,
+    alpha: float = 0.05,
+    alternative: str = "two-sided",
+    n_sims: int = 2000,
+    seed=None,
+) -> np.ndarray:
+    """Power of the Pearson correlation t-test (H1a-c).
+
+    Parameters
+    ----------
+    effects : array-like of float
+        True correlations ρ.
+    sizes : array-like of int
+        Numbers of paired observations n.
+    alpha : float
+        Significance level.
+    alternative : {"two-sided", "greater", "less"}
+        Alternative hypothesis (H1c is one-tailed, ρ < 0).
+    n_sims : int
+        Simulated datasets per (effect, n).
+    seed : int or Generator, optional
+
+    Returns
+    -------
+    np.ndarray of shape (n_effects, n_sizes)
+    """
+    rng = _rng(seed)
+    rho = np.asarray(effects, dtype=float)
+    power = np.empty((len(rho), len(sizes)))
+    for j, n in enumerate(sizes):
+        x, y = _correlated_pairs(rho, (len(rho), n_sims, n), rng)
+        r = np.clip(_correlation(x, y), -1 + 1e-12, 1 - 1e-12)
+        t = r * np.sqrt((n - 2) / (1 - r**2))
+        power[:, j] = _t_reject(t, n - 2, alpha, alternative).mean(axis=1)
+    return power
+
+
+def fisher_z_power(
+    effects, sizes, alpha: float = 0.05, n_sims: int = 2000, seed=None
+) -> np.ndarray:
+    """Power of the Fisher z heterogeneity test across groups (H1d).
+
+    Tests H₀: ρ₁ = … = ρ_k with Q = Σ (nᵢ − 3)(zᵢ − z̄)² ~ χ²(k − 1).
+
+    Parameters
+    ----------
+    effects : array-like of shape (n_effects, k)
+        True correlation in each of the k groups (e.g. steel grades).
+    sizes : array-like of int
+        Observations per group.
+    """
+    rng = _rng(seed)
+    rho = np.atleast_2d(np.asarray(effects, dtype=float))
+    n_groups = rho.shape[1]
+    crit = stats.chi2.ppf(1 - alpha, n_groups - 1)
+    power = np.empty((len(rho), len(sizes)))
+    for j, n in enumerate(sizes):
+        x, y = _correlated_pairs(rho[:, None, :], (len(rho), n_sims, n_groups, n), rng)
+        z = np.arctanh(np.clip(_correlation(x, y), -1 + 1e-12, 1 - 1e-12))
+        q = (n - 3) * ((z - z.mean(axis=-1, keepdims=True)) ** 2).sum(axis=-1)
+        power[:, j] = (q > crit).mean(axis=1)
+    return power
+
+
+def _pillai_trace(Y: np.ndarray) -> np.ndarray:
+    """Pillai's trace for one-way MANOVA; ``Y`` has shape (..., groups, n, p)."""
+    group_means = Y.mean(axis=-2)
+    grand = group_means.mean(axis=-2, keepdims=True)
+    n = Y.shape[-2]
+    dev = group_means - grand
+    H = n * np.einsum("...gi,...gj->...ij", dev, dev)
+    resid = Y - group_means[..., None, :]
+    E = np.einsum("...gni,...gnj->...ij", resid, resid)
+    return np.trace(np.linalg.solve(H + E, H), axis1=-2, axis2=-1)
+
+
+def manova_power(
+    effects,
+    sizes,
+    n_groups: int = 3,
+    n_responses: int = 2,
+    response_corr: float = 0.5,
+    alpha: float = 0.05,
+    n_sims: int = 1000,
+    seed=None,
+) -> np.ndarray:
+    """Power of one-way MANOVA (Pillai's trace) for heat-treatment clusters (H2c).
+
+    Parameters
+    ----------
+    effects : array-like of float
+        Standardised separation d between adjacent group means on every
+        response (group j is shifted by ``(j - (g - 1) / 2) * d``).
+    sizes : array-like of int
+        Specimens per group.
+    n_groups, n_responses : int
+        Number of groups (heat treatments) and responses (e.g.
+        conductivity and machinability).
+    response_corr : float
+        Within-group correlation between responses.
+    """
+    rng = _rng(seed)
+    d = np.asarray(effects, dtype=float)
+    g, p = n_groups, n_responses
+    cov = np.full((p, p), response_corr) + (1 - response_corr) * np.eye(p)
+    chol = np.linalg.cholesky(cov)
+    offsets = np.arange(g) - (g - 1) / 2
+    s = min(p, g - 1)
+    m = (abs(p - (g - 1)) - 1) / 2
+    power = np.empty((len(d), len(sizes)))
+    for j, n in enumerate(sizes):
+        Y = rng.standard_normal((len(d), n_sims, g, n, p)) @ chol.T
+        Y += (d[:, None] * offsets[None, :])[:, None, :, None, None]
+        V = _pillai_trace(Y)
+        nn = (g * n - g - p - 1) / 2
+        df1, df2 = s * (2 * m + s + 1), s * (2 * nn + s + 1)
+        F = (df2 / df1) * V / (s - V)
+        power[:, j] = (F > stats.f.ppf(1 - alpha, df1, df2)).mean(axis=1)
+    return power
+
+
+def sobel_power(
+    effects, sizes, direct: float = 0.0, alpha: float = 0.05, n_sims: int = 2000, seed=None
+) -> np.ndarray:
+    """Power of the Sobel test for a single mediator (H2b).
+
+    Model: ``M = a·X + e₁``, ``Y = b·M + c'·X + e₂`` with standard normal
+    X and errors.
+
+    Parameters
+    ----------
+    effects : array-like of shape (n_effects, 2)
+        Path coefficients ``(a, b)``.
+    sizes : array-like of int
+        Numbers of specimens.
+    direct : float
+        Direct effect c'.
+    """
+    rng = _rng(seed)
+    ab = np.atleast_2d(np.asarray(effects, dtype=float))
+    a, b = ab[:, 0, None, None], ab[:, 1, None, None]
+    crit = stats.norm.ppf(1 - alpha / 2)
+    power = np.empty((len(ab), len(sizes)))
+    for j, n in enumerate(sizes):
+        shape = (len(ab), n_sims, n)
+        X = rng.standard_normal(shape)
+        M = a * X + rng.standard_normal(shape)
+        Y = b * M + direct * X + rng.standard_normal(shape)
+        X, M, Y = (v - v.mean(axis=-1, keepdims=True) for v in (X, M, Y))
+        sxx, smm, syy = (X * X).sum(-1), (M * M).sum(-1), (Y * Y).sum(-1)
+        sxm, sxy, smy = (X * M).sum(-1), (X * Y).sum(-1), (M * Y).sum(-1)
+
+        a_hat = sxm / sxx
+        se_a = np.sqrt((smm - a_hat * sxm) / (n - 2) / sxx)
+        det = smm * sxx - sxm**2
+        b_hat = (sxx * smy - sxm * sxy) / det
+        c_hat = (smm * sxy - sxm * smy) / det
+        s2 = (syy - b_hat * smy - c_hat * sxy) / (n - 3)
+        se_b = np.sqrt(s2 * sxx / det)
+
+        z = a_hat * b_hat / np.sqrt(b_hat**2 * se_a**2 + a_hat**2 * se_b**2)
+        power[:, j] = (np.abs(z) > crit).mean(axis=1)
+    return power
+
+
+def bland_altman_power(
+    effects, sizes, alpha: float = 0.05, n_sims: int = 2000, seed=None
+) -> np.ndarray:
+    """Power to detect a systematic bias between two methods (H3a).
+
+    Paired t-test on the method differences underlying the Bland-Altman
+    bias estimate.
+
+    Parameters
+    ----------
+    effects : array-like of float
+        Bias in units of the SD of the differences.
+    sizes : array-like of int
+        Specimens measured with both methods.
+    """
+    rng = _rng(seed)
+    bias = np.asarray(effects, dtype=float)
+    power = np.empty((len(bias), len(sizes)))
+    for j, n in enumerate(sizes):
+        diff = bias[:, None, None] + rng.standard_normal((len(bias), n_sims, n))
+        t = diff.mean(axis=-1) / (diff.std(axis=-1, ddof=1) / np.sqrt(n))
+        power[:, j] = _t_reject(t, n - 1, alpha, "two-sided").mean(axis=1)
+    return power
+
+
+# Hypotheses with a simulated power model: test, effect sizes to scan and
+# the required n stated in 04_MODELS/hypotheses.md (per group where the
+# test is per group).
+POWER_DESIGNS = {
+    "H1a-b": {
+        "test": pearson_power,
+        "effects": [0.5, 0.6, 0.7, 0.8],
+        "required_n": 15,
+        "kwargs": {},
+    },
+    "H1c": {
+        "test": pearson_power,
+        "effects": [-0.5, -0.6, -0.7, -0.8],
+        "required_n": 15,
+        "kwargs": {"alternative": "less"},
+    },
+    "H1d": {
+        "test": fisher_z_power,
+        "effects": [(0.7, 0.7, 0.5), (0.7, 0.7, 0.3), (0.8, 0.6, 0.2)],
+        "required_n": 10,
+        "kwargs": {},
+    },
+    "H2b": {
+        "test": sobel_power,
+        "effects": [(0.3, 0.3), (0.5, 0.5), (0.7, 0.7)],
+        "required_n": 50,
+        "kwargs": {},
+    },
+    "H2c": {
+        "test": manova_power,
+        "effects": [0.5, 0.8, 1.2],
+        "required_n": 10,
+        "kwargs": {},
+    },
+    "H3a": {
+        "test": bland_altman_power,
+        "effects": [0.3, 0.5, 0.8],
+        "required_n": 30,
+        "kwargs": {},
+    },
+}
+
+
+def power_curve(
+    hypothesis: str,
+    sizes=range(5, 101, 5),
+    effects=None,
+    alpha: float = 0.05,
+    n_sims: int = 2000,
+    seed: int | None = 42,
+) -> pd.DataFrame:
+    """Simulated power per effect size and n for one entry of :data:`POWER_DESIGNS`.
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns: hypothesis, effect, n, power.
+    """
+    spec = POWER_DESIGNS[hypothesis]
+    effects = list(spec["effects"] if effects is None else effects)
+    sizes = [int(n) for n in sizes]
+    power = spec["test"](effects, sizes, alpha=alpha, n_sims=n_sims, seed=seed, **spec["kwargs"])
+    return pd.DataFrame(
+        [
+            {"hypothesis": hypothesis, "effect": str(effect), "n": n, "power": power[i, j]}
+            for i, effect in enumerate(effects)
+            for j, n in enumerate(sizes)
+        ]
+    )
+
+
+def required_sample_size(curve: pd.DataFrame, target: float = 0.8) -> pd.DataFrame:
+    """Smallest simulated n reaching *target* power per (hypothesis, effect).
+
+    ``n`` is NaN when no simulated size reaches the target.
+    """
+    rows = []
+    for (hyp, effect), group in curve.groupby(["hypothesis", "effect"], sort=False):
+        reached = group.loc[group["power"] >= target, "n"]
+        rows.append(
+            {
+                "hypothesis": hyp,
+                "effect": effect,
+                "n": reached.min() if len(reached) else np.nan,
+                "stated_n": POWER_DESIGNS.get(hyp, {}).get("required_n"),
+            }
+        )
+    return pd.DataFrame(rows)
@@ -0,0 +1,425 @@
+"""Headless ``machinability`` command for the dashboard computations.
+
+Every subcommand calls the same package functions as the Streamlit pages
+and writes Parquet/JSON files under ``--out`` (default ``results/cli``),
+so results can be produced on a compute box, e.g. from cron::
+
+    machinability correlate --jobs 4
+    machinability train --models "Random Forest" "Linear Regression" --jobs 8
+    machinability hypotheses            # reads results.json written by train
+    machinability evidence
+    machinability pipeline --jobs 4 --dry-run
+
+Neither streamlit nor plotly is imported (directly or through the modules
+used here); ``--jobs`` sets the number of worker processes for the
+independent tasks of a command (``-1`` for all cores) and ``--metrics
+FILE`` writes the instrumented stage timings of the command (see
+:mod:`src.machinability.utils.instrument`). With ``MACHINABILITY_PROFILE=1``
+the command is profiled into ``results/profiles`` (see
+:mod:`src.machinability.utils.profiling`).
+
+Outputs
+-------
+correlate   correlation_matrix.parquet, correlation_screen.parquet, correlation.json
+train       metrics.parquet, results.json (rows as in the models page table; each
+            model is fitted on all targets at once with a shared split)
+hypotheses  hypotheses.json
+evidence    evidence.json, evidence_missing.parquet
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.machinability.utils.config import RESULTS_DIR
+from src.machinability.utils.instrument import REGISTRY, MetricsRegistry, stage
+from src.machinability.utils.profiling import maybe_profile
+
+CLI_RESULTS_DIR = RESULTS_DIR / "cli"
+
+DEFAULT_FEATURES = ["conductivity", "hardness"]
+DEFAULT_TARGETS = ["tool_life", "Ra", "Fc"]
+
+
+# ---------------------------------------------------------------------------
+# I/O helpers
+# ---------------------------------------------------------------------------
+
+
+def _json_default(obj):
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serialisable")
+
+
+def write_json(obj, path: Path) -> Path:
+    """Write *obj* as indented JSON (numpy scalars and arrays allowed)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(obj, indent=2, default=_json_default) + "\n")
+    return path
+
+
+def write_parquet(df: pd.DataFrame, path: Path) -> Path:
+    """Write *df* to Parquet, creating the parent directory."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(path, index=False)
+    return path
+
+
+def load_data(source: str = "synthetic", n: int = 200, seed: int = 42) -> pd.DataFrame:
+    """Specimen table: ``"synthetic"`` or a CSV/Parquet path."""
+    if source == "synthetic":
+        from src.machinability.data.synthetic import generate_specimens
+
+        return generate_specimens(n, seed=seed)
+    path = Path(source)
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+# ---------------------------------------------------------------------------
+# correlate
+# ---------------------------------------------------------------------------
+
+
+def _screen_group(df: pd.DataFrame, grade: str, x: str, targets: list[str]) -> list[dict]:
+    from src.machinability.analysis.correlation import pearson_correlation, spearman_correlation
+
+    rows = []
+    for target in targets:
+        pearson = pearson_correlation(df[x], df[target])
+        spearman = spearman_correlation(df[x], df[target])
+        rows.append(
+            {
+                "steel_grade": grade,
+                "x": x,
+                "target": target,
+                "n": pearson["n"],
+                "pearson_r": float(pearson["r"]),
+                "pearson_p": float(pearson["p_value"]),
+                "spearman_rho": float(spearman["rho"]),
+                "spearman_p": float(spearman["p_value"]),
+            }
+        )
+    return rows
+
+
+def correlation_screen(
+    df: pd.DataFrame,
+    x: str = "conductivity",
+    targets: list[str] | None = None,
+    jobs: int = 1,
+) -> pd.DataFrame:
+    """Pearson and Spearman correlation of *x* with each target, per grade.
+
+    The pooled data are reported as grade ``"all"``; grades with fewer than
+    three complete rows are skipped.
+    """
+    from joblib import Parallel, delayed
+
+    targets = [t for t in (targets or DEFAULT_TARGETS) if t in df.columns]
+    groups = [("all", df)]
+    if "steel_grade" in df.columns:
+        groups += [(str(grade), sub) for grade, sub in df.groupby("steel_grade", sort=True)]
+    groups = [(grade, sub) for grade, sub in groups if len(sub.dropna(subset=[x])) >= 3]
+    results = Parallel(n_jobs=jobs)(
+        delayed(_screen_group)(sub, grade, x, targets) for grade, sub in groups
+    )
+    return pd.DataFrame([row for rows in results for row in rows])
+
+
+def run_correlate(args) -> dict:
+    from src.machinability.analysis.correlation import correlation_matrix
+
+    df = load_data(args.data, args.n, args.seed)
+    matrix = correlation_matrix(df, args.columns)
+    screen = correlation_screen(df, args.x, args.targets, jobs=args.jobs)
+
+    write_parquet(
+        matrix.rename_axis("variable").reset_index(), args.out / "correlation_matrix.parquet"
+    )
+    write_parquet(screen, args.out / "correlation_screen.parquet")
+    write_json(
+        {
+            "rows": len(df),
+            "matrix": matrix.to_dict(),
+            "screen": screen.to_dict(orient="records"),
+        },
+        args.out / "correlation.json",
+    )
+    return {"rows": len(df), "pairs": len(screen)}
+
+
+# ---------------------------------------------------------------------------
+# train
+# ---------------------------------------------------------------------------
+
+
+def train_targets(
+    df: pd.DataFrame,
+    model_name: str,
+    features: list[str],
+    targets: list[str],
+    test_size: float = 0.2,
+    cv_folds: int = 5,
+    random_state: int = 42,
+) -> list[dict]:
+    """Train and evaluate one model on all *targets* jointly.
+
+    Uses :func:`~src.machinability.models.multi_target.train_multi_target`:
+    one shared train/test split and k-fold CV, and a single fit for models
+    with native multi-output support. Rows missing a feature, a target or
+    hardness are dropped.
+
+    Returns
+    -------
+    list of dict
+        One comparison-table row per target (``model``, ``features``,
+        ``target``, ``R2``, ``MAPE`` in percent, ``RMSE``, ``CV_mean_R2``,
+        ``Baseline_R2``, ``Baseline_MAPE``, ``data_hash``) plus
+        ``top_features`` ranked by permutation importance on the test split.
+    """
+    from sklearn.model_selection import train_test_split
+
+    from src.machinability.models.baseline import HardnessOnlyBaseline, evaluate_model
+    from src.machinability.models.multi_target import train_multi_target
+    from src.machinability.models.store import ModelStore, data_hash
+
+    df = df.dropna(subset=[*features, *targets, "hardness"])
+    result = train_multi_target(
+        df,
+        features,
+        targets,
+        model=model_name,
+        test_size=test_size,
+        cv_folds=cv_folds,
+        random_state=random_state,
+    )
+    # Same rows and seed as the shared split above
+    hard_train, hard_test = train_test_split(
+        df[["hardness"]].to_numpy(dtype=float), test_size=test_size, random_state=random_state
+    )
+    baseline = HardnessOnlyBaseline().fit(hard_train, result["Y_train"])
+    baseline_metrics = evaluate_model(result["Y_test"], baseline.predict(hard_test))
+
+    store = ModelStore()
+    rows = []
+    for k, target in enumerate(targets):
+        metrics = result["metrics"].loc[target]
+        digest = data_hash(result["X_train"], result["Y_train"][:, k])
+        key = store.put(
+            model_name,
+            features,
+            target,
+            digest,
+            result["estimator"].target(k),
+            X_test=result["X_test"],
+            y_test=result["Y_test"][:, k],
+        )
+        store.permutation_importances(key, n_jobs=1)
+        rows.append(
+            {
+                "model": model_name,
+                "features": ", ".join(features),
+                "target": target,
+                "R2": round(float(metrics["r2"]), 4),
+                "MAPE": round(float(metrics["mape"]) * 100, 2),
+                "RMSE": round(float(metrics["rmse"]), 4),
+                "CV_mean_R2": round(float(result["cv_r2"][target].mean()), 4),
+                "Baseline_R2": round(float(baseline_metrics["r2"][k]), 4),
+                "Baseline_MAPE": round(float(baseline_metrics["mape"][k]) * 100, 2),
+                "data_hash": digest,
+                "top_features": store.top_features(key, k=3),
+            }
+        )
+    return rows
+
+
+def run_train(args) -> dict:
+    from joblib import Parallel, delayed
+
+    from src.machinability.models.factory import MODEL_MAP
+
+    df = load_data(args.data, args.n, args.seed)
+    models = args.models or list(MODEL_MAP)
+    targets = [t for t in args.targets if t in df.columns]
+    per_model = Parallel(n_jobs=args.jobs)(
+        delayed(train_targets)(
+            df,
+            model,
+            args.features,
+            targets,
+            test_size=args.test_size,
+            cv_folds=args.cv,
+            random_state=args.seed,
+        )
+        for model in models
+    )
+    # Rows ordered by target, then model, as in the models page table
+    results = [rows[k] for k in range(len(targets)) for rows in per_model]
+
+    table = pd.DataFrame(results)
+    table["top_features"] = table["top_features"].map(", ".join)
+    write_parquet(table, args.out / "metrics.parquet")
+    write_json(results, args.out / "results.json")
+    return {"models": len(results)}
+
+
+# ---------------------------------------------------------------------------
+# hypotheses / evidence / pipeline
+# ---------------------------------------------------------------------------
+
+
+def run_hypotheses(args) -> dict:
+    from src.machinability.models.hypotheses import HYPOTHESES, evaluate_hypotheses
+
+    path = args.results or args.out / "results.json"
+    results = json.loads(Path(path).read_text())
+    evaluated = evaluate_hypotheses(results)
+    write_json(
+        {hyp: {**HYPOTHESES[hyp], **res.to_dict()} for hyp, res in evaluated.items()},
+        args.out / "hypotheses.json",
+    )
+    return {hyp: res.status for hyp, res in evaluated.items()}
+
+
+def run_evidence(args) -> dict:
+    from src.machinability.analysis.evidence import evidence_summary, missing_summary
+    from src.machinability.data.loader import load_evidence_matrix
+
+    df = load_evidence_matrix(args.matrix)
+    summary = evidence_summary(df)
+    write_json(summary, args.out / "evidence.json")
+    write_parquet(
+        missing_summary(df).rename_axis("column").reset_index(),
+        args.out / "evidence_missing.parquet",
+    )
+    return {"rows": summary["rows"], "unique_papers": summary["unique_papers"]}
+
+
+def run_pipeline(args) -> int:
+    from src.machinability import pipeline
+
+    argv = list(args.pipeline_args)
+    if argv[:1] == ["--"]:
+        argv = argv[1:]
+    if args.jobs is not None:
+        argv += ["--jobs", str(args.jobs)]
+    return pipeline.main(argv)
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+
+def _add_data_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--data", default="synthetic", help="'synthetic' or a CSV/Parquet specimen table"
+    )
+    parser.add_argument("--n", type=int, default=200, help="Synthetic sample size")
+    parser.add_argument("--seed", type=int, default=42)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="machinability",
+        description="Headless machinability computations (Parquet/JSON output).",
+    )
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--out", type=Path, default=CLI_RESULTS_DIR, help="Output directory")
+    common.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Worker processes for independent tasks (-1: all cores)",
+    )
+    common.add_argument(
+        "--metrics",
+        type=Path,
+        default=None,
+        help="Write the stage timings of this command (.prom: Prometheus "
+        "text, otherwise JSON); work done in --jobs workers is not "
+        "included",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("correlate", parents=[common], help="Correlation matrix and screen (RQ1)")
+    _add_data_args(p)
+    p.add_argument("--x", default="conductivity", help="Predictor screened against targets")
+    p.add_argument("--targets", nargs="+", default=DEFAULT_TARGETS)
+    p.add_argument("--columns", nargs="+", default=None, help="Matrix columns (default: numeric)")
+    p.set_defaults(func=run_correlate)
+
+    p = sub.add_parser("train", parents=[common], help="Train and compare models (RQ4)")
+    _add_data_args(p)
+    p.add_argument("--models", nargs="+", default=None, help="Factory model names (default: all)")
+    p.add_argument("--features", nargs="+", default=DEFAULT_FEATURES)
+    p.add_argument("--targets", nargs="+", default=DEFAULT_TARGETS)
+    p.add_argument("--test-size", type=float, default=0.2)
+    p.add_argument("--cv", type=int, default=5, help="CV folds")
+    p.set_defaults(func=run_train)
+
+    p = sub.add_parser("hypotheses", parents=[common], help="Evaluate H4a-H4d")
+    p.add_argument(
+        "--results",
+        type=Path,
+        default=None,
+        help="results.json from 'train' (default: <out>/results.json)",
+    )
+    p.set_defaults(func=run_hypotheses)
+
+    p = sub.add_parser("evidence", parents=[common], help="Evidence-matrix summary")
+    p.add_argument("--matrix", type=Path, default=None, help="Evidence matrix CSV")
+    p.set_defaults(func=run_evidence)
+
+    p = sub.add_parser(
+        "pipeline",
+        help="Run the incremental pipeline",
+        description="Extra arguments are passed to the pipeline command.",
+    )
+    p.add_argument("--jobs", "-j", type=int, default=None, help="Worker processes")
+    p.add_argument("pipeline_args", nargs=argparse.REMAINDER)
+    p.set_defaults(func=run_pipeline)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Console entry point (``machinability``)."""
+    args = build_parser().parse_args(argv)
+    mark = REGISTRY.mark()
+    with (
+        maybe_profile(f"cli-{args.command}", metadata={"command": args.command}),
+        stage(f"cli.{args.command}"),
+    ):
+        outcome = args.func(args)
+    if getattr(args, "metrics", None) is not None:
+        # Both formats cover this command only, not earlier work in the process
+        run = MetricsRegistry()
+        for record in REGISTRY.records(since=mark):
+            run.add(replace(record))
+        prometheus = args.metrics.suffix == ".prom"
+        text = run.to_prometheus() if prometheus else run.to_json(since=0)
+        args.metrics.parent.mkdir(parents=True, exist_ok=True)
+        args.metrics.write_text(text)
+    if isinstance(outcome, int):
+        return outcome
+    print(json.dumps(outcome, default=_json_default))
+    if getattr(args, "out", None) is not None:
+        print(f"Results written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1 +1,13 @@
 """Data loading, cleaning, and preprocessing for conductivity-machinability datasets."""
+
+from src.machinability._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["literature", "loader", "preprocessing", "synthetic"],
+    attributes={
+        "literature": ["load_notes", "parse_bib_entries"],
+        "loader": ["load_conductivity_data", "load_evidence_matrix", "load_machining_data"],
+        "synthetic": ["generate_specimens"],
+    },
+)
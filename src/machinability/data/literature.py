@@ -0,0 +1,134 @@
+"""Parsing of the literature notes and the BibTeX library (01_LITERATURE).
+
+Paper notes follow ``notes/PAPER_NOTE_TEMPLATE.md``: ``- **Field:** value``
+lines, an ``RQ Relevance`` line such as ``RQ1: 4/5 | RQ2: 3/5`` and a
+``## Tags`` section of backtick-delimited tags. Used by the literature
+page of the dashboard.
+"""
+
+import re
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from src.machinability.utils.config import LITERATURE_DIR
+
+NOTES_DIR = LITERATURE_DIR / "notes"
+BIB_FILE = LITERATURE_DIR / "library.bib"
+NOTE_TEMPLATE = "PAPER_NOTE_TEMPLATE.md"
+
+RQS = ["RQ1", "RQ2", "RQ3", "RQ4"]
+
+_BIB_ENTRY = re.compile(r"@(\w+)\{([^,]+),\s*(.*?)\n\}", re.DOTALL)
+_BIB_FIELD = re.compile(r"(\w+)\s*=\s*\{(.*?)\}", re.DOTALL)
+
+
+def note_files(notes_dir: Path | None = None) -> list[Path]:
+    """Return all .md note files, excluding the template."""
+    notes_dir = Path(notes_dir or NOTES_DIR)
+    if not notes_dir.is_dir():
+        return []
+    return sorted(p for p in notes_dir.glob("*.md") if p.name != NOTE_TEMPLATE)
+
+
+def extract_field(text: str, field: str) -> str:
+    """Extract a '- **Field:** value' line from markdown text."""
+    pattern = rf"\*\*{re.escape(field)}:\*\*\s*(.*)"
+    m = re.search(pattern, text)
+    return m.group(1).strip() if m else ""
+
+
+def extract_rq_scores(text: str) -> dict[str, int]:
+    """Parse 'RQ1: 4/5 | RQ2: 3/5 ...' into a dict of ints."""
+    scores: dict[str, int] = {}
+    relevance_line = extract_field(text, "RQ Relevance")
+    if not relevance_line:
+        return {rq: 0 for rq in RQS}
+    for rq in RQS:
+        m = re.search(rf"{rq}:\s*(\d+)/5", relevance_line)
+        scores[rq] = int(m.group(1)) if m else 0
+    return scores
+
+
+def extract_tags(text: str) -> list[str]:
+    """Extract backtick-delimited tags from the '## Tags' section."""
+    m = re.search(r"## Tags\s*\n(.+)", text)
+    if not m:
+        return []
+    return re.findall(r"`([^`]+)`", m.group(1))
+
+
+def extract_pillar(text: str) -> str:
+    """Extract pillar letter(s) from the Classification section."""
+    raw = extract_field(text, "Pillar")
+    if not raw:
+        return ""
+    # Normalise: "Multi (B + D)" -> "Multi", "A" -> "A"
+    raw_upper = raw.strip().upper()
+    if raw_upper.startswith("MULTI"):
+        return "Multi"
+    # Take the first single letter that matches known pillars
+    for ch in "ABCD":
+        if ch in raw_upper:
+            return ch
+    return raw.strip()
+
+
+def parse_note(path: Path) -> dict[str, Any]:
+    """Parse a single paper note into a metadata dict."""
+    text = path.read_text(encoding="utf-8")
+    rq_scores = extract_rq_scores(text)
+    tags = extract_tags(text)
+    pillar = extract_pillar(text)
+    year_raw = extract_field(text, "Year")
+    # Try to pull a 4-digit year
+    year_match = re.search(r"\d{4}", year_raw)
+    year = int(year_match.group()) if year_match else None
+
+    return {
+        "file": path.name,
+        "path": str(path),
+        "title": extract_field(text, "Title"),
+        "authors": extract_field(text, "Authors"),
+        "year": year,
+        "journal": extract_field(text, "Journal/Publisher"),
+        "pillar": pillar,
+        "paper_type": extract_field(text, "Paper Type"),
+        **rq_scores,
+        "relevance_total": sum(rq_scores.values()),
+        "tags": tags,
+        "tags_str": ", ".join(tags),
+        "raw": text,
+    }
+
+
+def load_notes(notes_dir: Path | None = None) -> pd.DataFrame:
+    """Parse every paper note into a DataFrame (empty if there are none)."""
+    files = note_files(notes_dir)
+    if not files:
+        return pd.DataFrame()
+    return pd.DataFrame([parse_note(p) for p in files])
+
+
+def load_bibtex(path: Path | None = None) -> str:
+    """Raw text of ``library.bib`` (empty if the file does not exist)."""
+    path = Path(path or BIB_FILE)
+    return path.read_text(encoding="utf-8") if path.is_file() else ""
+
+
+def parse_bib_entries(bib_text: str) -> list[dict[str, str]]:
+    """Lightweight parser: split bib_text into individual entries."""
+    entries: list[dict[str, str]] = []
+    # Match each @type{key, ... } block
+    for m in _BIB_ENTRY.finditer(bib_text):
+        entry_type = m.group(1)
+        cite_key = m.group(2).strip()
+        body = m.group(3)
+        # Extract fields
+        fields: dict[str, str] = {"type": entry_type, "key": cite_key}
+        for fm in _BIB_FIELD.finditer(body):
+            fields[fm.group(1).lower()] = fm.group(2).strip()
+        fields["_raw"] = m.group(0)
+        entries.append(fields)
+    return entries
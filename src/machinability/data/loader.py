@@ -4,9 +4,12 @@ from pathlib import Path
 
 import pandas as pd
 
+from src.machinability.utils.instrument import timed
+
 EVIDENCE_MATRIX_PATH = Path(__file__).resolve().parents[3] / "02_EVIDENCE_MATRIX" / "evidence_matrix.csv"
 
 
+@timed
 def load_evidence_matrix(path: Path | None = None) -> pd.DataFrame:
     """Load the evidence matrix CSV.
 
@@ -25,6 +28,7 @@ def load_evidence_matrix(path: Path | None = None) -> pd.DataFrame:
     return df
 
 
+@timed
 def load_conductivity_data(path: Path) -> pd.DataFrame:
     """Load raw conductivity measurement data from a CSV file.
 
@@ -47,6 +51,7 @@ def load_conductivity_data(path: Path) -> pd.DataFrame:
     return df
 
 
+@timed
 def load_machining_data(path: Path) -> pd.DataFrame:
     """Load raw machining test data from a CSV file.
 
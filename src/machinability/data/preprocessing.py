@@ -3,10 +3,18 @@
 import numpy as np
 import pandas as pd
 
+from src.machinability.utils.cache import memoize
+from src.machinability.utils.instrument import timed
+
 
 # Conversion constants
 IACS_100_PERCENT_MS_PER_M = 58.0  # 100% IACS = 58.0 MS/m (annealed copper at 20°C)
 
+# Temperature coefficient of resistivity of low-alloy steels near room
+# temperature (1/K); conductivity falls by roughly this fraction per kelvin.
+STEEL_TEMP_COEFF_PER_K = 0.0045
+REFERENCE_TEMP_C = 20.0
+
 
 def iacs_to_ms_per_m(iacs_percent: float | np.ndarray) -> float | np.ndarray:
     """Convert %IACS to MS/m."""
@@ -26,6 +34,45 @@ def resistivity_to_conductivity(resistivity_uohm_cm: float | np.ndarray) -> floa
     return 0.1 / resistivity_uohm_cm
 
 
+def to_iacs(values: np.ndarray, units) -> np.ndarray:
+    """Convert conductivity readings to %IACS.
+
+    Parameters
+    ----------
+    values : array-like
+        Readings.
+    units : str or array-like of str
+        Unit per reading: ``"%IACS"`` or ``"MS/m"``.
+
+    Returns
+    -------
+    np.ndarray
+    """
+    values = np.asarray(values, dtype=float)
+    units = np.broadcast_to(np.asarray(units, dtype=object), values.shape)
+    known = {"%IACS", "MS/m"}
+    unknown = set(np.unique(units)) - known
+    if unknown:
+        raise ValueError(f"Unknown conductivity units: {sorted(unknown)}")
+    return np.where(units == "MS/m", ms_per_m_to_iacs(values), values)
+
+
+def correct_to_reference_temperature(
+    conductivity: float | np.ndarray,
+    temp_C: float | np.ndarray,
+    alpha: float = STEEL_TEMP_COEFF_PER_K,
+    reference_C: float = REFERENCE_TEMP_C,
+) -> float | np.ndarray:
+    """Refer conductivity measured at *temp_C* to the reference temperature.
+
+    Uses the linear resistivity model rho(T) = rho_ref * (1 + alpha * (T - T_ref)),
+    i.e. sigma_ref = sigma(T) * (1 + alpha * (T - T_ref)).
+    """
+    return conductivity * (1.0 + alpha * (np.asarray(temp_C, dtype=float) - reference_C))
+
+
+@timed
+@memoize
 def merge_conductivity_machining(
     conductivity_df: pd.DataFrame,
     machining_df: pd.DataFrame,
@@ -0,0 +1,258 @@
+"""Seeded, vectorised synthetic specimen generator.
+
+Produces conductivity, hardness, composition and machinability targets for
+the three AISI grades with realistic correlations. Used by the dashboard
+demo pages and for benchmarking on large inputs (millions of rows can be
+streamed to Parquet in chunks).
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.machinability.utils.instrument import timed
+
+# Grade-specific base properties (conductivity in %IACS, hardness in HV,
+# composition in wt.%)
+GRADE_PROPERTIES = {
+    "AISI 1045": {"conductivity": 7.5, "hardness": 200, "C": 0.45, "Mn": 0.75, "Cr": 0.04},
+    "AISI 4140": {"conductivity": 5.1, "hardness": 280, "C": 0.40, "Mn": 0.87, "Cr": 1.00},
+    "AISI 4340": {"conductivity": 4.3, "hardness": 320, "C": 0.40, "Mn": 0.70, "Cr": 0.80},
+}
+
+# Offsets relative to the normalised condition
+HEAT_TREATMENTS = {
+    "normalised": {"conductivity": 0.0, "hardness": 0.0},
+    "annealed": {"conductivity": 0.4, "hardness": -30.0},
+    "Q&T": {"conductivity": -0.6, "hardness": 70.0},
+}
+
+COLUMNS = [
+    "steel_grade",
+    "heat_treatment",
+    "conductivity",
+    "hardness",
+    "composition_C",
+    "composition_Mn",
+    "composition_Cr",
+    "tool_life",
+    "Ra",
+    "Fc",
+]
+
+_NUMERIC = COLUMNS[2:]
+
+
+@timed
+def generate_specimens(
+    n: int = 80,
+    seed: int | np.random.SeedSequence | None = 42,
+    grades: list[str] | None = None,
+    heat_treatments: list[str] | None = None,
+    noise: float = 1.0,
+    missing_rate: float = 0.0,
+    categorical: bool = False,
+) -> pd.DataFrame:
+    """Generate *n* synthetic specimens.
+
+    Parameters
+    ----------
+    n : int
+        Number of specimens.
+    seed : int or SeedSequence, optional
+        Random seed for reproducibility.
+    grades : list of str, optional
+        Steel grades to sample from (keys of ``GRADE_PROPERTIES``).
+        Defaults to all three.
+    heat_treatments : list of str, optional
+        Heat-treatment conditions to sample from (keys of
+        ``HEAT_TREATMENTS``). Defaults to ``["normalised"]``.
+    noise : float
+        Multiplier on all scatter terms (0 gives noise-free data).
+    missing_rate : float
+        Fraction of numeric values replaced by NaN, independently per cell.
+    categorical : bool
+        Return ``steel_grade`` and ``heat_treatment`` as categoricals
+        (smaller in memory and on disk).
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns: steel_grade, heat_treatment, conductivity, hardness,
+        composition_C, composition_Mn, composition_Cr, tool_life, Ra, Fc.
+    """
+    grades = list(grades or GRADE_PROPERTIES)
+    heat_treatments = list(heat_treatments or ["normalised"])
+    unknown = (set(grades) - set(GRADE_PROPERTIES)) | (set(heat_treatments) - set(HEAT_TREATMENTS))
+    if unknown:
+        raise ValueError(f"Unknown grades or heat treatments: {unknown}")
+    if not 0.0 <= missing_rate < 1.0:
+        raise ValueError("missing_rate must be in [0, 1)")
+
+    rng = np.random.default_rng(seed)
+    g = rng.integers(len(grades), size=n)
+    h = rng.integers(len(heat_treatments), size=n)
+
+    def _prop(key: str) -> np.ndarray:
+        return np.array([GRADE_PROPERTIES[name][key] for name in grades], dtype=float)[g]
+
+    def _offset(key: str) -> np.ndarray:
+        return np.array([HEAT_TREATMENTS[name][key] for name in heat_treatments])[h]
+
+    def _scatter(sd: float) -> np.ndarray:
+        return rng.normal(0.0, sd * noise, size=n)
+
+    conductivity = _prop("conductivity") + _offset("conductivity") + _scatter(0.4)
+    hardness = _prop("hardness") + _offset("hardness") + _scatter(15)
+    comp_C = np.clip(_prop("C") + _scatter(0.02), 0.10, 0.70)
+    comp_Mn = np.clip(_prop("Mn") + _scatter(0.05), 0.30, 1.20)
+    comp_Cr = np.clip(_prop("Cr") + _scatter(0.05), 0.0, 1.50)
+
+    # Targets with realistic correlations
+    tool_life = (
+        120
+        + 8.0 * conductivity
+        - 0.35 * hardness
+        - 40 * comp_C
+        + 10 * comp_Mn
+        - 15 * comp_Cr
+        + _scatter(6)
+    )
+    Ra = 0.3 - 0.03 * conductivity + 0.003 * hardness + 0.5 * comp_C + _scatter(0.08)
+    Fc = 300 - 12 * conductivity + 1.5 * hardness + 100 * comp_C + 50 * comp_Cr + _scatter(20)
+
+    grade_col = pd.Categorical.from_codes(g, categories=grades)
+    heat_col = pd.Categorical.from_codes(h, categories=heat_treatments)
+    df = pd.DataFrame(
+        {
+            "steel_grade": grade_col if categorical else np.asarray(grade_col, dtype=object),
+            "heat_treatment": heat_col if categorical else np.asarray(heat_col, dtype=object),
+            "conductivity": np.round(conductivity, 3),
+            "hardness": np.round(hardness, 1),
+            "composition_C": np.round(comp_C, 4),
+            "composition_Mn": np.round(comp_Mn, 4),
+            "composition_Cr": np.round(comp_Cr, 4),
+            "tool_life": np.round(np.maximum(tool_life, 5), 2),
+            "Ra": np.round(np.maximum(Ra, 0.05), 4),
+            "Fc": np.round(np.maximum(Fc, 50), 2),
+        }
+    )
+
+    if missing_rate > 0:
+        values = df[_NUMERIC].to_numpy(copy=True)
+        values[rng.random(values.shape) < missing_rate] = np.nan
+        df[_NUMERIC] = values
+    return df
+
+
+def iter_specimen_chunks(n: int, chunk_size: int = 1_000_000, seed: int | None = 42, **kwargs):
+    """Yield :func:`generate_specimens` frames totalling *n* rows.
+
+    Each chunk gets an independent child seed, so the output is
+    reproducible for a given ``(n, chunk_size, seed)``.
+    """
+    n_chunks = max(1, -(-n // chunk_size))
+    for i, child in enumerate(np.random.SeedSequence(seed).spawn(n_chunks)):
+        size = min(chunk_size, n - i * chunk_size)
+        if size > 0:
+            yield generate_specimens(size, seed=child, **kwargs)
+
+
+def write_parquet(
+    path: Path,
+    n: int,
+    chunk_size: int = 1_000_000,
+    seed: int | None = 42,
+    **kwargs,
+) -> Path:
+    """Stream *n* synthetic specimens to a Parquet file chunk by chunk.
+
+    Memory use is bounded by *chunk_size*; each chunk becomes one row group.
+    Extra keyword arguments are passed to :func:`generate_specimens`.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    kwargs.setdefault("categorical", True)
+    writer = None
+    try:
+        for chunk in iter_specimen_chunks(n, chunk_size=chunk_size, seed=seed, **kwargs):
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    return path
+
+
+def write_raw_csvs(
+    raw_dir: Path,
+    n: int = 80,
+    seed: int | None = 42,
+    repeats: int = 3,
+    **kwargs,
+) -> dict[str, Path]:
+    """Write synthetic specimens in the raw-data layout of the pipeline.
+
+    Produces ``specimens.csv`` (grade, heat treatment, hardness,
+    composition), ``conductivity.csv`` (*repeats* readings per specimen in
+    mixed units at 18-26 °C, as :func:`load_conductivity_data` expects) and
+    ``machining.csv`` (long format, as :func:`load_machining_data`
+    expects). Extra keyword arguments are passed to
+    :func:`generate_specimens`.
+
+    Returns
+    -------
+    dict
+        Paths keyed by ``specimens``, ``conductivity`` and ``machining``.
+    """
+    from src.machinability.data.preprocessing import (
+        IACS_100_PERCENT_MS_PER_M,
+        STEEL_TEMP_COEFF_PER_K,
+    )
+
+    raw_dir = Path(raw_dir)
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    df = generate_specimens(n, seed=seed, **kwargs)
+    df.insert(0, "specimen_id", [f"S{i:05d}" for i in range(1, n + 1)])
+    rng = np.random.default_rng(np.random.SeedSequence(seed).spawn(1)[0])
+
+    ids = np.repeat(df["specimen_id"].to_numpy(), repeats)
+    temp = np.round(rng.uniform(18.0, 26.0, size=len(ids)), 1)
+    iacs = np.repeat(df["conductivity"].to_numpy(), repeats)
+    iacs = iacs / (1.0 + STEEL_TEMP_COEFF_PER_K * (temp - 20.0))
+    units = rng.choice(["%IACS", "MS/m"], size=len(ids))
+    value = np.where(units == "MS/m", iacs / 100.0 * IACS_100_PERCENT_MS_PER_M, iacs)
+    conductivity = pd.DataFrame(
+        {
+            "specimen_id": ids,
+            "measurement_method": "eddy_current",
+            "value": np.round(value, 5),
+            "unit": units,
+            "temp_C": temp,
+        }
+    )
+
+    metrics = ["tool_life", "Ra", "Fc"]
+    machining = df.melt(
+        id_vars="specimen_id", value_vars=metrics, var_name="metric", value_name="value"
+    )
+    machining.insert(1, "tool", "P25")
+    machining.insert(2, "v_m_min", 200.0)
+    machining.insert(3, "f_mm_rev", 0.2)
+    machining.insert(4, "d_mm", 1.0)
+
+    paths = {
+        "specimens": raw_dir / "specimens.csv",
+        "conductivity": raw_dir / "conductivity.csv",
+        "machining": raw_dir / "machining.csv",
+    }
+    df.drop(columns=["conductivity", *metrics]).to_csv(paths["specimens"], index=False)
+    conductivity.to_csv(paths["conductivity"], index=False)
+    machining.to_csv(paths["machining"], index=False)
+    return paths
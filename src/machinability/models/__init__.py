@@ -1 +1,32 @@
 """Predictive models for machinability estimation from conductivity."""
+
+from src.machinability._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "baseline",
+        "bootstrap",
+        "compiled",
+        "conformal",
+        "drift",
+        "factory",
+        "hypotheses",
+        "incremental",
+        "learning_curve",
+        "multi_target",
+        "onnx_export",
+        "onnx_scoring",
+        "registry",
+        "server",
+        "store",
+        "treeshap",
+    ],
+    attributes={
+        "baseline": ["HardnessOnlyBaseline", "evaluate_model"],
+        "factory": ["MODEL_MAP", "TREE_MODELS", "fit_model", "make_model"],
+        "hypotheses": ["evaluate_hypotheses"],
+        "registry": ["list_models", "load_model", "predict_batch", "save_model"],
+        "store": ["ModelStore"],
+    },
+)
@@ -5,8 +5,145 @@ These serve as benchmarks against which more complex models are compared.
 
 import numpy as np
 from sklearn.base import BaseEstimator, RegressorMixin
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import mean_absolute_percentage_error, r2_score
+from sklearn.metrics import r2_score
+
+_STAT_KEYS = ("n", "sum_x", "sum_xx", "sum_y", "sum_xy")
+
+# Hardness variances below this fraction of sum_xx are cancellation noise
+_VAR_RTOL = 1e3 * np.finfo(float).eps
+
+
+def _as_xy(X, y=None):
+    """Return hardness as a 1-D array and targets as a 2-D (n, k) array."""
+    x = np.asarray(X, dtype=float)
+    if x.ndim == 2:
+        if x.shape[1] != 1:
+            raise ValueError(f"Expected a single hardness column, got {x.shape[1]}")
+        x = x[:, 0]
+    if y is None:
+        return x, None
+    Y = np.asarray(y, dtype=float)
+    if Y.ndim == 1:
+        Y = Y[:, None]
+    if len(Y) != len(x):
+        raise ValueError(f"X and y have different lengths: {len(x)} != {len(Y)}")
+    return x, Y
+
+
+def sufficient_stats(X, y, weights: np.ndarray | None = None) -> dict:
+    """Compute the sufficient statistics of a one-feature least-squares fit.
+
+    Parameters
+    ----------
+    X : array-like of shape (n_samples,) or (n_samples, 1)
+        Hardness values.
+    y : array-like of shape (n_samples,) or (n_samples, n_targets)
+        Targets.
+    weights : array-like of shape (n_replicates, n_samples), optional
+        Per-replicate sample weights (fold masks, bootstrap counts). When
+        given, every statistic gains a leading replicate axis.
+
+    Returns
+    -------
+    dict
+        ``n``, ``sum_x``, ``sum_xx`` (scalars or ``(B,)``) and ``sum_y``,
+        ``sum_xy`` (``(k,)`` or ``(B, k)``).
+    """
+    x, Y = _as_xy(X, y)
+    if weights is None:
+        return {
+            "n": float(len(x)),
+            "sum_x": x.sum(),
+            "sum_xx": x @ x,
+            "sum_y": Y.sum(axis=0),
+            "sum_xy": x @ Y,
+        }
+    W = np.asarray(weights, dtype=float)
+    return {
+        "n": W.sum(axis=1),
+        "sum_x": W @ x,
+        "sum_xx": W @ (x * x),
+        "sum_y": W @ Y,
+        "sum_xy": W @ (x[:, None] * Y),
+    }
+
+
+def solve_stats(stats: dict) -> tuple[np.ndarray, np.ndarray]:
+    """Closed-form slope and intercept from :func:`sufficient_stats`.
+
+    Works element-wise over any leading replicate axis. A constant hardness
+    column yields a zero slope and the target mean as intercept; the
+    variance ``sum_xx - sum_x**2 / n`` is treated as zero when it is within
+    rounding error of ``sum_xx``.
+
+    Returns
+    -------
+    coef, intercept : np.ndarray
+        Shape ``(k,)``, or ``(B, k)`` for replicated statistics.
+    """
+    n = np.asarray(stats["n"], dtype=float)[..., None]
+    sx = np.asarray(stats["sum_x"], dtype=float)[..., None]
+    sxx = np.asarray(stats["sum_xx"], dtype=float)[..., None]
+    sy = np.asarray(stats["sum_y"], dtype=float)
+    sxy = np.asarray(stats["sum_xy"], dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var_x = sxx - sx * sx / n
+        cov_xy = sxy - sx * sy / n
+        varies = var_x > _VAR_RTOL * sxx
+        coef = np.where(varies, cov_xy / np.where(varies, var_x, 1.0), 0.0)
+        intercept = (sy - coef * sx) / n
+    return coef, intercept
+
+
+def cv_fold_fits(X, y, fold_labels) -> tuple[np.ndarray, np.ndarray]:
+    """Fit the baseline on every cross-validation training split at once.
+
+    The statistics of each training split are the full-data statistics
+    minus those of the held-out fold, so no data are revisited per fold.
+
+    Parameters
+    ----------
+    X, y : array-like
+        Hardness and target(s), as for :meth:`HardnessOnlyBaseline.fit`.
+    fold_labels : array-like of shape (n_samples,)
+        Integer fold index of each sample (0 .. n_folds - 1).
+
+    Returns
+    -------
+    coef, intercept : np.ndarray of shape (n_folds, n_targets)
+    """
+    labels = np.asarray(fold_labels)
+    folds = np.arange(labels.max() + 1)
+    held_out = sufficient_stats(X, y, weights=(labels[None, :] == folds[:, None]))
+    total = sufficient_stats(X, y)
+    train = {k: total[k] - held_out[k] for k in _STAT_KEYS}
+    return solve_stats(train)
+
+
+def cv_predict(X, y, fold_labels) -> np.ndarray:
+    """Out-of-fold baseline predictions, shape ``(n_samples, n_targets)``."""
+    x, _ = _as_xy(X)
+    labels = np.asarray(fold_labels)
+    coef, intercept = cv_fold_fits(X, y, labels)
+    return intercept[labels] + coef[labels] * x[:, None]
+
+
+def bootstrap_fits(
+    X, y, n_replicates: int = 1000, random_state: int | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Fit the baseline on *n_replicates* bootstrap resamples in one pass.
+
+    Resamples are represented as multinomial count vectors, so each fit is
+    a weighted sum rather than a copy of the data.
+
+    Returns
+    -------
+    coef, intercept : np.ndarray of shape (n_replicates, n_targets)
+    """
+    x, _ = _as_xy(X)
+    rng = np.random.default_rng(random_state)
+    counts = rng.multinomial(len(x), np.full(len(x), 1.0 / len(x)), size=n_replicates)
+    return solve_stats(sufficient_stats(X, y, weights=counts))
 
 
 class HardnessOnlyBaseline(BaseEstimator, RegressorMixin):
@@ -14,10 +151,11 @@ class HardnessOnlyBaseline(BaseEstimator, RegressorMixin):
 
     This is the model to beat — if conductivity-based models cannot
     outperform hardness-only prediction, the approach has limited value.
-    """
 
-    def __init__(self):
-        self.model_ = LinearRegression()
+    The fit is kept as sufficient statistics (n, Σx, Σx², Σy, Σxy), so
+    several targets are solved at once in closed form and new specimens
+    can be added with :meth:`partial_fit` without revisiting old ones.
+    """
 
     def fit(self, X, y):
         """Fit linear regression on hardness feature.
@@ -26,14 +164,47 @@ class HardnessOnlyBaseline(BaseEstimator, RegressorMixin):
         ----------
         X : array-like of shape (n_samples, 1)
             Hardness values (HV, HRC, or HB).
-        y : array-like of shape (n_samples,)
-            Machinability target (tool life, Ra, etc.).
+        y : array-like of shape (n_samples,) or (n_samples, n_targets)
+            Machinability target(s) (tool life, Ra, etc.).
         """
-        self.model_.fit(X, y)
+        for attr in (*(f"{k}_" for k in _STAT_KEYS), "coef_", "intercept_"):
+            self.__dict__.pop(attr, None)
+        return self.partial_fit(X, y)
+
+    def partial_fit(self, X, y):
+        """Add specimens to the running statistics and update the fit."""
+        stats = sufficient_stats(X, y)
+        if hasattr(self, "n_"):
+            if stats["sum_y"].shape != self.sum_y_.shape:
+                raise ValueError("Number of targets differs from previous fit")
+            for k in _STAT_KEYS:
+                setattr(self, f"{k}_", getattr(self, f"{k}_") + stats[k])
+        else:
+            for k in _STAT_KEYS:
+                setattr(self, f"{k}_", stats[k])
+            self._single_target = np.ndim(y) == 1
+        self.coef_, self.intercept_ = solve_stats(self.stats_)
         return self
 
+    @property
+    def stats_(self) -> dict:
+        """Current sufficient statistics."""
+        return {k: getattr(self, f"{k}_") for k in _STAT_KEYS}
+
+    @classmethod
+    def from_stats(cls, stats: dict, single_target: bool = True) -> "HardnessOnlyBaseline":
+        """Build a fitted baseline directly from sufficient statistics."""
+        model = cls()
+        for k in _STAT_KEYS:
+            setattr(model, f"{k}_", np.asarray(stats[k], dtype=float))
+        model._single_target = single_target and model.sum_y_.shape == (1,)
+        model.coef_, model.intercept_ = solve_stats(stats)
+        return model
+
     def predict(self, X):
-        return self.model_.predict(X)
+        x, _ = _as_xy(X)
+        y_pred = self.intercept_ + x[:, None] * self.coef_
+        return y_pred[:, 0] if self._single_target else y_pred
 
     def score(self, X, y):
         y_pred = self.predict(X)
@@ -45,18 +216,31 @@ def evaluate_model(y_true: np.ndarray, y_pred: np.ndarray) -> dict:
 
     Parameters
     ----------
-    y_true : array-like
+    y_true : array-like of shape (n_samples,) or (n_samples, n_targets)
         True target values.
-    y_pred : array-like
+    y_pred : array-like of the same shape
         Predicted target values.
 
     Returns
     -------
     dict
-        Dictionary with R², MAPE, RMSE.
+        Dictionary with R², MAPE, RMSE. Floats for a single target; arrays
+        of length ``n_targets`` (one value per column, computed in one
+        vectorised pass) for 2-D input.
     """
-    return {
-        "r2": r2_score(y_true, y_pred),
-        "mape": mean_absolute_percentage_error(y_true, y_pred),
-        "rmse": float(np.sqrt(np.mean((y_true - y_pred) ** 2))),
-    }
+    y_true = np.asarray(y_true, dtype=float)
+    y_pred = np.asarray(y_pred, dtype=float)
+    if y_true.shape != y_pred.shape:
+        raise ValueError(f"Shape mismatch: {y_true.shape} != {y_pred.shape}")
+    resid = y_true - y_pred
+    ss_res = np.sum(resid**2, axis=0)
+    ss_tot = np.sum((y_true - y_true.mean(axis=0)) ** 2, axis=0)
+    # Same conventions as sklearn: R² = 0 for a constant target (1 if perfectly
+    # predicted), and |y| floored at machine epsilon in MAPE.
+    r2 = np.where(ss_tot > 0, 1 - ss_res / np.where(ss_tot > 0, ss_tot, 1.0), 0.0)
+    r2 = np.where((ss_tot == 0) & (ss_res == 0), 1.0, r2)
+    mape = np.mean(np.abs(resid) / np.maximum(np.abs(y_true), np.finfo(float).eps), axis=0)
+    rmse = np.sqrt(ss_res / len(y_true))
+    if y_true.ndim == 1:
+        return {"r2": float(r2), "mape": float(mape), "rmse": float(rmse)}
+    return {"r2": r2, "mape": mape, "rmse": rmse}
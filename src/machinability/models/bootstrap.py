@@ -0,0 +1,198 @@
+"""Bootstrap-ensemble (bagging) uncertainty for any factory model (RQ4).
+
+B replicas of an estimator are fitted on bootstrap resamples in a process
+pool. The training arrays are placed in shared memory once, and workers
+receive only resample indices, so the data are not copied per worker.
+
+After fitting, the ensemble is compacted into a single object:
+
+* sklearn linear models (``LinearModel`` subclasses, whose ``predict`` is
+  ``X @ coef_.T + intercept_``) keep a ``(B, n_outputs, n_features)``
+  coefficient array;
+* RBF-kernel SVR keeps the stacked support vectors of all replicas;
+* other models (trees, the hardness-only baseline) keep the fitted
+  replicas.
+
+Linear and SVR ensembles then predict every replica in one vectorised
+pass over the concatenated parameters; SVR rows are scored in blocks so
+the kernel matrix stays bounded. Multi-output targets are supported by
+the linear and tree paths.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+from joblib import effective_n_jobs
+from sklearn.base import clone
+
+from src.machinability.models.factory import make_model
+
+_SHARED: dict = {}
+
+
+def _attach_shared(name: str, x_shape: tuple, y_shape: tuple) -> None:
+    """Process-pool initializer: map the shared training arrays.
+
+    Only the parent, which created the block, registers and unlinks it.
+    Workers share the parent's resource tracker, so on Python < 3.13 (no
+    ``track`` argument) attaching merely repeats the parent's registration.
+    """
+    try:
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+    n_x = int(np.prod(x_shape))
+    _SHARED["shm"] = shm
+    _SHARED["X"] = np.ndarray(x_shape, dtype=float, buffer=shm.buf)
+    _SHARED["y"] = np.ndarray(y_shape, dtype=float, buffer=shm.buf, offset=n_x * 8)
+
+
+def _fit_replica(template, indices: np.ndarray, X=None, y=None):
+    X = _SHARED["X"] if X is None else X
+    y = _SHARED["y"] if y is None else y
+    return clone(template).fit(X[indices], y[indices])
+
+
+class BootstrapEnsemble:
+    """Bagged replicas of an estimator for epistemic uncertainty.
+
+    Parameters
+    ----------
+    model : str or estimator
+        Factory display name (e.g. ``"SVR"``) or an unfitted estimator.
+    n_replicas : int
+        Number of bootstrap replicas B.
+    n_jobs : int, optional
+        Worker processes for fitting (joblib semantics; ``None`` = serial).
+    random_state : int, optional
+        Seed for the bootstrap resamples.
+    """
+
+    def __init__(
+        self,
+        model="Random Forest",
+        n_replicas: int = 50,
+        n_jobs: int | None = None,
+        random_state: int | None = 42,
+    ):
+        self.model = model
+        self.n_replicas = n_replicas
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+
+    def fit(self, X, y) -> "BootstrapEnsemble":
+        """Fit all replicas on bootstrap resamples of ``(X, y)``."""
+        X = np.ascontiguousarray(X, dtype=float)
+        y = np.ascontiguousarray(y, dtype=float)
+        template = make_model(self.model) if isinstance(self.model, str) else self.model
+        rng = np.random.default_rng(self.random_state)
+        indices = rng.integers(len(X), size=(self.n_replicas, len(X)))
+
+        workers = min(effective_n_jobs(self.n_jobs), self.n_replicas)
+        if workers <= 1:
+            replicas = [_fit_replica(template, idx, X, y) for idx in indices]
+        else:
+            shm = shared_memory.SharedMemory(create=True, size=X.nbytes + y.nbytes)
+            try:
+                np.ndarray(X.shape, dtype=float, buffer=shm.buf)[:] = X
+                np.ndarray(y.shape, dtype=float, buffer=shm.buf, offset=X.nbytes)[:] = y
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_attach_shared,
+                    initargs=(shm.name, X.shape, y.shape),
+                ) as pool:
+                    replicas = list(
+                        pool.map(
+                            _fit_replica,
+                            [template] * self.n_replicas,
+                            indices,
+                            chunksize=max(1, self.n_replicas // (4 * workers)),
+                        )
+                    )
+            finally:
+                shm.close()
+                shm.unlink()
+
+        self._compact(replicas, X.shape[1])
+        self.n_features_in_ = X.shape[1]
+        self.n_outputs_ = 1 if y.ndim == 1 else y.shape[1]
+        return self
+
+    def _compact(self, replicas: list, n_features: int) -> None:
+        from sklearn.linear_model._base import LinearModel
+
+        first = replicas[0]
+        self.kind_ = "generic"
+        self.estimators_ = None
+        # Only sklearn linear models are known to predict X @ coef_.T + intercept_;
+        # other estimators with a coef_ (e.g. HardnessOnlyBaseline) use other layouts.
+        if all(isinstance(r, LinearModel) for r in replicas):
+            self.kind_ = "linear"
+            # (B, n_outputs, n_features) and (B, n_outputs)
+            self.coef_ = np.stack(
+                [np.asarray(r.coef_, dtype=float).reshape(-1, n_features) for r in replicas]
+            )
+            self.intercept_ = np.stack(
+                [np.broadcast_to(r.intercept_, self.coef_.shape[1]) for r in replicas]
+            ).astype(float)
+        elif getattr(first, "kernel", None) == "rbf" and hasattr(first, "support_vectors_"):
+            self.kind_ = "rbf"
+            self.support_vectors_ = np.vstack([r.support_vectors_ for r in replicas])
+            self.dual_coef_ = np.concatenate([np.ravel(r.dual_coef_) for r in replicas])
+            self.gamma_ = np.concatenate(
+                [np.full(len(r.support_vectors_), r._gamma) for r in replicas]
+            )
+            self.n_support_ = np.array([len(r.support_vectors_) for r in replicas])
+            self.intercept_ = np.array([float(np.ravel(r.intercept_)[0]) for r in replicas])
+        else:
+            self.estimators_ = replicas
+
+    def predict_all(self, X, chunk_size: int = 1024) -> np.ndarray:
+        """Predictions of every replica.
+
+        Shape ``(n_replicas, n_samples)``, or ``(n_replicas, n_samples,
+        n_outputs)`` for a 2-D training target. SVR ensembles process *X*
+        in blocks of *chunk_size* rows, bounding the kernel matrix to
+        ``(chunk_size, total support vectors)``.
+        """
+        X = np.asarray(X, dtype=float)
+        if self.kind_ == "linear":
+            preds = np.einsum("bkp,np->bnk", self.coef_, X) + self.intercept_[:, None, :]
+        elif self.kind_ == "rbf":
+            preds = np.empty((len(self.intercept_), len(X)))
+            for start in range(0, len(X), chunk_size):
+                preds[:, start : start + chunk_size] = self._rbf_block(
+                    X[start : start + chunk_size]
+                )
+            return preds
+        else:
+            preds = np.stack([np.asarray(est.predict(X)) for est in self.estimators_])
+        return preds.reshape(len(preds), len(X)) if self.n_outputs_ == 1 else preds
+
+    def _rbf_block(self, X: np.ndarray) -> np.ndarray:
+        """SVR replica predictions for a block of rows, shape ``(B, len(X))``."""
+        sv = self.support_vectors_
+        sq_dist = np.sum(X * X, axis=1)[:, None] - 2.0 * X @ sv.T + np.sum(sv * sv, axis=1)
+        weighted = np.exp(-self.gamma_ * np.maximum(sq_dist, 0.0)) * self.dual_coef_
+        # support vectors are stored replica by replica: sum each contiguous segment
+        sums = np.zeros((len(X), len(self.n_support_)))
+        has_sv = self.n_support_ > 0
+        starts = np.concatenate([[0], np.cumsum(self.n_support_)[:-1]])
+        if has_sv.any():
+            sums[:, has_sv] = np.add.reduceat(weighted, starts[has_sv], axis=1)
+        return sums.T + self.intercept_[:, None]
+
+    def predict(self, X) -> np.ndarray:
+        """Ensemble mean prediction."""
+        return self.predict_all(X).mean(axis=0)
+
+    def predict_std(self, X) -> np.ndarray:
+        """Standard deviation across replicas (epistemic uncertainty)."""
+        return self.predict_all(X).std(axis=0, ddof=1)
+
+    def predict_interval(self, X, alpha: float = 0.1) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(mean, lower, upper)`` percentile bands across replicas."""
+        preds = self.predict_all(X)
+        lower, upper = np.quantile(preds, [alpha / 2, 1 - alpha / 2], axis=0)
+        return preds.mean(axis=0), lower, upper
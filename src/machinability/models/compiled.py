@@ -0,0 +1,219 @@
+"""Flat-array compilation of fitted tree ensembles for low-latency scoring (RQ4).
+
+sklearn's ``predict`` on a forest pays validation and per-tree dispatch
+overhead on every call, which dominates when a measuring station scores
+one bar at a time. :func:`compile_ensemble` concatenates the nodes of all
+trees into contiguous arrays (feature, threshold, left, right, value).
+Leaves point to themselves with an infinite threshold, so a fixed number
+of vectorised steps (the maximum tree depth) walks every row through
+every tree at once, with no Python loop over trees. Missing (NaN) inputs
+follow each split's learned ``missing_go_to_left`` direction, as in
+sklearn; gradient boosting, which rejects NaN in sklearn, rejects it here
+too, and infinite inputs are rejected for every model. Only single-output
+regressors are supported.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from src.machinability.models.treeshap import _ensemble
+
+
+class CompiledTreeEnsemble:
+    """Tree ensemble stored as concatenated node arrays.
+
+    Build instances with :func:`compile_ensemble` or :func:`load_compiled`.
+    ``predict(X)`` equals the source estimator's ``predict`` to
+    floating-point tolerance.
+    """
+
+    _ARRAYS = ("feature", "threshold", "left", "right", "value", "roots", "missing_left")
+
+    def __init__(
+        self,
+        feature,
+        threshold,
+        left,
+        right,
+        value,
+        roots,
+        depth: int,
+        scale: float,
+        offset: float,
+        n_features_in: int,
+        missing_left=None,
+        allow_nan: bool = True,
+    ):
+        self.feature = np.ascontiguousarray(feature, dtype=np.intp)
+        self.threshold = np.ascontiguousarray(threshold, dtype=float)
+        self.left = np.ascontiguousarray(left, dtype=np.intp)
+        self.right = np.ascontiguousarray(right, dtype=np.intp)
+        self.value = np.ascontiguousarray(value, dtype=float)
+        self.roots = np.ascontiguousarray(roots, dtype=np.intp)
+        if missing_left is None:  # NaN goes right, as in sklearn < 1.3
+            missing_left = np.zeros(len(self.feature), dtype=bool)
+        self.missing_left = np.ascontiguousarray(missing_left, dtype=bool)
+        self.depth = int(depth)
+        self.scale = float(scale)
+        self.offset = float(offset)
+        self.n_features_in_ = int(n_features_in)
+        self.allow_nan = bool(allow_nan)
+        # children[2 * i] / children[2 * i + 1] are the left / right child of node i
+        self._children = np.column_stack([self.left, self.right]).ravel()
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.feature)
+
+    def predict(self, X, chunk_size: int = 65_536) -> np.ndarray:
+        """Predict *X* of shape ``(n_samples, n_features)``.
+
+        Rows are processed in chunks of *chunk_size* to bound the
+        ``(rows, trees)`` node-index matrix. Inputs are validated like the
+        source estimator's: infinite values (also after the float32 cast)
+        raise ``ValueError``, and so does NaN unless ``allow_nan``.
+        """
+        # sklearn compares float32 inputs against float64 thresholds
+        X = np.asarray(X, dtype=np.float32).astype(float)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f"X has {X.shape[1]} features, but the model expects {self.n_features_in_}."
+            )
+        n_features = X.shape[1]
+        flat = X.ravel()
+        has_nan = False
+        if not np.isfinite(flat).all():
+            if np.isinf(flat).any():
+                raise ValueError(
+                    "Input X contains infinity or a value too large for dtype('float32')."
+                )
+            if not self.allow_nan:
+                raise ValueError("Input X contains NaN; the source model does not accept it.")
+            has_nan = True
+        out = np.empty(len(X))
+        for start in range(0, len(X), chunk_size):
+            stop = min(start + chunk_size, len(X))
+            row_offset = (np.arange(start, stop) * n_features)[:, None]
+            node = np.broadcast_to(self.roots, (stop - start, self.n_trees))
+            for _ in range(self.depth):
+                x = flat[row_offset + self.feature[node]]
+                go_right = x > self.threshold[node]
+                if has_nan:
+                    go_right |= np.isnan(x) & ~self.missing_left[node]
+                node = self._children[2 * node + go_right]
+            out[start:stop] = self.value[node].sum(axis=1)
+        return self.offset + self.scale * out
+
+    def save(self, path) -> Path:
+        """Write the compiled arrays to an ``.npz`` file."""
+        path = Path(path)
+        np.savez(
+            path,
+            **{name: getattr(self, name) for name in self._ARRAYS},
+            meta=np.array(
+                [self.depth, self.scale, self.offset, self.n_features_in_, self.allow_nan]
+            ),
+        )
+        return path
+
+
+def _is_tree_regressor(model) -> bool:
+    from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+    from sklearn.tree import DecisionTreeRegressor
+
+    return isinstance(
+        model, (DecisionTreeRegressor, RandomForestRegressor, GradientBoostingRegressor)
+    )
+
+
+def is_compilable(model) -> bool:
+    """Whether :func:`compile_ensemble` supports the fitted *model*."""
+    return (
+        _is_tree_regressor(model)
+        and hasattr(model, "n_features_in_")
+        and getattr(model, "n_outputs_", 1) == 1
+    )
+
+
+def compile_ensemble(model) -> CompiledTreeEnsemble:
+    """Flatten a fitted sklearn tree model into a :class:`CompiledTreeEnsemble`.
+
+    Parameters
+    ----------
+    model : fitted estimator
+        ``DecisionTreeRegressor``, ``RandomForestRegressor`` or
+        ``GradientBoostingRegressor`` (squared-error loss), e.g. from
+        :func:`~src.machinability.models.factory.make_model`.
+
+    Returns
+    -------
+    CompiledTreeEnsemble
+
+    Raises
+    ------
+    TypeError
+        If *model* is not one of the supported tree regressors.
+    ValueError
+        If *model* was fitted on a multi-output target.
+    """
+    if not (_is_tree_regressor(model) and hasattr(model, "n_features_in_")):
+        raise TypeError(f"Cannot compile {type(model).__name__}: not a fitted tree model.")
+    if getattr(model, "n_outputs_", 1) > 1:
+        raise ValueError("Cannot compile a multi-output tree model; predict() would differ.")
+    from sklearn.ensemble import GradientBoostingRegressor
+
+    trees, scale, offset = _ensemble(model)
+
+    parts = {
+        name: [] for name in ("feature", "threshold", "left", "right", "value", "missing_left")
+    }
+    roots, depth, base = [], 0, 0
+    for tree in trees:
+        t = tree.tree_
+        ids = np.arange(t.node_count)
+        leaf = t.children_left == -1
+        parts["feature"].append(np.where(leaf, 0, t.feature))
+        parts["threshold"].append(np.where(leaf, np.inf, t.threshold))
+        parts["left"].append(base + np.where(leaf, ids, t.children_left))
+        parts["right"].append(base + np.where(leaf, ids, t.children_right))
+        parts["value"].append(t.value[:, 0, 0])
+        missing_left = getattr(t, "missing_go_to_left", None)
+        parts["missing_left"].append(
+            np.zeros(t.node_count, dtype=bool)
+            if missing_left is None
+            else np.asarray(missing_left, dtype=bool) & ~leaf
+        )
+        roots.append(base)
+        depth = max(depth, t.max_depth)
+        base += t.node_count
+
+    return CompiledTreeEnsemble(
+        **{name: np.concatenate(arrs) for name, arrs in parts.items()},
+        roots=np.array(roots),
+        depth=depth,
+        scale=scale,
+        offset=offset,
+        n_features_in=model.n_features_in_,
+        allow_nan=not isinstance(model, GradientBoostingRegressor),
+    )
+
+
+def load_compiled(path) -> CompiledTreeEnsemble:
+    """Load a :class:`CompiledTreeEnsemble` written by :meth:`~CompiledTreeEnsemble.save`."""
+    with np.load(path) as data:
+        depth, scale, offset, n_features, *rest = data["meta"]
+        return CompiledTreeEnsemble(
+            **{name: data[name] for name in CompiledTreeEnsemble._ARRAYS if name in data},
+            depth=int(depth),
+            scale=scale,
+            offset=offset,
+            n_features_in=int(n_features),
+            allow_nan=bool(rest[0]) if rest else True,
+        )
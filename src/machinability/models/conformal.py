@@ -0,0 +1,133 @@
+"""Conformal prediction intervals for machinability models (RQ4).
+
+Two variants are provided, both calibrated from residuals that already
+exist after training, so no model is refitted:
+
+* :class:`SplitConformalRegressor` — one fitted model plus absolute
+  residuals on a held-out calibration split.
+* :class:`CVPlusRegressor` — the fold models and out-of-fold residuals of a
+  ``cross_validate(..., return_estimator=True, return_indices=True)`` run
+  (CV+ of Barber et al., 2021).
+
+Interval computation is vectorised over test points and processed in
+chunks, so tens of thousands of predictions are scored in one call.
+"""
+
+import numpy as np
+
+
+def conformal_quantile(scores: np.ndarray, alpha: float) -> float:
+    """Finite-sample conformal quantile of nonconformity *scores*.
+
+    Returns the ``ceil((n + 1)(1 - alpha))``-th smallest score, or ``inf``
+    when the calibration set is too small for the requested coverage.
+    """
+    scores = np.sort(np.asarray(scores, dtype=float))
+    k = int(np.ceil((len(scores) + 1) * (1.0 - alpha)))
+    if k > len(scores):
+        return float("inf")
+    return float(scores[k - 1])
+
+
+def interval_coverage(y_true: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> float:
+    """Fraction of *y_true* inside ``[lower, upper]``."""
+    y_true = np.asarray(y_true)
+    return float(np.mean((y_true >= lower) & (y_true <= upper)))
+
+
+class SplitConformalRegressor:
+    """Split-conformal intervals around a fitted regressor.
+
+    Parameters
+    ----------
+    estimator : fitted estimator
+        Point predictor.
+    residuals : array-like
+        Absolute residuals ``|y - estimator.predict(X)|`` on a calibration
+        split not used for fitting.
+    """
+
+    def __init__(self, estimator, residuals: np.ndarray):
+        self.estimator = estimator
+        self.residuals = np.abs(np.asarray(residuals, dtype=float))
+
+    @classmethod
+    def calibrate(cls, estimator, X_cal, y_cal) -> "SplitConformalRegressor":
+        """Compute calibration residuals for an already fitted *estimator*."""
+        return cls(estimator, np.asarray(y_cal) - estimator.predict(X_cal))
+
+    def predict_interval(self, X, alpha: float = 0.1) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(y_pred, lower, upper)`` with ``1 - alpha`` target coverage."""
+        y_pred = np.asarray(self.estimator.predict(X), dtype=float)
+        q = conformal_quantile(self.residuals, alpha)
+        return y_pred, y_pred - q, y_pred + q
+
+
+class CVPlusRegressor:
+    """CV+ intervals from fold models and their out-of-fold residuals.
+
+    Parameters
+    ----------
+    fold_estimators : list of fitted estimators
+        One model per fold, each trained without its fold.
+    fold_ids : array-like of shape (n_samples,)
+        Index into *fold_estimators* of the model that did *not* see each
+        training sample.
+    residuals : array-like of shape (n_samples,)
+        Absolute out-of-fold residuals.
+    """
+
+    def __init__(self, fold_estimators: list, fold_ids: np.ndarray, residuals: np.ndarray):
+        self.fold_estimators = list(fold_estimators)
+        self.fold_ids = np.asarray(fold_ids, dtype=int)
+        self.residuals = np.abs(np.asarray(residuals, dtype=float))
+
+    @classmethod
+    def from_cv_results(cls, cv_results: dict, X, y) -> "CVPlusRegressor":
+        """Build from ``sklearn.model_selection.cross_validate`` output.
+
+        The run must use ``return_estimator=True`` and
+        ``return_indices=True``; *X*, *y* are the arrays it was run on.
+        """
+        X = np.asarray(X)
+        y = np.asarray(y, dtype=float)
+        fold_ids = np.full(len(y), -1)
+        residuals = np.empty(len(y))
+        for k, (est, test_idx) in enumerate(
+            zip(cv_results["estimator"], cv_results["indices"]["test"])
+        ):
+            fold_ids[test_idx] = k
+            residuals[test_idx] = y[test_idx] - est.predict(X[test_idx])
+        if (fold_ids < 0).any():
+            raise ValueError("CV test folds do not cover every sample")
+        return cls(cv_results["estimator"], fold_ids, residuals)
+
+    def fold_predictions(self, X) -> np.ndarray:
+        """Predictions of every fold model, shape ``(n_folds, n_test)``."""
+        return np.vstack([np.ravel(est.predict(X)) for est in self.fold_estimators])
+
+    def predict_interval(
+        self, X, alpha: float = 0.1, chunk_size: int = 2048
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(y_pred, lower, upper)`` with ``1 - alpha`` target coverage.
+
+        ``y_pred`` is the mean of the fold models. Bounds are order
+        statistics over training samples of ``mu_{-k(i)}(x) -/+ R_i``,
+        computed with ``np.partition`` on ``(n_train, chunk)`` blocks.
+        """
+        fold_pred = self.fold_predictions(X)
+        n, m = len(self.residuals), fold_pred.shape[1]
+        k_lo = int(np.floor(alpha * (n + 1)))
+        k_hi = int(np.ceil((1.0 - alpha) * (n + 1)))
+
+        lower = np.full(m, -np.inf)
+        upper = np.full(m, np.inf)
+        R = self.residuals[:, None]
+        for start in range(0, m, chunk_size):
+            cols = slice(start, start + chunk_size)
+            block = fold_pred[self.fold_ids, cols]
+            if k_lo >= 1:
+                lower[cols] = np.partition(block - R, k_lo - 1, axis=0)[k_lo - 1]
+            if k_hi <= n:
+                upper[cols] = np.partition(block + R, k_hi - 1, axis=0)[k_hi - 1]
+        return fold_pred.mean(axis=0), lower, upper
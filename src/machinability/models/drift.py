@@ -0,0 +1,208 @@
+"""Feature-distribution drift monitoring for incoming specimens (RQ4).
+
+A :class:`DriftReference` is a compact sketch of the training features
+(per-feature quantile edges with reference bin counts, mean and
+covariance) that is stored next to a registered model instead of the raw
+training data. Each incoming batch is compared with it in O(batch):
+
+* PSI (population stability index) per feature on the reference bins;
+* KS distance per feature, evaluated on the same bin edges;
+* squared Mahalanobis distance per row, flagging rows whose feature
+  vector lies outside the training envelope (e.g. a new heat treatment
+  or supplier).
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from scipy import stats
+
+from src.machinability.models.registry import _model_dir
+
+DRIFT_FILE = "drift.json"
+
+# Conventional PSI reading: < 0.1 stable, 0.1-0.25 moderate, > 0.25 major shift
+PSI_THRESHOLD = 0.25
+
+
+@dataclass
+class DriftReport:
+    """Comparison of one batch against a :class:`DriftReference`."""
+
+    features: list[str]
+    psi: np.ndarray
+    ks: np.ndarray
+    ks_critical: float
+    mahalanobis: np.ndarray
+    ood_threshold: float
+
+    @property
+    def drifted(self) -> np.ndarray:
+        """Per-feature drift flag (PSI above threshold or KS significant)."""
+        return (self.psi > PSI_THRESHOLD) | (self.ks > self.ks_critical)
+
+    @property
+    def out_of_distribution(self) -> np.ndarray:
+        """Per-row flag: Mahalanobis distance beyond the chi-square cutoff."""
+        return self.mahalanobis > self.ood_threshold
+
+    def summary(self) -> dict:
+        """Per-feature statistics and the OOD fraction as plain Python types."""
+        return {
+            "features": {
+                f: {"psi": float(p), "ks": float(k), "drifted": bool(d)}
+                for f, p, k, d in zip(self.features, self.psi, self.ks, self.drifted)
+            },
+            "ks_critical": float(self.ks_critical),
+            "ood_fraction": (
+                float(self.out_of_distribution.mean()) if len(self.mahalanobis) else 0.0
+            ),
+        }
+
+
+class DriftReference:
+    """Sketch of the training feature distribution.
+
+    Build with :meth:`from_data`; persist with :func:`save_reference`.
+
+    Parameters
+    ----------
+    features : list of str
+        Feature names, in column order.
+    n : int
+        Number of reference rows.
+    edges : np.ndarray of shape (n_features, n_bins - 1)
+        Interior bin edges (reference quantiles).
+    counts : np.ndarray of shape (n_features, n_bins + 2)
+        Reference counts per bin, including the two open tail bins below
+        the minimum and above the maximum.
+    lower, upper : np.ndarray of shape (n_features,)
+        Reference minimum and maximum.
+    mean : np.ndarray of shape (n_features,)
+    cov : np.ndarray of shape (n_features, n_features)
+    """
+
+    def __init__(self, features, n, edges, counts, lower, upper, mean, cov):
+        self.features = list(features)
+        self.n = int(n)
+        self.edges = np.asarray(edges, dtype=float)
+        self.counts = np.asarray(counts, dtype=float)
+        self.lower = np.asarray(lower, dtype=float)
+        self.upper = np.asarray(upper, dtype=float)
+        self.mean = np.asarray(mean, dtype=float)
+        self.cov = np.atleast_2d(np.asarray(cov, dtype=float))
+        self._precision = np.linalg.pinv(self.cov)
+
+    @classmethod
+    def from_data(cls, X, features: list[str], n_bins: int = 10) -> "DriftReference":
+        """Sketch a training matrix *X* of shape ``(n_samples, n_features)``."""
+        X = np.asarray(X, dtype=float)
+        levels = np.linspace(0, 1, n_bins + 1)[1:-1]
+        edges = np.quantile(X, levels, axis=0).T
+        ref = cls(
+            features,
+            len(X),
+            edges,
+            np.zeros((X.shape[1], n_bins + 2)),
+            X.min(axis=0),
+            X.max(axis=0),
+            X.mean(axis=0),
+            np.cov(X, rowvar=False),
+        )
+        ref.counts = ref._bin_counts(X)
+        return ref
+
+    def _bin_counts(self, X: np.ndarray) -> np.ndarray:
+        """Counts per (feature, bin) for *X*, all features at once."""
+        n_features, n_cols = self.counts.shape
+        # bin 0: below the reference minimum; last bin: above the maximum
+        inner = 1 + (X[:, :, None] > self.edges[None, :, :]).sum(axis=2)
+        bins = np.where(X < self.lower, 0, np.where(X > self.upper, n_cols - 1, inner))
+        flat = bins + n_cols * np.arange(n_features)
+        return (
+            np.bincount(flat.ravel(), minlength=n_features * n_cols)
+            .reshape(n_features, n_cols)
+            .astype(float)
+        )
+
+    def mahalanobis(self, X) -> np.ndarray:
+        """Squared Mahalanobis distance of each row from the reference mean."""
+        centred = np.asarray(X, dtype=float) - self.mean
+        return np.einsum("ij,jk,ik->i", centred, self._precision, centred)
+
+    def ood_threshold(self, alpha: float = 0.01) -> float:
+        """Chi-square cutoff on the squared Mahalanobis distance."""
+        return float(stats.chi2.ppf(1 - alpha, df=len(self.features)))
+
+    def out_of_distribution(self, X, alpha: float = 0.01) -> np.ndarray:
+        """Flag rows of *X* outside the training envelope."""
+        return self.mahalanobis(X) > self.ood_threshold(alpha)
+
+    def compare(self, X, alpha: float = 0.05, ood_alpha: float = 0.01) -> DriftReport:
+        """Compare a batch *X* with the reference.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Incoming batch, columns in :attr:`features` order.
+        alpha : float
+            Significance level of the two-sample KS critical value.
+        ood_alpha : float
+            Tail probability of the chi-square cutoff for OOD rows.
+        """
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        if X.shape[1] != len(self.features):
+            raise ValueError(f"Expected {len(self.features)} feature columns, got {X.shape[1]}")
+        m = len(X)
+        counts = self._bin_counts(X)
+        eps = 1e-4
+        ref_p = np.maximum(self.counts / self.n, eps)
+        batch_p = np.maximum(counts / max(m, 1), eps)
+        psi = ((batch_p - ref_p) * np.log(batch_p / ref_p)).sum(axis=1)
+
+        ref_cdf = np.cumsum(self.counts, axis=1) / self.n
+        batch_cdf = np.cumsum(counts, axis=1) / max(m, 1)
+        ks = np.abs(batch_cdf - ref_cdf).max(axis=1)
+        c_alpha = np.sqrt(-0.5 * np.log(alpha / 2))
+        ks_critical = c_alpha * np.sqrt((self.n + m) / (self.n * max(m, 1)))
+
+        return DriftReport(
+            features=self.features,
+            psi=psi,
+            ks=ks,
+            ks_critical=float(ks_critical),
+            mahalanobis=self.mahalanobis(X),
+            ood_threshold=self.ood_threshold(ood_alpha),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "features": self.features,
+            "n": self.n,
+            **{
+                k: getattr(self, k).tolist()
+                for k in ("edges", "counts", "lower", "upper", "mean", "cov")
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DriftReference":
+        return cls(**data)
+
+
+def save_reference(reference: DriftReference, name: str, registry_dir: Path | None = None) -> Path:
+    """Store *reference* as ``drift.json`` in a registry entry."""
+    path = _model_dir(name, registry_dir) / DRIFT_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(reference.to_dict()), encoding="utf-8")
+    return path
+
+
+def load_reference(name: str, registry_dir: Path | None = None) -> DriftReference | None:
+    """Load the drift reference of a registry entry, or ``None`` if it has none."""
+    path = _model_dir(name, registry_dir) / DRIFT_FILE
+    if not path.exists():
+        return None
+    return DriftReference.from_dict(json.loads(path.read_text(encoding="utf-8")))
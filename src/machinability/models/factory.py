@@ -0,0 +1,71 @@
+"""Estimator factory shared by the dashboard, CLI and model utilities (RQ4)."""
+
+import importlib
+from collections.abc import Mapping
+
+from src.machinability.utils.cache import memoize
+from src.machinability.utils.instrument import timed
+
+
+class _EstimatorMap(Mapping):
+    """Display name -> estimator class, importing each class on first access.
+
+    Listing the names (e.g. for a selectbox or ``--models`` choices) does
+    not import scikit-learn.
+    """
+
+    def __init__(self, paths: dict[str, str]):
+        self._paths = paths
+        self._classes = {}
+
+    def __getitem__(self, name: str):
+        if name not in self._classes:
+            module, _, attr = self._paths[name].rpartition(".")
+            self._classes[name] = getattr(importlib.import_module(module), attr)
+        return self._classes[name]
+
+    def __iter__(self):
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+
+MODEL_MAP = _EstimatorMap(
+    {
+        "Linear Regression": "sklearn.linear_model.LinearRegression",
+        "SVR": "sklearn.svm.SVR",
+        "Random Forest": "sklearn.ensemble.RandomForestRegressor",
+        "Gradient Boosting": "sklearn.ensemble.GradientBoostingRegressor",
+    }
+)
+
+TREE_MODELS = ("Random Forest", "Gradient Boosting")
+
+
+def make_model(name: str):
+    """Instantiate an sklearn estimator by display name."""
+    cls = MODEL_MAP[name]
+    if name == "SVR":
+        return cls(kernel="rbf", C=10.0, epsilon=0.1)
+    if name == "Random Forest":
+        return cls(n_estimators=100, random_state=42)
+    if name == "Gradient Boosting":
+        return cls(n_estimators=100, learning_rate=0.1, random_state=42)
+    return cls()
+
+
+@memoize
+def _fit(estimator, X, y):
+    return estimator.fit(X, y)
+
+
+@timed(rows="X")
+def fit_model(name: str, X, y):
+    """Instantiate and fit a factory model.
+
+    Memoised on the estimator parameters and the training data when
+    caching is enabled (see :mod:`src.machinability.utils.cache`), so a
+    warm rerun returns the stored fit instead of refitting.
+    """
+    return _fit(make_model(name), X, y)
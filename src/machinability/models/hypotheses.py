@@ -0,0 +1,171 @@
+"""Evaluation of the RQ4 hypotheses H4a-H4d from trained-model results.
+
+Shared by the dashboard models page and the ``machinability hypotheses``
+command. Results are the comparison-table rows produced by the models
+page (or ``machinability train``): dicts with ``model``, ``features``,
+``target``, ``R2``, ``MAPE`` and ``Baseline_MAPE`` (MAPE in percent).
+"""
+
+from dataclasses import asdict, dataclass
+
+from src.machinability.models.factory import TREE_MODELS
+
+HYPOTHESES = {
+    "H4a": {
+        "description": (
+            "Conductivity-based features improve predictive accuracy for "
+            "tool life beyond hardness-only baselines."
+        ),
+        "criterion": "MAPE < 15% AND R² > 0.75 for tool_life target",
+    },
+    "H4b": {
+        "description": (
+            "ML models incorporating conductivity achieve > 10% lower MAPE "
+            "than the HardnessOnly baseline."
+        ),
+        "criterion": "Relative MAPE improvement > 10% vs baseline",
+    },
+    "H4c": {
+        "description": (
+            "Random Forest or Gradient Boosting outperforms linear models "
+            "when conductivity features are included."
+        ),
+        "criterion": "Non-linear model R² exceeds linear model R²",
+    },
+    "H4d": {
+        "description": (
+            "Feature importance analysis ranks conductivity among the top-3 predictors."
+        ),
+        "criterion": "Conductivity in top-3 features by permutation importance (test split)",
+    },
+}
+
+LINEAR_MODELS = ("Linear Regression", "SVR")
+
+SUPPORTED = "supported"
+NOT_SUPPORTED = "not supported"
+INSUFFICIENT = "insufficient data"
+
+
+@dataclass
+class HypothesisResult:
+    """Outcome of one hypothesis check."""
+
+    hypothesis: str
+    status: str
+    message: str
+
+    @property
+    def passed(self) -> bool | None:
+        """True/False when evaluated, ``None`` when data were insufficient."""
+        return None if self.status == INSUFFICIENT else self.status == SUPPORTED
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _verdict(hyp: str, passed: bool, message: str) -> HypothesisResult:
+    return HypothesisResult(hyp, SUPPORTED if passed else NOT_SUPPORTED, message)
+
+
+def _h4a(results) -> HypothesisResult:
+    tool_life = [r for r in results if r["target"] == "tool_life"]
+    if not tool_life:
+        return HypothesisResult("H4a", INSUFFICIENT, "No models trained on tool_life target yet.")
+    best = min(tool_life, key=lambda r: r["MAPE"])
+    return _verdict(
+        "H4a",
+        best["MAPE"] < 15.0 and best["R2"] > 0.75,
+        f"Best model ({best['model']}): MAPE = {best['MAPE']:.2f}%, R² = {best['R2']:.4f}",
+    )
+
+
+def _h4b(results) -> HypothesisResult:
+    improvements = [
+        (r, (r["Baseline_MAPE"] - r["MAPE"]) / r["Baseline_MAPE"] * 100)
+        for r in results
+        if r.get("Baseline_MAPE", 0) > 0
+    ]
+    if not improvements:
+        return HypothesisResult("H4b", INSUFFICIENT, "No baseline comparisons available.")
+    best, imp = max(improvements, key=lambda x: x[1])
+    passed = imp > 10.0
+    message = (
+        f"Best improvement ({best['model']} on {best['target']}): {imp:.1f}% MAPE "
+        f"reduction vs baseline"
+    )
+    return _verdict("H4b", passed, message if passed else message + " (need > 10%)")
+
+
+def _h4c(results) -> HypothesisResult:
+    linear = [r for r in results if r["model"] in LINEAR_MODELS]
+    nonlinear = [r for r in results if r["model"] in TREE_MODELS]
+    if not linear or not nonlinear:
+        return HypothesisResult(
+            "H4c",
+            INSUFFICIENT,
+            "Need at least one linear model (Linear Regression/SVR) and one non-linear "
+            "model (Random Forest/Gradient Boosting) trained on the same target to evaluate.",
+        )
+    best_lin = max(linear, key=lambda r: r["R2"])
+    best_nl = max(nonlinear, key=lambda r: r["R2"])
+    passed = best_nl["R2"] > best_lin["R2"]
+    return _verdict(
+        "H4c",
+        passed,
+        f"{best_nl['model']} (R² = {best_nl['R2']:.4f}) {'>' if passed else '<='} "
+        f"{best_lin['model']} (R² = {best_lin['R2']:.4f})",
+    )
+
+
+def _h4d(results, top_features) -> HypothesisResult:
+    trees = [r for r in results if r["model"] in TREE_MODELS and "conductivity" in r["features"]]
+    if not trees:
+        return HypothesisResult(
+            "H4d",
+            INSUFFICIENT,
+            "Need a Random Forest or Gradient Boosting model trained with conductivity "
+            "in the feature set to evaluate.",
+        )
+    best = max(trees, key=lambda r: r["R2"])
+    top3 = top_features(best)
+    if top3 is None:
+        return HypothesisResult(
+            "H4d",
+            INSUFFICIENT,
+            f"No feature importances for {best['model']}; retrain it to evaluate H4d.",
+        )
+    top3 = list(top3)[:3]
+    passed = "conductivity" in top3
+    message = f"Top-3 features for {best['model']}: {top3}"
+    return _verdict("H4d", passed, message if passed else message + " (conductivity not in top 3)")
+
+
+def evaluate_hypotheses(results: list[dict], top_features=None) -> dict[str, HypothesisResult]:
+    """Check H4a-H4d against a list of trained-model results.
+
+    Parameters
+    ----------
+    results : list of dict
+        Comparison-table rows (see module docstring).
+    top_features : callable, optional
+        ``top_features(result) -> list[str] | None`` giving the features of
+        a result ranked by permutation importance; ``None`` marks H4d as
+        not evaluable. Defaults to the row's ``top_features`` entry.
+
+    Returns
+    -------
+    dict
+        :class:`HypothesisResult` per hypothesis id.
+    """
+    if top_features is None:
+
+        def top_features(result):
+            return result.get("top_features")
+
+    return {
+        "H4a": _h4a(results),
+        "H4b": _h4b(results),
+        "H4c": _h4c(results),
+        "H4d": _h4d(results, top_features),
+    }
@@ -0,0 +1,227 @@
+"""Incremental retraining as new machined specimens arrive (RQ4).
+
+:class:`IncrementalTrainer` keeps a factory model current without a full
+retrain per batch:
+
+* tree ensembles grow extra trees via ``warm_start``; existing trees are
+  kept and only the new ones are fitted, on all data seen so far;
+* linear regression is solved from running normal-equation statistics
+  (``ZᵀZ``, ``Zᵀy`` with ``Z = [1, X]``); no raw data are kept, so an
+  update costs O(batch) in time and memory, and a "full refit" only
+  resets the drift reference;
+* SVR has no incremental form and is always refitted.
+
+A :class:`RefitPolicy` compares each batch with the feature distribution
+seen at the last full fit and requests a full refit when it has drifted.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.machinability.models.factory import TREE_MODELS, make_model
+
+
+class FeatureMoments:
+    """Running count, mean and variance of each feature column."""
+
+    def __init__(self, n_features: int):
+        self.n = 0
+        self.sum = np.zeros(n_features)
+        self.sum_sq = np.zeros(n_features)
+
+    def copy(self) -> "FeatureMoments":
+        other = FeatureMoments(len(self.sum))
+        other.n, other.sum, other.sum_sq = self.n, self.sum.copy(), self.sum_sq.copy()
+        return other
+
+    def update(self, X) -> "FeatureMoments":
+        X = np.asarray(X, dtype=float)
+        self.n += len(X)
+        self.sum += X.sum(axis=0)
+        self.sum_sq += np.square(X).sum(axis=0)
+        return self
+
+    @property
+    def mean(self) -> np.ndarray:
+        return self.sum / self.n
+
+    @property
+    def var(self) -> np.ndarray:
+        return np.maximum(self.sum_sq / self.n - self.mean**2, 0.0) * self.n / max(self.n - 1, 1)
+
+
+@dataclass
+class RefitDecision:
+    """Outcome of :meth:`RefitPolicy.decide`."""
+
+    refit: bool
+    reason: str
+    mean_shift: np.ndarray
+    var_ratio: np.ndarray
+
+
+@dataclass
+class RefitPolicy:
+    """Decide between an incremental update and a full refit.
+
+    Parameters
+    ----------
+    max_mean_shift : float
+        Largest tolerated standardised mean difference
+        ``|mean_batch - mean_ref| / sd_ref`` of any feature.
+    max_var_ratio : float
+        Largest tolerated variance ratio (either direction) of any feature.
+    max_growth : float
+        Refit once the data added since the last full fit exceed this
+        fraction of the data used for it.
+    min_batch : int
+        Batches smaller than this are never judged as drifted (their
+        moments are too noisy); they are added incrementally.
+    """
+
+    max_mean_shift: float = 0.5
+    max_var_ratio: float = 2.0
+    max_growth: float = 1.0
+    min_batch: int = 5
+
+    def decide(self, reference: FeatureMoments, added: int, X_new) -> RefitDecision:
+        """Compare *X_new* with the reference moments of the last full fit."""
+        batch = FeatureMoments(reference.sum.shape[0]).update(X_new)
+        sd_ref = np.sqrt(reference.var)
+        safe_sd = np.where(sd_ref > 0, sd_ref, 1.0)
+        shift = np.abs(batch.mean - reference.mean) / safe_sd
+        ratio = np.ones_like(shift)
+        if batch.n > 1:
+            var_ref = np.where(reference.var > 0, reference.var, np.inf)
+            ratio = batch.var / var_ref
+            ratio = np.maximum(ratio, 1.0 / np.where(ratio > 0, ratio, np.inf))
+            ratio = np.where(np.isfinite(ratio), ratio, 1.0)
+
+        if added + batch.n > self.max_growth * reference.n:
+            return RefitDecision(True, "data growth", shift, ratio)
+        if batch.n >= self.min_batch:
+            if np.any(shift > self.max_mean_shift):
+                return RefitDecision(True, "mean shift", shift, ratio)
+            if np.any(ratio > self.max_var_ratio):
+                return RefitDecision(True, "variance change", shift, ratio)
+        return RefitDecision(False, "incremental", shift, ratio)
+
+
+class IncrementalTrainer:
+    """Keep a factory model current as specimen batches arrive.
+
+    Parameters
+    ----------
+    model : str
+        Factory display name (e.g. ``"Random Forest"``).
+    trees_per_batch : int
+        Trees added to a tree ensemble per incremental update.
+    policy : RefitPolicy, optional
+        Refit policy (default thresholds if omitted).
+
+    Attributes
+    ----------
+    estimator_ : fitted estimator
+        Current model.
+    X_, y_ : np.ndarray or None
+        All data seen so far, kept for tree and SVR refits (``None`` for
+        linear regression, which only keeps normal-equation statistics).
+    n_samples_ : int
+        Number of samples seen so far.
+    history_ : list of dict
+        One record per :meth:`fit` / :meth:`update` call.
+    """
+
+    def __init__(
+        self,
+        model: str = "Random Forest",
+        trees_per_batch: int = 10,
+        policy: RefitPolicy | None = None,
+    ):
+        self.model = model
+        self.trees_per_batch = trees_per_batch
+        self.policy = policy or RefitPolicy()
+
+    def fit(self, X, y) -> "IncrementalTrainer":
+        """Full fit on *(X, y)*; resets the drift reference."""
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+        linear = self.model == "Linear Regression"
+        self.X_, self.y_ = (None, None) if linear else (X, y)
+        self.n_samples_ = len(X)
+        self.reference_ = FeatureMoments(X.shape[1]).update(X)
+        self._seen = self.reference_.copy()
+        self.added_since_refit_ = 0
+        self._gram = None
+        self.estimator_ = make_model(self.model)
+        if linear:
+            self._gram = np.zeros((X.shape[1] + 1, X.shape[1] + 1))
+            self._zty = np.zeros(X.shape[1] + 1)
+            self._update_linear(X, y)
+            self.estimator_.n_features_in_ = X.shape[1]
+        else:
+            if self.model in TREE_MODELS:
+                self.estimator_.set_params(warm_start=True)
+            self.estimator_.fit(X, y)
+        self.history_ = getattr(self, "history_", []) + [
+            {"n_samples": len(X), "action": "full fit", "reason": "fit"}
+        ]
+        return self
+
+    def update(self, X_new, y_new) -> RefitDecision:
+        """Add a batch, refitting fully if the policy requests it."""
+        X_new = np.asarray(X_new, dtype=float)
+        y_new = np.asarray(y_new, dtype=float)
+        decision = self.policy.decide(self.reference_, self.added_since_refit_, X_new)
+        if self.model not in (*TREE_MODELS, "Linear Regression"):
+            decision.refit, decision.reason = True, "no incremental form"
+
+        if self._gram is not None:
+            # The normal equations already give the full-data solution; a
+            # refit only moves the drift reference to all data seen so far.
+            self._update_linear(X_new, y_new)
+            self._seen.update(X_new)
+            self.n_samples_ += len(X_new)
+            if decision.refit:
+                self.reference_ = self._seen.copy()
+                self.added_since_refit_ = 0
+            else:
+                self.added_since_refit_ += len(X_new)
+            self.history_.append(
+                {
+                    "n_samples": self.n_samples_,
+                    "action": "full fit" if decision.refit else "incremental",
+                    "reason": decision.reason,
+                }
+            )
+            return decision
+
+        X = np.concatenate([self.X_, X_new])
+        y = np.concatenate([self.y_, y_new])
+        if decision.refit:
+            self.fit(X, y)
+            self.history_[-1]["reason"] = decision.reason
+            return decision
+
+        self.X_, self.y_ = X, y
+        self.n_samples_ = len(X)
+        self.added_since_refit_ += len(X_new)
+        est = self.estimator_
+        est.set_params(n_estimators=est.n_estimators + self.trees_per_batch)
+        est.fit(X, y)
+        self.history_.append(
+            {"n_samples": len(X), "action": "incremental", "reason": decision.reason}
+        )
+        return decision
+
+    def _update_linear(self, X, y) -> None:
+        Z = np.column_stack([np.ones(len(X)), X])
+        self._gram += Z.T @ Z
+        self._zty += Z.T @ y
+        beta = np.linalg.lstsq(self._gram, self._zty, rcond=None)[0]
+        self.estimator_.intercept_ = float(beta[0])
+        self.estimator_.coef_ = beta[1:]
+
+    def predict(self, X) -> np.ndarray:
+        return self.estimator_.predict(np.asarray(X, dtype=float))
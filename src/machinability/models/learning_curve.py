@@ -0,0 +1,193 @@
+"""Learning curves and sample-size scaling for the RQ4 models.
+
+Answers "how many machining trials are enough?" for the required sample
+sizes of ``04_MODELS/hypotheses.md`` (n ≥ 15, 30, 50). For each repeat a
+single random permutation of the data defines nested subsamples
+(the first 15 rows are contained in the first 30, and so on), so curves
+are not confounded by drawing unrelated samples per size. Every factory
+model is cross-validated on every subsample; the (model, repeat, size)
+tasks run in parallel and each records fit/predict wall time and peak
+traced memory.
+
+Usage::
+
+    python -m src.machinability.models.learning_curve --data synthetic --n 200
+    python -m src.machinability.models.learning_curve --data data/processed/merged.csv
+"""
+
+import argparse
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.model_selection import KFold
+
+from src.machinability.models.baseline import evaluate_model
+from src.machinability.models.factory import MODEL_MAP, make_model
+from src.machinability.utils.config import RESULTS_DIR
+
+# Required sample sizes from the hypothesis table (04_MODELS/hypotheses.md)
+REQUIRED_N = (15, 30, 50)
+
+_SUMMARY_METRICS = ("r2", "mape", "rmse", "fit_s", "predict_s", "peak_mb")
+
+
+def _run_task(
+    model_name: str, X: np.ndarray, y: np.ndarray, cv: int, seed: int, measure_memory: bool
+) -> dict:
+    """Cross-validate one model on one subsample; returns metrics and costs."""
+    y_oof = np.empty_like(y)
+    fit_s = predict_s = 0.0
+    folds = KFold(n_splits=min(cv, len(X)), shuffle=True, random_state=seed)
+    for train_idx, test_idx in folds.split(X):
+        model = make_model(model_name)
+        t0 = time.perf_counter()
+        model.fit(X[train_idx], y[train_idx])
+        t1 = time.perf_counter()
+        y_oof[test_idx] = model.predict(X[test_idx])
+        fit_s += t1 - t0
+        predict_s += time.perf_counter() - t1
+
+    peak_mb = np.nan
+    if measure_memory:
+        # Traced separately: tracemalloc slows allocation-heavy fits ~10x,
+        # which would distort the timings above.
+        tracemalloc.start()
+        try:
+            make_model(model_name).fit(X, y).predict(X)
+            peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+        finally:
+            tracemalloc.stop()
+    return {
+        **evaluate_model(y, y_oof),
+        "fit_s": fit_s / folds.n_splits,
+        "predict_s": predict_s / folds.n_splits,
+        "peak_mb": peak_mb,
+    }
+
+
+def learning_curve(
+    X,
+    y,
+    sizes=(*REQUIRED_N, 80),
+    models: list[str] | None = None,
+    n_repeats: int = 5,
+    cv: int = 5,
+    n_jobs: int | None = None,
+    random_state: int = 42,
+    measure_memory: bool = True,
+) -> pd.DataFrame:
+    """Cross-validated performance and cost on nested subsamples.
+
+    Parameters
+    ----------
+    X : array-like of shape (n_samples, n_features)
+        Feature matrix.
+    y : array-like of shape (n_samples,)
+        Target.
+    sizes : sequence of int
+        Subsample sizes; sizes larger than the data are skipped.
+    models : list of str, optional
+        Factory display names (default: every model in ``MODEL_MAP``).
+    n_repeats : int
+        Independent permutations (each gives one nested sequence).
+    cv : int
+        Folds per subsample; out-of-fold predictions are pooled, so small
+        subsamples still give one R²/MAPE/RMSE each.
+    n_jobs : int, optional
+        Parallel workers over (model, repeat, size) tasks (joblib semantics).
+    random_state : int
+        Seed for permutations and folds.
+    measure_memory : bool
+        Record the peak traced memory of one extra fit + predict on the
+        full subsample (``peak_mb``; NaN when disabled).
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per (model, size, repeat) with ``r2``, ``mape``, ``rmse``,
+        mean ``fit_s`` / ``predict_s`` per fold and ``peak_mb``.
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    models = list(models or MODEL_MAP)
+    sizes = sorted({int(s) for s in sizes if cv <= s <= len(X)})
+    if not sizes:
+        raise ValueError(f"No subsample size between {cv} and {len(X)}")
+
+    seeds = np.random.SeedSequence(random_state).generate_state(n_repeats)
+    orders = [np.random.default_rng(s).permutation(len(X)) for s in seeds]
+    tasks = [(name, size, rep) for rep in range(n_repeats) for size in sizes for name in models]
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_run_task)(
+            name,
+            X[orders[rep][:size]],
+            y[orders[rep][:size]],
+            cv,
+            int(seeds[rep]),
+            measure_memory,
+        )
+        for name, size, rep in tasks
+    )
+    return pd.DataFrame(
+        [
+            {"model": name, "size": size, "repeat": rep, **res}
+            for (name, size, rep), res in zip(tasks, results)
+        ]
+    )
+
+
+def summarise_learning_curve(results: pd.DataFrame) -> pd.DataFrame:
+    """Mean and standard deviation over repeats per (model, size)."""
+    summary = results.groupby(["model", "size"])[list(_SUMMARY_METRICS)].agg(["mean", "std"])
+    summary.columns = [f"{metric}_{stat}" for metric, stat in summary.columns]
+    return summary.reset_index()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point: write the results table and plot."""
+    from src.machinability.data.synthetic import generate_specimens
+    from src.machinability.visualization.plots import learning_curve_plot
+
+    parser = argparse.ArgumentParser(description="Learning curves for the RQ4 models.")
+    parser.add_argument("--data", default="synthetic", help="'synthetic' or a CSV path")
+    parser.add_argument("--n", type=int, default=200, help="Synthetic sample size")
+    parser.add_argument("--features", nargs="+", default=["conductivity", "hardness"])
+    parser.add_argument("--target", default="tool_life")
+    parser.add_argument("--models", nargs="+", default=list(MODEL_MAP), choices=list(MODEL_MAP))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[*REQUIRED_N, 80, 120, 200])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--cv", type=int, default=5)
+    parser.add_argument("--n-jobs", type=int, default=-1)
+    parser.add_argument("--no-memory", action="store_true", help="Skip peak-memory tracing")
+    parser.add_argument("--out", type=Path, default=RESULTS_DIR / "learning_curve")
+    args = parser.parse_args(argv)
+
+    df = generate_specimens(args.n) if args.data == "synthetic" else pd.read_csv(args.data)
+    df = df.dropna(subset=[*args.features, args.target])
+    results = learning_curve(
+        df[args.features].to_numpy(),
+        df[args.target].to_numpy(),
+        sizes=args.sizes,
+        models=args.models,
+        n_repeats=args.repeats,
+        cv=args.cv,
+        n_jobs=args.n_jobs,
+        measure_memory=not args.no_memory,
+    )
+    summary = summarise_learning_curve(results)
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    results.to_csv(args.out / "learning_curve_runs.csv", index=False)
+    summary.to_csv(args.out / "learning_curve_summary.csv", index=False)
+    fig = learning_curve_plot(summary, required_n=REQUIRED_N)
+    fig.savefig(args.out / "learning_curve.png", dpi=150)
+    print(summary.to_string(index=False))
+    print(f"Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Multi-target training of tool life, Ra and Fc in one pass (RQ4).
+
+The machinability targets share features and specimens, so training them
+as separate runs repeats the split, the scaling and (for models that
+support several outputs) the fit itself. :class:`MultiTargetRegressor`
+fits all targets together:
+
+* Random Forest grows one forest on the ``(n, k)`` target matrix;
+* linear regression solves all targets with one least-squares call;
+* SVR and Gradient Boosting fall back to one estimator per target, on
+  the same (optionally scaled) inputs.
+
+:func:`train_multi_target` runs the models-page workflow (one train/test
+split, k-fold CV) for all targets at once and reports per-target metrics
+from the vectorised :func:`evaluate_model`.
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, RegressorMixin, clone
+from sklearn.model_selection import KFold, train_test_split
+from sklearn.preprocessing import StandardScaler
+
+from src.machinability.models.baseline import evaluate_model
+from src.machinability.models.factory import make_model
+from src.machinability.utils.instrument import timed
+
+TARGETS = ("tool_life", "Ra", "Fc")
+
+# Factory models whose sklearn estimator accepts a 2-D target natively
+NATIVE_MULTI_OUTPUT = ("Linear Regression", "Random Forest")
+
+
+class MultiTargetRegressor:
+    """Fit several targets with one shared preprocessing step.
+
+    Parameters
+    ----------
+    model : str
+        Factory display name.
+    scale : bool
+        Standardise the inputs with one scaler shared by all targets.
+    """
+
+    def __init__(self, model: str = "Random Forest", scale: bool = False):
+        self.model = model
+        self.scale = scale
+
+    @timed(rows="X")
+    def fit(self, X, Y) -> "MultiTargetRegressor":
+        """Fit on ``X`` (n, p) and the target matrix ``Y`` (n, k)."""
+        X = np.asarray(X, dtype=float)
+        Y = np.asarray(Y, dtype=float)
+        if Y.ndim != 2:
+            raise ValueError("Y must be a 2-D (n_samples, n_targets) array")
+        self.scaler_ = StandardScaler().fit(X) if self.scale else None
+        Xt = self.scaler_.transform(X) if self.scale else X
+        template = make_model(self.model)
+        # A joint multi-output fit sums squared errors over targets, so the
+        # targets are standardised first: otherwise Fc (N, ~10³) would
+        # dominate the forest's split criterion over Ra (µm, ~1).
+        self.y_mean_ = Y.mean(axis=0)
+        self.y_scale_ = np.where(Y.std(axis=0) > 0, Y.std(axis=0), 1.0)
+        if self.model in NATIVE_MULTI_OUTPUT:
+            self.estimators_ = [template.fit(Xt, (Y - self.y_mean_) / self.y_scale_)]
+        else:
+            self.estimators_ = [clone(template).fit(Xt, Y[:, k]) for k in range(Y.shape[1])]
+        self.n_targets_ = Y.shape[1]
+        return self
+
+    def predict(self, X) -> np.ndarray:
+        """Predict all targets; returns an (n, k) array."""
+        X = np.asarray(X, dtype=float)
+        Xt = self.scaler_.transform(X) if self.scaler_ is not None else X
+        if len(self.estimators_) == 1:
+            Z = np.asarray(self.estimators_[0].predict(Xt)).reshape(len(X), self.n_targets_)
+            return self.y_mean_ + Z * self.y_scale_
+        return np.column_stack([est.predict(Xt) for est in self.estimators_])
+
+    def target(self, index: int) -> "TargetView":
+        """Single-target view of target *index*, e.g. for permutation importance."""
+        return TargetView(self, index)
+
+
+class TargetView(RegressorMixin, BaseEstimator):
+    """One column of a fitted :class:`MultiTargetRegressor` as a regressor.
+
+    ``predict`` returns that target only and ``score`` is its R², so the
+    view can be passed to sklearn scorers and
+    :class:`~src.machinability.models.store.ModelStore`. It is read-only:
+    refit the parent regressor instead.
+    """
+
+    def __init__(self, regressor: MultiTargetRegressor, index: int):
+        self.regressor = regressor
+        self.index = index
+
+    def fit(self, X, y):
+        raise TypeError(
+            "TargetView is a read-only view of a fitted MultiTargetRegressor; "
+            "refit the parent regressor on all targets instead"
+        )
+
+    def predict(self, X) -> np.ndarray:
+        return self.regressor.predict(X)[:, self.index]
+
+
+def train_multi_target(
+    df: pd.DataFrame,
+    features: list[str],
+    targets=TARGETS,
+    model: str = "Random Forest",
+    test_size: float = 0.2,
+    cv_folds: int = 5,
+    scale: bool = False,
+    random_state: int = 42,
+) -> dict:
+    """Train and evaluate one model on several targets with shared splits.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Specimen table containing *features* and *targets*.
+    features : list of str
+        Input columns.
+    targets : sequence of str
+        Target columns (default: tool life, Ra, Fc).
+    model : str
+        Factory display name.
+    test_size : float
+        Hold-out fraction of the shared train/test split.
+    cv_folds : int
+        Folds of the shared k-fold CV on the training split.
+    scale : bool
+        Standardise inputs (one scaler shared by all targets).
+    random_state : int
+        Seed for the split and folds.
+
+    Returns
+    -------
+    dict
+        ``estimator`` (fitted :class:`MultiTargetRegressor`), ``metrics``
+        (DataFrame indexed by target: r2, mape, rmse on the test split),
+        ``cv_r2`` (DataFrame: one row per fold, one column per target) and
+        the split arrays ``X_train``, ``Y_train``, ``X_test``, ``Y_test``,
+        ``Y_pred``.
+    """
+    targets = list(targets)
+    data = df.dropna(subset=[*features, *targets])
+    X = data[features].to_numpy(dtype=float)
+    Y = data[targets].to_numpy(dtype=float)
+    X_train, X_test, Y_train, Y_test = train_test_split(
+        X, Y, test_size=test_size, random_state=random_state
+    )
+
+    folds = KFold(n_splits=cv_folds, shuffle=True, random_state=random_state)
+    cv_r2 = [
+        evaluate_model(
+            Y_train[test_idx],
+            MultiTargetRegressor(model, scale)
+            .fit(X_train[train_idx], Y_train[train_idx])
+            .predict(X_train[test_idx]),
+        )["r2"]
+        for train_idx, test_idx in folds.split(X_train)
+    ]
+
+    estimator = MultiTargetRegressor(model, scale).fit(X_train, Y_train)
+    Y_pred = estimator.predict(X_test)
+    metrics = pd.DataFrame(evaluate_model(Y_test, Y_pred), index=pd.Index(targets, name="target"))
+    return {
+        "estimator": estimator,
+        "metrics": metrics,
+        "cv_r2": pd.DataFrame(cv_r2, columns=targets),
+        "X_train": X_train,
+        "Y_train": Y_train,
+        "X_test": X_test,
+        "Y_test": Y_test,
+        "Y_pred": Y_pred,
+    }
@@ -0,0 +1,92 @@
+"""ONNX export of trained models (RQ4).
+
+Converts any factory estimator (and :class:`HardnessOnlyBaseline`) to an
+ONNX graph with a single float input ``X`` of shape ``(n, n_features)``
+and output ``variable``. Exported graphs are scored by
+:mod:`src.machinability.models.onnx_scoring`, which needs only NumPy and
+onnxruntime.
+
+Requires the optional ``onnx`` extra (``skl2onnx``, ``onnx``).
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+from src.machinability.models.baseline import HardnessOnlyBaseline
+from src.machinability.models.registry import _META_FILE, _model_dir, load_metadata, load_model
+
+ONNX_FILE = "model.onnx"
+
+
+def _baseline_to_onnx(model: HardnessOnlyBaseline, opset: int):
+    from onnx import TensorProto, helper, numpy_helper
+
+    coef = np.asarray(model.coef_, dtype=np.float32).reshape(1, -1)
+    intercept = np.asarray(model.intercept_, dtype=np.float32).reshape(1, -1)
+    graph = helper.make_graph(
+        [
+            helper.make_node("Mul", ["X", "coef"], ["scaled"]),
+            helper.make_node("Add", ["scaled", "intercept"], ["variable"]),
+        ],
+        "hardness_only_baseline",
+        [helper.make_tensor_value_info("X", TensorProto.FLOAT, [None, 1])],
+        [helper.make_tensor_value_info("variable", TensorProto.FLOAT, [None, coef.shape[1]])],
+        initializer=[
+            numpy_helper.from_array(coef, "coef"),
+            numpy_helper.from_array(intercept, "intercept"),
+        ],
+    )
+    # Pin the IR version to the opset rather than the (newer) onnx package default
+    return helper.make_model(graph, opset_imports=[helper.make_opsetid("", opset)], ir_version=8)
+
+
+def to_onnx(estimator, n_features: int, opset: int = 17):
+    """Convert a fitted estimator to an ONNX ``ModelProto``.
+
+    Parameters
+    ----------
+    estimator : fitted estimator
+        A factory model (linear regression, SVR, random forest, gradient
+        boosting) or :class:`HardnessOnlyBaseline`.
+    n_features : int
+        Number of input columns.
+    opset : int
+        Target ONNX opset.
+
+    Returns
+    -------
+    onnx.ModelProto
+    """
+    if isinstance(estimator, HardnessOnlyBaseline):
+        return _baseline_to_onnx(estimator, opset)
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+
+    return convert_sklearn(
+        estimator,
+        initial_types=[("X", FloatTensorType([None, n_features]))],
+        target_opset={"": opset, "ai.onnx.ml": 3},
+    )
+
+
+def export_onnx(name: str, registry_dir: Path | None = None, opset: int = 17) -> Path:
+    """Write ``model.onnx`` next to a registered model's joblib file.
+
+    The entry's ``meta.json`` records the ONNX file name so scoring
+    processes can find it without loading the joblib estimator.
+
+    Returns
+    -------
+    Path
+        Path of the written ONNX file.
+    """
+    meta = load_metadata(name, registry_dir)
+    proto = to_onnx(load_model(name, registry_dir), len(meta["features"]), opset=opset)
+    out = _model_dir(name, registry_dir)
+    path = out / ONNX_FILE
+    path.write_bytes(proto.SerializeToString())
+    meta["onnx"] = ONNX_FILE
+    (out / _META_FILE).write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    return path
@@ -0,0 +1,98 @@
+"""Lightweight ONNX scoring of registered models (RQ4).
+
+This module deliberately imports only NumPy and onnxruntime (plus the
+standard library), so an inference process does not pay for importing
+sklearn, pandas or Streamlit. Sessions are created once per model file
+and reused; inputs are scored in fixed-size batches.
+
+Export models first with :func:`src.machinability.models.onnx_export.export_onnx`.
+"""
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from src.machinability.utils.config import MODEL_REGISTRY_DIR
+
+
+class OnnxScorer:
+    """Persistent onnxruntime session for one exported model.
+
+    Parameters
+    ----------
+    path : str or Path
+        ONNX file.
+    features : list of str, optional
+        Input column names, needed only for :meth:`predict_rows`.
+    batch_size : int
+        Rows per ``session.run`` call.
+    n_threads : int
+        Intra-op threads (0 = onnxruntime default).
+    """
+
+    def __init__(
+        self, path, features: list[str] | None = None, batch_size: int = 65_536, n_threads: int = 0
+    ):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = n_threads
+        self.session = ort.InferenceSession(
+            str(path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.input_name = self.session.get_inputs()[0].name
+        self.output_name = self.session.get_outputs()[0].name
+        self.features = list(features) if features is not None else None
+        self.batch_size = batch_size
+
+    def predict(self, X) -> np.ndarray:
+        """Score a ``(n_samples, n_features)`` matrix.
+
+        Single-output models return a 1-D array, like ``estimator.predict``.
+        """
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        parts = [
+            self.session.run([self.output_name], {self.input_name: X[i : i + self.batch_size]})[0]
+            for i in range(0, len(X), self.batch_size)
+        ] or [np.empty((0, 1), dtype=np.float32)]
+        y = np.concatenate(parts).astype(float)
+        return y[:, 0] if y.ndim == 2 and y.shape[1] == 1 else y
+
+    def predict_rows(self, rows: list[dict]) -> np.ndarray:
+        """Score a list of ``{feature: value}`` records."""
+        if self.features is None:
+            raise ValueError("Scorer was created without feature names")
+        missing = {f for row in rows for f in self.features if f not in row}
+        if missing:
+            raise ValueError(f"Missing feature columns: {missing}")
+        return self.predict([[row[f] for f in self.features] for row in rows])
+
+
+@lru_cache(maxsize=32)
+def _scorer_cached(path: str, mtime_ns: int, features: tuple, batch_size: int) -> OnnxScorer:
+    return OnnxScorer(path, list(features), batch_size=batch_size)
+
+
+def load_scorer(
+    name: str, registry_dir: Path | None = None, batch_size: int = 65_536
+) -> OnnxScorer:
+    """Return the memoised scorer of an exported registry model.
+
+    The session is rebuilt only when ``model.onnx`` changes on disk.
+    """
+    if not re.fullmatch(r"[A-Za-z0-9][A-Za-z0-9._-]*", name):
+        raise ValueError(f"Invalid model name: {name!r}")
+    entry = Path(registry_dir or MODEL_REGISTRY_DIR) / name
+    meta_path = entry / "meta.json"
+    if not meta_path.exists():
+        raise FileNotFoundError(f"No registered model named {name!r} in {entry.parent}")
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    if "onnx" not in meta:
+        raise FileNotFoundError(f"Model {name!r} has not been exported to ONNX")
+    path = entry / meta["onnx"]
+    return _scorer_cached(str(path), path.stat().st_mtime_ns, tuple(meta["features"]), batch_size)
@@ -0,0 +1,183 @@
+"""Persistent registry of trained models with batch inference (RQ4).
+
+Each model is stored in its own directory under ``results/models/``::
+
+    <name>/model.joblib   compressed estimator
+    <name>/meta.json      features, target, metrics, data hash
+
+Models are loaded lazily on first use and memoised, so repeated scoring
+calls do not hit the disk again unless the stored file changes.
+"""
+
+import json
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from src.machinability.utils.config import MODEL_REGISTRY_DIR
+
+_MODEL_FILE = "model.joblib"
+_META_FILE = "meta.json"
+
+
+def _model_dir(name: str, registry_dir: Path | None) -> Path:
+    if not re.fullmatch(r"[A-Za-z0-9][A-Za-z0-9._-]*", name):
+        raise ValueError(f"Invalid model name: {name!r}")
+    return Path(registry_dir or MODEL_REGISTRY_DIR) / name
+
+
+def default_model_name(model: str, target: str, data_digest: str) -> str:
+    """Build a registry name such as ``random-forest_tool_life_1a2b3c4d``."""
+    slug = re.sub(r"[^a-z0-9]+", "-", model.lower()).strip("-")
+    return f"{slug}_{target}_{data_digest[:8]}"
+
+
+def save_model(
+    estimator,
+    name: str,
+    features: list[str],
+    target: str,
+    metrics: dict | None = None,
+    data_digest: str | None = None,
+    model_type: str | None = None,
+    registry_dir: Path | None = None,
+    compress: int = 3,
+) -> Path:
+    """Save a fitted estimator and its metadata to the registry.
+
+    Parameters
+    ----------
+    estimator : fitted estimator
+        Any picklable object with a ``predict`` method.
+    name : str
+        Registry name (letters, digits, ``.``, ``_``, ``-``). Overwrites an
+        existing entry of the same name.
+    features : list of str
+        Feature names, in the column order the estimator expects.
+    target : str
+        Target variable name.
+    metrics : dict, optional
+        Evaluation metrics (e.g. from :func:`evaluate_model`).
+    data_digest : str, optional
+        Hash of the training data.
+    model_type : str, optional
+        Model display name (default: estimator class name).
+    registry_dir : Path, optional
+        Registry root. Defaults to ``results/models``.
+    compress : int
+        joblib compression level (0-9).
+
+    Returns
+    -------
+    Path
+        Directory of the saved entry.
+    """
+    out = _model_dir(name, registry_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    joblib.dump(estimator, out / _MODEL_FILE, compress=compress)
+    meta = {
+        "name": name,
+        "model_type": model_type or type(estimator).__name__,
+        "features": list(features),
+        "target": target,
+        "metrics": {k: float(v) for k, v in (metrics or {}).items()},
+        "data_hash": data_digest,
+        "saved_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    (out / _META_FILE).write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    return out
+
+
+@lru_cache(maxsize=32)
+def _load_cached(path: str, mtime_ns: int):
+    return joblib.load(path)
+
+
+def load_model(name: str, registry_dir: Path | None = None):
+    """Load a registered estimator (memoised until the file changes)."""
+    path = _model_dir(name, registry_dir) / _MODEL_FILE
+    if not path.exists():
+        raise FileNotFoundError(f"No registered model named {name!r} in {path.parent.parent}")
+    return _load_cached(str(path), path.stat().st_mtime_ns)
+
+
+def load_metadata(name: str, registry_dir: Path | None = None) -> dict:
+    """Return the metadata dictionary of a registered model."""
+    path = _model_dir(name, registry_dir) / _META_FILE
+    if not path.exists():
+        raise FileNotFoundError(f"No registered model named {name!r} in {path.parent.parent}")
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def list_models(registry_dir: Path | None = None) -> pd.DataFrame:
+    """List registered models with their metadata, one row per model."""
+    root = Path(registry_dir or MODEL_REGISTRY_DIR)
+    rows = []
+    if root.is_dir():
+        for meta_path in sorted(root.glob(f"*/{_META_FILE}")):
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            metrics = meta.pop("metrics", {})
+            meta["features"] = ", ".join(meta["features"])
+            rows.append({**meta, **metrics})
+    return pd.DataFrame(rows)
+
+
+def predict_batch(
+    model,
+    data: pd.DataFrame | np.ndarray,
+    features: list[str] | None = None,
+    chunk_size: int = 50_000,
+    registry_dir: Path | None = None,
+) -> np.ndarray:
+    """Score a specimen table in fixed-size chunks.
+
+    Parameters
+    ----------
+    model : str or fitted estimator
+        Registry name or an estimator instance.
+    data : pd.DataFrame or np.ndarray
+        Specimens to score. DataFrames are reduced to the model's feature
+        columns (taken from the registry metadata when *model* is a name).
+    features : list of str, optional
+        Feature columns to use for a DataFrame; overrides the metadata.
+    chunk_size : int
+        Number of rows passed to ``predict`` at a time.
+    registry_dir : Path, optional
+        Registry root. Defaults to ``results/models``.
+
+    Returns
+    -------
+    np.ndarray
+        Predictions, one per row of *data*: shape ``(n,)``, or ``(n, k)``
+        for multi-output models.
+    """
+    if isinstance(model, str):
+        if features is None:
+            features = load_metadata(model, registry_dir)["features"]
+        model = load_model(model, registry_dir)
+
+    if isinstance(data, pd.DataFrame):
+        if features is not None:
+            missing = set(features) - set(data.columns)
+            if missing:
+                raise ValueError(f"Missing feature columns: {missing}")
+            data = data[features]
+        X = data.to_numpy(dtype=float)
+    else:
+        X = np.asarray(data, dtype=float)
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    out = np.empty(0, dtype=float)
+    for start in range(0, len(X), chunk_size):
+        stop = start + chunk_size
+        pred = np.asarray(model.predict(X[start:stop]), dtype=float)
+        if start == 0:  # size the output from the first chunk: (n,) or (n, k)
+            out = np.empty((len(X), *pred.shape[1:]), dtype=float)
+        out[start:stop] = pred
+    return out
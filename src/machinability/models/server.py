@@ -0,0 +1,418 @@
+"""Local HTTP prediction service for registered models (RQ4).
+
+Models are loaded from the registry once at startup. Concurrent requests
+for the same model are coalesced into micro-batches, so ``predict`` is
+called once per batch rather than once per request.
+
+Endpoints
+---------
+``GET /health``
+    Status and list of served models.
+``GET /metrics``
+    Request, row, batch and latency counters.
+``POST /predict/<model>``
+    JSON body ``{"rows": [{feature: value, ...}, ...]}`` or
+    ``{"instances": [[...], ...]}``; returns ``{"predictions": [...]}``, one
+    entry per row (a list per row for multi-output models).
+    An Arrow IPC stream (``application/vnd.apache.arrow.stream``) with one
+    column per feature is also accepted and answered in the same format.
+    Models with a stored drift reference also return a per-row
+    ``out_of_distribution`` flag.
+``POST /evaluate/<model>``
+    JSON rows that also contain the target column; returns the metrics of
+    :func:`evaluate_model`.
+
+Usage::
+
+    python -m src.machinability.models.server --port 8765
+"""
+
+import argparse
+import io
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+
+from src.machinability.models.baseline import evaluate_model
+from src.machinability.models.compiled import compile_ensemble, is_compilable
+from src.machinability.models.drift import load_reference
+from src.machinability.models.registry import list_models, load_metadata, load_model
+
+ARROW_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+
+
+class MicroBatcher:
+    """Coalesce concurrent prediction requests into batched ``predict`` calls.
+
+    A worker thread takes the first pending request, then keeps collecting
+    requests until *max_batch_rows* rows are queued or *max_wait_ms* has
+    elapsed, and scores them with a single ``predict`` call.
+
+    Parameters
+    ----------
+    model : fitted estimator
+        Model to call.
+    max_batch_rows : int
+        Upper bound on rows per ``predict`` call.
+    max_wait_ms : float
+        Maximum time to wait for more requests after the first arrives.
+    """
+
+    def __init__(self, model, max_batch_rows: int = 4096, max_wait_ms: float = 2.0):
+        self.model = model
+        self.max_batch_rows = max_batch_rows
+        self.max_wait = max_wait_ms / 1000.0
+        self.batches = 0
+        self.batched_rows = 0
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, X: np.ndarray) -> Future:
+        """Queue *X* for scoring and return a future for its predictions."""
+        future: Future = Future()
+        self._queue.put((np.asarray(X, dtype=float), future))
+        return future
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Blocking convenience wrapper around :meth:`submit`."""
+        return self.submit(X).result()
+
+    def close(self) -> None:
+        """Stop the worker thread after pending requests are served."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            pending = [item]
+            rows = len(item[0])
+            deadline = time.perf_counter() + self.max_wait
+            stop = False
+            while rows < self.max_batch_rows:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    nxt = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                    break
+                pending.append(nxt)
+                rows += len(nxt[0])
+            self._score(pending)
+            if stop:
+                return
+
+    def _score(self, pending: list) -> None:
+        try:
+            X = np.vstack([x for x, _ in pending])
+            y = np.asarray(self.model.predict(X))
+            if y.ndim == 0 or len(y) != len(X):
+                raise ValueError(f"predict returned shape {y.shape} for {len(X)} rows")
+        except Exception as exc:
+            if len(pending) == 1:
+                pending[0][1].set_exception(exc)
+            else:  # score one by one so only the offending request fails
+                for item in pending:
+                    self._score([item])
+            return
+        self.batches += 1
+        self.batched_rows += len(X)
+        offset = 0
+        for x, future in pending:
+            future.set_result(y[offset : offset + len(x)])
+            offset += len(x)
+
+
+class ServerStats:
+    """Thread-safe latency and throughput counters."""
+
+    def __init__(self, window: int = 10_000):
+        self._lock = threading.Lock()
+        self._latencies: deque = deque(maxlen=window)
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.rows = 0
+        self.errors = 0
+
+    def record(self, rows: int, latency_s: float, error: bool = False) -> None:
+        with self._lock:
+            self.requests += 1
+            self.rows += rows
+            self.errors += int(error)
+            self._latencies.append(latency_s)
+
+    def snapshot(self, batchers: dict) -> dict:
+        """Return counters as a JSON-serialisable dictionary."""
+        with self._lock:
+            lat = np.array(self._latencies) * 1000.0
+            uptime = time.perf_counter() - self.started
+            batches = sum(b.batches for b in batchers.values())
+            batched_rows = sum(b.batched_rows for b in batchers.values())
+            return {
+                "uptime_s": uptime,
+                "requests": self.requests,
+                "rows": self.rows,
+                "errors": self.errors,
+                "batches": batches,
+                "mean_batch_rows": batched_rows / batches if batches else 0.0,
+                "rows_per_s": self.rows / uptime if uptime > 0 else 0.0,
+                "latency_ms": {
+                    "mean": float(lat.mean()) if lat.size else 0.0,
+                    "p50": float(np.percentile(lat, 50)) if lat.size else 0.0,
+                    "p95": float(np.percentile(lat, 95)) if lat.size else 0.0,
+                    "p99": float(np.percentile(lat, 99)) if lat.size else 0.0,
+                },
+            }
+
+
+def _check_matrix(X: np.ndarray, features: list[str]) -> np.ndarray:
+    """Reject inputs that would fail a whole micro-batch: bad shape or non-finite values."""
+    if X.ndim != 2 or X.shape[1] != len(features) or len(X) == 0:
+        raise ValueError(f"Input must have shape (n, {len(features)}) with n >= 1")
+    bad = ~np.isfinite(X).all(axis=1)
+    if bad.any():
+        rows = np.flatnonzero(bad).tolist()
+        raise ValueError(f"Missing or non-finite feature values in rows {rows}")
+    return X
+
+
+def _rows_to_matrix(payload: dict, features: list[str]) -> np.ndarray:
+    if not isinstance(payload, dict):
+        raise ValueError("JSON body must be an object with 'rows' or 'instances'")
+    if "rows" in payload:
+        rows = payload["rows"]
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError("'rows' must be a list of {feature: value} objects")
+        try:
+            X = np.array([[row[f] for f in features] for row in rows], dtype=float)
+        except KeyError as exc:
+            raise ValueError(f"Missing feature in rows: {exc.args[0]}") from None
+        return _check_matrix(X.reshape(len(rows), len(features)), features)
+    if "instances" in payload:
+        return _check_matrix(np.array(payload["instances"], dtype=float), features)
+    raise ValueError("JSON body must contain 'rows' or 'instances'")
+
+
+def _arrow_to_matrix(body: bytes, features: list[str]) -> np.ndarray:
+    import pyarrow as pa
+
+    table = pa.ipc.open_stream(io.BytesIO(body)).read_all()
+    missing = set(features) - set(table.column_names)
+    if missing:
+        raise ValueError(f"Missing feature columns: {missing}")
+    X = np.column_stack([table.column(f).to_numpy(zero_copy_only=False) for f in features])
+    return _check_matrix(X.astype(float), features)
+
+
+def _matrix_to_arrow(y: np.ndarray, ood: np.ndarray | None = None) -> bytes:
+    import pyarrow as pa
+
+    columns = {"prediction": y if y.ndim == 1 else pa.array(y.tolist())}
+    if ood is not None:
+        columns["out_of_distribution"] = ood
+    table = pa.table(columns)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+class PredictionServer(ThreadingHTTPServer):
+    """HTTP server holding loaded models and one :class:`MicroBatcher` each.
+
+    Parameters
+    ----------
+    models : dict
+        Mapping of model name to ``(estimator, metadata)``; metadata must
+        contain ``features`` and ``target``.
+    host, port : str, int
+        Bind address. Use port 0 to pick a free port.
+    max_batch_rows, max_wait_ms
+        Passed to each :class:`MicroBatcher`.
+    references : dict, optional
+        Mapping of model name to :class:`~src.machinability.models.drift.DriftReference`
+        used to flag out-of-distribution rows.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        models: dict,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        max_batch_rows: int = 4096,
+        max_wait_ms: float = 2.0,
+        references: dict | None = None,
+    ):
+        super().__init__((host, port), _Handler)
+        self.metadata = {name: meta for name, (_, meta) in models.items()}
+        self.references = references or {}
+        self.batchers = {
+            name: MicroBatcher(est, max_batch_rows=max_batch_rows, max_wait_ms=max_wait_ms)
+            for name, (est, _) in models.items()
+        }
+        self.stats = ServerStats()
+
+    @classmethod
+    def from_registry(
+        cls,
+        names: list[str] | None = None,
+        registry_dir: Path | None = None,
+        compile_trees: bool = True,
+        **kwargs,
+    ) -> "PredictionServer":
+        """Load *names* (default: every registered model) and build a server.
+
+        With *compile_trees*, single-output random forests, gradient
+        boosting and decision trees are served through
+        :func:`~src.machinability.models.compiled.compile_ensemble`, which
+        avoids sklearn's per-call overhead on small requests.
+        """
+        if names is None:
+            listing = list_models(registry_dir)
+            names = listing["name"].tolist() if not listing.empty else []
+        models = {}
+        for name in names:
+            estimator = load_model(name, registry_dir)
+            if compile_trees and is_compilable(estimator):
+                estimator = compile_ensemble(estimator)
+            models[name] = (estimator, load_metadata(name, registry_dir))
+        references = {name: load_reference(name, registry_dir) for name in names}
+        references = {name: ref for name, ref in references.items() if ref is not None}
+        return cls(models, references=references, **kwargs)
+
+    def server_close(self) -> None:
+        super().server_close()
+        for batcher in self.batchers.values():
+            batcher.close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: PredictionServer
+
+    def log_message(self, format, *args):  # noqa: A002 - silence default stderr logging
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, obj: dict) -> None:
+        self._send(status, json.dumps(obj).encode("utf-8"))
+
+    def do_GET(self):  # noqa: N802
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok", "models": sorted(self.server.metadata)})
+        elif self.path == "/metrics":
+            self._send_json(200, self.server.stats.snapshot(self.server.batchers))
+        else:
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self):  # noqa: N802
+        start = time.perf_counter()
+        parts = self.path.strip("/").split("/")
+        if len(parts) != 2 or parts[0] not in ("predict", "evaluate"):
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+        action, name = parts
+        if name not in self.server.metadata:
+            self._send_json(404, {"error": f"Unknown model {name!r}"})
+            return
+
+        meta = self.server.metadata[name]
+        is_arrow = self.headers.get("Content-Type", "").startswith(ARROW_CONTENT_TYPE)
+        n_rows = 0
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = self.rfile.read(length) if length > 0 else b""
+            if is_arrow:
+                if action != "predict":
+                    raise ValueError("Arrow input is only supported for /predict")
+                X = _arrow_to_matrix(body, meta["features"])
+            else:
+                payload = json.loads(body or b"{}")
+                X = _rows_to_matrix(payload, meta["features"])
+            n_rows = len(X)
+            y_pred = self.server.batchers[name].predict(X)
+            reference = self.server.references.get(name)
+            ood = reference.out_of_distribution(X) if reference is not None else None
+
+            if action == "evaluate":
+                if y_pred.ndim != 1:
+                    raise ValueError("/evaluate needs a single-output model")
+                y_true = np.array([row[meta["target"]] for row in payload["rows"]], dtype=float)
+                if not np.isfinite(y_true).all():
+                    raise ValueError(f"Missing or non-finite {meta['target']!r} values")
+                metrics = evaluate_model(y_true, y_pred)
+                self._send_json(200, {k: float(v) for k, v in metrics.items()})
+            elif is_arrow:
+                self._send(200, _matrix_to_arrow(y_pred, ood), ARROW_CONTENT_TYPE)
+            else:
+                response = {"predictions": y_pred.tolist()}
+                if ood is not None:
+                    response["out_of_distribution"] = ood.tolist()
+                self._send_json(200, response)
+        except (ValueError, KeyError, TypeError, json.JSONDecodeError) as exc:
+            self.server.stats.record(n_rows, time.perf_counter() - start, error=True)
+            self._send_json(400, {"error": str(exc)})
+            return
+        except Exception as exc:  # a failing model must not drop the connection
+            self.server.stats.record(n_rows, time.perf_counter() - start, error=True)
+            self._send_json(500, {"error": f"{type(exc).__name__}: {exc}"})
+            return
+        self.server.stats.record(n_rows, time.perf_counter() - start)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point: serve registered models until interrupted."""
+    parser = argparse.ArgumentParser(description="Serve registered machinability models.")
+    parser.add_argument("--models", nargs="*", help="Registry names (default: all)")
+    parser.add_argument("--registry-dir", type=Path, default=None)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-batch-rows", type=int, default=4096)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    parser.add_argument(
+        "--no-compile", action="store_true", help="Serve tree ensembles through sklearn"
+    )
+    args = parser.parse_args(argv)
+
+    server = PredictionServer.from_registry(
+        args.models,
+        registry_dir=args.registry_dir,
+        compile_trees=not args.no_compile,
+        host=args.host,
+        port=args.port,
+        max_batch_rows=args.max_batch_rows,
+        max_wait_ms=args.max_wait_ms,
+    )
+    host, port = server.server_address[:2]
+    print(f"Serving {sorted(server.metadata)} on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
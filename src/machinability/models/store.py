@@ -0,0 +1,217 @@
+"""In-memory store of fitted models keyed by training configuration (RQ4).
+
+Estimators are registered once at training time together with their
+importances, so downstream checks (e.g. hypothesis H4d) become a lookup
+instead of a refit.
+"""
+
+import hashlib
+
+import numpy as np
+
+from src.machinability.models.treeshap import tree_shap_values
+
+
+def data_hash(*arrays) -> str:
+    """Return a stable content hash for one or more arrays.
+
+    Parameters
+    ----------
+    *arrays : array-like
+        Arrays to hash (e.g. ``X_train, y_train``). Shape and dtype are part
+        of the hash, so a reshaped array hashes differently.
+
+    Returns
+    -------
+    str
+        Hex digest (32 characters).
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for arr in arrays:
+        a = np.ascontiguousarray(arr)
+        h.update(f"{a.dtype.str}{a.shape}".encode())
+        if a.dtype.hasobject:
+            h.update(repr(a.tolist()).encode())
+        else:
+            h.update(a.data)
+    return h.hexdigest()
+
+
+def model_key(model: str, features, target: str, data_digest: str) -> tuple:
+    """Build the store key for a trained model.
+
+    ``features`` may be a list of names or a comma-separated string, as
+    stored in the models page comparison table.
+    """
+    if isinstance(features, str):
+        features = [f.strip() for f in features.split(",")]
+    return (model, tuple(features), target, data_digest)
+
+
+class ModelStore:
+    """Fitted estimators with their feature importances.
+
+    Entries are keyed by ``(model, features, target, data_hash)``; see
+    :func:`model_key`. Permutation importances and TreeSHAP attributions
+    are computed on the held-out split passed to :meth:`put` (or on
+    explicitly given rows) and cached per entry.
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple, dict] = {}
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(
+        self,
+        model: str,
+        features: list[str],
+        target: str,
+        data_digest: str,
+        estimator,
+        X_test: np.ndarray | None = None,
+        y_test: np.ndarray | None = None,
+    ) -> tuple:
+        """Register a fitted estimator and return its key.
+
+        Parameters
+        ----------
+        model : str
+            Model display name (e.g. ``"Random Forest"``).
+        features : list of str
+            Feature names, in column order of the training matrix.
+        target : str
+            Target variable name.
+        data_digest : str
+            Hash of the training data, see :func:`data_hash`.
+        estimator : fitted estimator
+            The trained model.
+        X_test, y_test : array-like, optional
+            Held-out split used for permutation importance.
+
+        Returns
+        -------
+        tuple
+            Store key.
+        """
+        key = model_key(model, features, target, data_digest)
+        impurity = getattr(estimator, "feature_importances_", None)
+        self._entries[key] = {
+            "estimator": estimator,
+            "features": list(key[1]),
+            "feature_importances": (
+                dict(zip(key[1], np.asarray(impurity, dtype=float)))
+                if impurity is not None
+                else None
+            ),
+            "X_test": X_test,
+            "y_test": y_test,
+            "permutation_importances": {},
+            "shap_values": {},
+        }
+        return key
+
+    def get(self, key: tuple) -> dict:
+        """Return the entry for *key*; raises ``KeyError`` if absent."""
+        return self._entries[key]
+
+    def estimator(self, key: tuple):
+        """Return the fitted estimator stored under *key*."""
+        return self._entries[key]["estimator"]
+
+    def feature_importances(self, key: tuple) -> dict[str, float] | None:
+        """Impurity-based importances recorded at training time (tree models only)."""
+        return self._entries[key]["feature_importances"]
+
+    def permutation_importances(
+        self,
+        key: tuple,
+        n_repeats: int = 10,
+        n_jobs: int | None = -1,
+        random_state: int = 42,
+    ) -> dict[str, float]:
+        """Mean permutation importance on the held-out split.
+
+        Cached per entry, ``n_repeats`` and ``random_state``. Unlike impurity
+        importance this is not biased towards correlated or high-cardinality
+        inputs. Repeats are evaluated in parallel.
+        """
+        from sklearn.inspection import permutation_importance
+
+        entry = self._entries[key]
+        cache = entry["permutation_importances"]
+        if (n_repeats, random_state) not in cache:
+            if entry["X_test"] is None or entry["y_test"] is None:
+                raise ValueError("No held-out split stored for this model.")
+            result = permutation_importance(
+                entry["estimator"],
+                entry["X_test"],
+                entry["y_test"],
+                n_repeats=n_repeats,
+                n_jobs=n_jobs,
+                random_state=random_state,
+            )
+            cache[n_repeats, random_state] = dict(
+                zip(entry["features"], result.importances_mean.astype(float))
+            )
+        return cache[n_repeats, random_state]
+
+    def shap_values(
+        self, key: tuple, X: np.ndarray | None = None, n_jobs: int | None = None
+    ) -> tuple[np.ndarray, float]:
+        """Per-row TreeSHAP attributions, cached per entry and input rows.
+
+        Parameters
+        ----------
+        key : tuple
+            Store key of a tree-ensemble model.
+        X : array-like, optional
+            Rows to explain. Defaults to the stored held-out split.
+        n_jobs : int, optional
+            Parallel workers over trees.
+
+        Returns
+        -------
+        phi, expected_value
+            See :func:`tree_shap_values`.
+        """
+        entry = self._entries[key]
+        if X is None:
+            X = entry["X_test"]
+            if X is None:
+                raise ValueError("No held-out split stored for this model.")
+        digest = data_hash(X)
+        cache = entry["shap_values"]
+        if digest not in cache:
+            cache[digest] = tree_shap_values(entry["estimator"], X, n_jobs=n_jobs)
+        return cache[digest]
+
+    def top_features(self, key: tuple, k: int = 3, kind: str = "permutation") -> list[str]:
+        """Return the *k* most important features.
+
+        Parameters
+        ----------
+        key : tuple
+            Store key.
+        k : int
+            Number of features to return.
+        kind : {"permutation", "impurity"}
+            Which importance measure to rank by.
+        """
+        if kind == "permutation":
+            importances = self.permutation_importances(key)
+        elif kind == "impurity":
+            importances = self.feature_importances(key)
+            if importances is None:
+                raise ValueError("Estimator has no feature_importances_.")
+        else:
+            raise ValueError(f"Unknown importance kind: {kind!r}")
+        return sorted(importances, key=importances.get, reverse=True)[:k]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
@@ -0,0 +1,678 @@
+"""Incremental stage graph from ``data/raw`` to ``results/`` (RQ1, RQ4).
+
+Each :class:`Stage` declares named input and output files; the graph
+follows from shared paths. A stage is rebuilt only when
+
+* it has never been built, or one of its outputs is missing or was
+  modified after the last build,
+* the content hash of one of its inputs changed, or
+* its parameters or the source of its stage function changed.
+
+Input hashes are compared when a stage becomes ready, so an upstream
+stage that rebuilds to byte-identical output does not trigger its
+dependents. Stages whose dependencies are satisfied run in parallel on a
+process pool. Build records (content hashes per stage, plus a
+``(mtime, size)`` cache of file hashes) are kept in
+``results/pipeline/.pipeline_state.json``.
+
+Default graph::
+
+    ingest_specimens ───────────────────────────────────────┐
+    ingest_conductivity → correct_conductivity → aggregate_conductivity → merge
+    ingest_machining → aggregate_machining ─────────────────┘
+    merge → features → train → evaluate → figures
+                    └→ correlation
+
+``train`` fits every model on all targets at once with a shared split
+(:class:`~src.machinability.models.multi_target.MultiTargetRegressor`).
+
+Raw inputs are ``data/raw/specimens.csv``, ``conductivity.csv`` and
+``machining.csv`` (see :func:`load_conductivity_data`,
+:func:`load_machining_data` and
+:func:`~src.machinability.data.synthetic.write_raw_csvs`).
+
+Usage::
+
+    python -m src.machinability.pipeline                 # build what changed
+    python -m src.machinability.pipeline --dry-run
+    python -m src.machinability.pipeline evaluate --force train
+    python -m src.machinability.pipeline --synthetic 200 # synthetic raw data
+"""
+
+import argparse
+import inspect
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.machinability.data.loader import load_conductivity_data, load_machining_data
+from src.machinability.data.preprocessing import (
+    REFERENCE_TEMP_C,
+    STEEL_TEMP_COEFF_PER_K,
+    correct_to_reference_temperature,
+    merge_conductivity_machining,
+    to_iacs,
+)
+from src.machinability.utils.artifacts import ArtifactStore
+from src.machinability.utils.cache import stable_hash
+from src.machinability.utils.config import DATA_PROCESSED, DATA_RAW, RESULTS_DIR
+
+PIPELINE_RESULTS_DIR = RESULTS_DIR / "pipeline"
+STATE_FILE = ".pipeline_state.json"
+
+DEFAULT_FEATURES = ("conductivity", "hardness", "composition_C", "composition_Mn", "composition_Cr")
+DEFAULT_TARGETS = ("tool_life", "Ra", "Fc")
+BASELINE_NAME = "HardnessOnly"
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class Stage:
+    """One step of the pipeline.
+
+    ``func(inputs, outputs, **params)`` receives the ``inputs`` and
+    ``outputs`` dicts (name -> Path) and must write every output file.
+    It has to be a module-level function so it can run in a worker
+    process.
+    """
+
+    name: str
+    func: object
+    inputs: dict[str, Path]
+    outputs: dict[str, Path]
+    params: dict = field(default_factory=dict)
+
+    def code_hash(self) -> str:
+        try:
+            source = inspect.getsource(self.func)
+        except (OSError, TypeError):
+            source = self.func.__code__.co_code.hex()
+        return stable_hash(source)
+
+
+def _execute(func, inputs: dict, outputs: dict, params: dict) -> float:
+    """Run one stage function (in a worker process); returns its wall time."""
+    for path in outputs.values():
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    func(inputs, outputs, **params)
+    return time.perf_counter() - start
+
+
+class Pipeline:
+    """Dependency graph of :class:`Stage` objects with incremental builds.
+
+    Parameters
+    ----------
+    stages : list of Stage
+        Stages in any order; each output path may be produced by one stage
+        only.
+    state_path : Path
+        JSON file holding the build records.
+    """
+
+    def __init__(self, stages: list[Stage], state_path: Path):
+        self.stages = {s.name: s for s in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Stage names must be unique")
+        self.state_path = Path(state_path)
+
+        producers = {}
+        for stage in stages:
+            for path in stage.outputs.values():
+                if path in producers:
+                    raise ValueError(f"{path} is produced by {producers[path]} and {stage.name}")
+                producers[path] = stage.name
+        self.deps = {
+            s.name: {producers[p] for p in s.inputs.values() if p in producers} for s in stages
+        }
+        self.order = self._topological_order()
+        self._state = self._load_state()
+
+    def _topological_order(self) -> list[str]:
+        remaining = {name: set(deps) for name, deps in self.deps.items()}
+        order = []
+        while remaining:
+            ready = sorted(name for name, deps in remaining.items() if not deps)
+            if not ready:
+                raise ValueError(f"Stage graph has a cycle among {sorted(remaining)}")
+            for name in ready:
+                order.append(name)
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return order
+
+    def ancestors(self, names) -> set[str]:
+        """*names* plus every stage they depend on, directly or indirectly."""
+        result, todo = set(), list(names)
+        while todo:
+            name = todo.pop()
+            if name not in self.stages:
+                raise KeyError(f"Unknown stage: {name!r}")
+            if name not in result:
+                result.add(name)
+                todo.extend(self.deps[name])
+        return result
+
+    # -- build records ----------------------------------------------------------
+
+    def _load_state(self) -> dict:
+        if self.state_path.exists():
+            try:
+                return json.loads(self.state_path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError:
+                pass
+        return {"stages": {}, "files": {}}
+
+    def _save_state(self) -> None:
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._state, indent=1), encoding="utf-8")
+        os.replace(tmp, self.state_path)
+
+    def file_hash(self, path: Path) -> str | None:
+        """Content hash of *path* (``None`` if missing), cached by mtime and size."""
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        key = str(path)
+        cached = self._state["files"].get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        digest = ArtifactStore.hash_file(path)
+        self._state["files"][key] = [st.st_mtime_ns, st.st_size, digest]
+        return digest
+
+    def stale_reason(self, name: str) -> str | None:
+        """Why stage *name* needs rebuilding, or ``None`` if it is up to date."""
+        stage = self.stages[name]
+        record = self._state["stages"].get(name)
+        if record is None:
+            return "never built"
+        if record["code"] != stage.code_hash():
+            return "code changed"
+        if record["params"] != stable_hash(stage.params):
+            return "parameters changed"
+        for key, path in stage.inputs.items():
+            digest = self.file_hash(path)
+            if digest is None:
+                raise FileNotFoundError(f"Input {key!r} of stage {name!r} not found: {path}")
+            if record["inputs"].get(str(path)) != digest:
+                return f"input {key!r} changed"
+        for key, path in stage.outputs.items():
+            digest = self.file_hash(path)
+            if digest is None:
+                return f"output {key!r} missing"
+            if record["outputs"].get(str(path)) != digest:
+                return f"output {key!r} modified"
+        return None
+
+    def _record(self, name: str) -> None:
+        stage = self.stages[name]
+        outputs = {}
+        for key, path in stage.outputs.items():
+            digest = self.file_hash(path)
+            if digest is None:
+                raise RuntimeError(f"Stage {name!r} did not write output {key!r} ({path})")
+            outputs[str(path)] = digest
+        self._state["stages"][name] = {
+            "code": stage.code_hash(),
+            "params": stable_hash(stage.params),
+            "inputs": {str(p): self.file_hash(p) for p in stage.inputs.values()},
+            "outputs": outputs,
+        }
+        self._save_state()
+
+    # -- running ----------------------------------------------------------------
+
+    def plan(self, targets=None, force=()) -> dict[str, str | None]:
+        """Dry run: the rebuild reason per selected stage (``None`` = up to date).
+
+        Stages downstream of a rebuilt stage are reported as
+        ``"upstream rebuilt"``; whether they actually rebuild depends on
+        whether the upstream output content changes.
+        """
+        selected = self.ancestors(targets) if targets else set(self.stages)
+        plan = {}
+        for name in self.order:
+            if name not in selected:
+                continue
+            if name in force:
+                plan[name] = "forced"
+            elif any(plan.get(dep) for dep in self.deps[name]):
+                plan[name] = "upstream rebuilt"
+            else:
+                try:
+                    plan[name] = self.stale_reason(name)
+                except FileNotFoundError as exc:
+                    plan[name] = f"blocked: {exc}"
+        return plan
+
+    def run(self, targets=None, force=(), jobs: int | None = None, log=print) -> dict[str, str]:
+        """Build the selected stages, rebuilding only what changed.
+
+        Parameters
+        ----------
+        targets : list of str, optional
+            Stages to bring up to date (with their upstream stages);
+            default: all.
+        force : collection of str
+            Stages to rebuild regardless of their records.
+        jobs : int, optional
+            Worker processes (default: CPU count; ``-1`` or any value
+            below 1 also means all cores, as for joblib); ``1`` runs stages
+            in this process.
+        log : callable
+            Receives one progress line per event.
+
+        Returns
+        -------
+        dict
+            Outcome per stage: ``"built"``, ``"up to date"``, ``"failed"``
+            or ``"skipped"`` (an upstream stage failed).
+        """
+        selected = self.ancestors(targets) if targets else set(self.stages)
+        pending = [name for name in self.order if name in selected]
+        outcome: dict[str, str] = {}
+        running = {}
+        if jobs is not None and jobs <= 0:
+            jobs = None  # all cores, matching the joblib convention of the CLI
+        executor = None if jobs == 1 else ProcessPoolExecutor(max_workers=jobs)
+
+        def finish(name: str, run) -> None:
+            try:
+                seconds = run()
+                self._record(name)
+            except Exception as exc:
+                outcome[name] = "failed"
+                log(f"[{name}] FAILED: {type(exc).__name__}: {exc}")
+            else:
+                outcome[name] = "built"
+                log(f"[{name}] built in {seconds:.2f} s")
+
+        try:
+            while pending or running:
+                for name in [n for n in pending if self.deps[n] <= set(outcome)]:
+                    pending.remove(name)
+                    if any(outcome[d] in ("failed", "skipped") for d in self.deps[name]):
+                        outcome[name] = "skipped"
+                        log(f"[{name}] skipped (upstream failed)")
+                        continue
+                    try:
+                        reason = "forced" if name in force else self.stale_reason(name)
+                    except FileNotFoundError as exc:
+                        outcome[name] = "failed"
+                        log(f"[{name}] FAILED: {exc}")
+                        continue
+                    if reason is None:
+                        outcome[name] = "up to date"
+                        log(f"[{name}] up to date")
+                        continue
+                    stage = self.stages[name]
+                    log(f"[{name}] building ({reason})")
+                    args = (stage.func, stage.inputs, stage.outputs, stage.params)
+                    if executor is None:
+                        finish(name, lambda args=args: _execute(*args))
+                    else:
+                        running[executor.submit(_execute, *args)] = name
+                if running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        finish(running.pop(future), future.result)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+            self._save_state()
+        return outcome
+
+
+# ---------------------------------------------------------------------------
+# Stages
+# ---------------------------------------------------------------------------
+
+
+def ingest_specimens(inputs, outputs) -> None:
+    """Validate the specimen table (grade, heat treatment, hardness, composition)."""
+    df = pd.read_csv(inputs["raw"])
+    if "specimen_id" not in df.columns:
+        raise ValueError("Missing column in specimen data: specimen_id")
+    df.to_parquet(outputs["table"], index=False)
+
+
+def ingest_conductivity(inputs, outputs) -> None:
+    load_conductivity_data(inputs["raw"]).to_parquet(outputs["table"], index=False)
+
+
+def ingest_machining(inputs, outputs) -> None:
+    load_machining_data(inputs["raw"]).to_parquet(outputs["table"], index=False)
+
+
+def correct_conductivity(inputs, outputs, alpha: float, reference_C: float) -> None:
+    """Convert readings to %IACS and refer them to the reference temperature."""
+    df = pd.read_parquet(inputs["table"])
+    iacs = to_iacs(df["value"].to_numpy(), df["unit"].to_numpy())
+    df["conductivity"] = correct_to_reference_temperature(
+        iacs, df["temp_C"].to_numpy(), alpha=alpha, reference_C=reference_C
+    )
+    df.to_parquet(outputs["table"], index=False)
+
+
+def aggregate_conductivity(inputs, outputs) -> None:
+    """Mean, SD and count of the corrected readings per specimen."""
+    df = pd.read_parquet(inputs["table"])
+    agg = df.groupby("specimen_id")["conductivity"].agg(
+        conductivity="mean", conductivity_sd="std", n_conductivity="count"
+    )
+    agg.reset_index().to_parquet(outputs["table"], index=False)
+
+
+def aggregate_machining(inputs, outputs) -> None:
+    """One column per machinability metric (mean over cutting conditions)."""
+    df = pd.read_parquet(inputs["table"])
+    wide = df.pivot_table(index="specimen_id", columns="metric", values="value", aggfunc="mean")
+    wide.columns.name = None
+    wide.reset_index().to_parquet(outputs["table"], index=False)
+
+
+def merge(inputs, outputs) -> None:
+    """Specimen properties, conductivity and machining results in one table."""
+    merged = merge_conductivity_machining(
+        pd.read_parquet(inputs["conductivity"]), pd.read_parquet(inputs["machining"])
+    )
+    specimens = pd.read_parquet(inputs["specimens"])
+    specimens.merge(merged, on="specimen_id", how="inner").to_csv(outputs["table"], index=False)
+
+
+def build_features(inputs, outputs, features: list[str], targets: list[str]) -> None:
+    """Model-ready table: identifiers, features and the available targets."""
+    df = pd.read_csv(inputs["table"])
+    missing = set(features) - set(df.columns)
+    if missing:
+        raise ValueError(f"Missing feature columns: {sorted(missing)}")
+    ids = [c for c in ("specimen_id", "steel_grade", "heat_treatment") if c in df.columns]
+    cols = [*ids, *features, *[t for t in targets if t in df.columns]]
+    df[cols].dropna(subset=features).to_parquet(outputs["table"], index=False)
+
+
+def correlation(inputs, outputs) -> None:
+    from src.machinability.analysis.correlation import correlation_matrix
+
+    df = pd.read_parquet(inputs["table"])
+    correlation_matrix(df.select_dtypes("number")).to_csv(outputs["matrix"])
+
+
+def train(
+    inputs,
+    outputs,
+    features: list[str],
+    targets: list[str],
+    models: list[str],
+    test_size: float,
+    random_state: int,
+) -> None:
+    """Fit every model (and the hardness-only baseline) on all targets jointly.
+
+    The targets share one train/test split; rows missing any target are
+    dropped. Each model is a
+    :class:`~src.machinability.models.multi_target.MultiTargetRegressor`,
+    which fits multi-output estimators once for all targets.
+    """
+    import joblib
+    from sklearn.model_selection import train_test_split
+
+    from src.machinability.models.baseline import HardnessOnlyBaseline
+    from src.machinability.models.multi_target import MultiTargetRegressor
+
+    df = pd.read_parquet(inputs["table"])
+    targets = [t for t in targets if t in df.columns]
+    data = df.dropna(subset=targets)
+    X = data[features].to_numpy(dtype=float)
+    Y = data[targets].to_numpy(dtype=float)
+    X_train, X_test, Y_train, Y_test = train_test_split(
+        X, Y, test_size=test_size, random_state=random_state
+    )
+    fitted = {name: MultiTargetRegressor(name).fit(X_train, Y_train) for name in models}
+    if "hardness" in features:
+        h = features.index("hardness")
+        fitted[BASELINE_NAME] = HardnessOnlyBaseline().fit(X_train[:, [h]], Y_train)
+    joblib.dump(
+        {"features": features, "targets": targets, "models": fitted, "test": (X_test, Y_test)},
+        outputs["models"],
+    )
+
+
+def evaluate(inputs, outputs) -> None:
+    """Test-split R², MAPE and RMSE per target and model."""
+    import joblib
+
+    from src.machinability.models.baseline import evaluate_model
+
+    bundle = joblib.load(inputs["models"])
+    hardness = bundle["features"].index("hardness") if "hardness" in bundle["features"] else None
+    X_test, Y_test = bundle["test"]
+    rows = []
+    for name, estimator in bundle["models"].items():
+        X = X_test[:, [hardness]] if name == BASELINE_NAME else X_test
+        Y_pred = np.asarray(estimator.predict(X)).reshape(Y_test.shape)
+        metrics = evaluate_model(Y_test, Y_pred)
+        rows += [
+            {"target": target, "model": name, **{k: v[j] for k, v in metrics.items()}}
+            for j, target in enumerate(bundle["targets"])
+        ]
+    pd.DataFrame(rows).to_csv(outputs["metrics"], index=False)
+
+
+def figures(inputs, outputs) -> None:
+    """Conductivity-vs-target scatter plots and the test R² per model."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    from src.machinability.visualization.plots import scatter_with_regression
+
+    df = pd.read_parquet(inputs["features"])
+    metrics = pd.read_csv(inputs["metrics"])
+    targets = list(dict.fromkeys(metrics["target"]))
+
+    fig, axes = plt.subplots(1, len(targets), figsize=(6 * len(targets), 5), squeeze=False)
+    for ax, target in zip(axes[0], targets):
+        scatter_with_regression(
+            df["conductivity"].to_numpy(), df[target].to_numpy(), ylabel=target, ax=ax
+        )
+    fig.tight_layout()
+    fig.savefig(outputs["conductivity"], dpi=120)
+    plt.close(fig)
+
+    r2 = metrics.pivot(index="model", columns="target", values="r2")[targets]
+    ax = r2.plot.bar(figsize=(8, 5), rot=0)
+    ax.set_ylabel("Test R²")
+    ax.grid(True, axis="y", alpha=0.3)
+    ax.figure.tight_layout()
+    ax.figure.savefig(outputs["r2"], dpi=120)
+    plt.close(ax.figure)
+
+
+def build_pipeline(
+    raw_dir: Path = DATA_RAW,
+    processed_dir: Path = DATA_PROCESSED,
+    results_dir: Path = PIPELINE_RESULTS_DIR,
+    features=DEFAULT_FEATURES,
+    targets=DEFAULT_TARGETS,
+    models: list[str] | None = None,
+    test_size: float = 0.2,
+    random_state: int = 42,
+) -> Pipeline:
+    """The default raw-to-results graph.
+
+    Parameters
+    ----------
+    raw_dir, processed_dir, results_dir : Path
+        Raw inputs, intermediate tables and final results.
+    features, targets : sequence of str
+        Model inputs and machinability targets.
+    models : list of str, optional
+        Factory display names (default: every model in ``MODEL_MAP``).
+    test_size, random_state
+        Train/test split of the ``train`` stage.
+    """
+    if models is None:
+        from src.machinability.models.factory import MODEL_MAP
+
+        models = list(MODEL_MAP)
+    raw, proc, res = Path(raw_dir), Path(processed_dir), Path(results_dir)
+    stages = [
+        Stage(
+            "ingest_specimens",
+            ingest_specimens,
+            {"raw": raw / "specimens.csv"},
+            {"table": proc / "specimens.parquet"},
+        ),
+        Stage(
+            "ingest_conductivity",
+            ingest_conductivity,
+            {"raw": raw / "conductivity.csv"},
+            {"table": proc / "conductivity_raw.parquet"},
+        ),
+        Stage(
+            "ingest_machining",
+            ingest_machining,
+            {"raw": raw / "machining.csv"},
+            {"table": proc / "machining_raw.parquet"},
+        ),
+        Stage(
+            "correct_conductivity",
+            correct_conductivity,
+            {"table": proc / "conductivity_raw.parquet"},
+            {"table": proc / "conductivity_corrected.parquet"},
+            {"alpha": STEEL_TEMP_COEFF_PER_K, "reference_C": REFERENCE_TEMP_C},
+        ),
+        Stage(
+            "aggregate_conductivity",
+            aggregate_conductivity,
+            {"table": proc / "conductivity_corrected.parquet"},
+            {"table": proc / "conductivity.parquet"},
+        ),
+        Stage(
+            "aggregate_machining",
+            aggregate_machining,
+            {"table": proc / "machining_raw.parquet"},
+            {"table": proc / "machining.parquet"},
+        ),
+        Stage(
+            "merge",
+            merge,
+            {
+                "specimens": proc / "specimens.parquet",
+                "conductivity": proc / "conductivity.parquet",
+                "machining": proc / "machining.parquet",
+            },
+            {"table": proc / "merged.csv"},
+        ),
+        Stage(
+            "features",
+            build_features,
+            {"table": proc / "merged.csv"},
+            {"table": proc / "features.parquet"},
+            {"features": list(features), "targets": list(targets)},
+        ),
+        Stage(
+            "correlation",
+            correlation,
+            {"table": proc / "features.parquet"},
+            {"matrix": res / "correlation.csv"},
+        ),
+        Stage(
+            "train",
+            train,
+            {"table": proc / "features.parquet"},
+            {"models": res / "models.joblib"},
+            {
+                "features": list(features),
+                "targets": list(targets),
+                "models": list(models),
+                "test_size": test_size,
+                "random_state": random_state,
+            },
+        ),
+        Stage(
+            "evaluate",
+            evaluate,
+            {"models": res / "models.joblib"},
+            {"metrics": res / "metrics.csv"},
+        ),
+        Stage(
+            "figures",
+            figures,
+            {"features": proc / "features.parquet", "metrics": res / "metrics.csv"},
+            {
+                "conductivity": res / "figures" / "conductivity_vs_targets.png",
+                "r2": res / "figures" / "model_r2.png",
+            },
+        ),
+    ]
+    return Pipeline(stages, res / STATE_FILE)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point; returns the exit status."""
+    parser = argparse.ArgumentParser(description="Incremental raw-to-results pipeline.")
+    parser.add_argument("stages", nargs="*", help="Stages to bring up to date (default: all)")
+    parser.add_argument("--raw", type=Path, default=DATA_RAW)
+    parser.add_argument("--processed", type=Path, default=DATA_PROCESSED)
+    parser.add_argument("--results", type=Path, default=PIPELINE_RESULTS_DIR)
+    parser.add_argument("--models", nargs="+", default=None, help="Factory model names")
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=None, help="Worker processes (-1: all cores)"
+    )
+    parser.add_argument(
+        "--force",
+        nargs="+",
+        default=[],
+        metavar="STAGE",
+        help="Rebuild these stages ('all' for every stage)",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Show what would be rebuilt")
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        metavar="N",
+        help="First write N synthetic specimens to the raw directory",
+    )
+    args = parser.parse_args(argv)
+
+    if args.synthetic:
+        from src.machinability.data.synthetic import write_raw_csvs
+
+        write_raw_csvs(args.raw, n=args.synthetic)
+    pipeline = build_pipeline(args.raw, args.processed, args.results, models=args.models)
+    force = set(pipeline.stages) if "all" in args.force else set(args.force)
+    unknown = (force | set(args.stages)) - set(pipeline.stages)
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(sorted(unknown))}")
+
+    if args.dry_run:
+        for name, reason in pipeline.plan(args.stages, force).items():
+            print(f"{name:24s} {reason or 'up to date'}")
+        return 0
+    outcome = pipeline.run(args.stages, force=force, jobs=args.jobs)
+    built = sum(v == "built" for v in outcome.values())
+    print(f"{built} built, {sum(v == 'up to date' for v in outcome.values())} up to date")
+    return 1 if any(v in ("failed", "skipped") for v in outcome.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1 +1,16 @@
 """Shared utility functions."""
+
+from src.machinability._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["artifacts", "cache", "config", "instrument", "profiling", "run_index", "tracking"],
+    attributes={
+        "artifacts": ["ArtifactStore"],
+        "cache": ["memoize"],
+        "instrument": ["REGISTRY", "stage", "timed"],
+        "profiling": ["SamplingProfiler", "maybe_profile"],
+        "run_index": ["RunIndex"],
+        "tracking": ["BufferedRunLogger"],
+    },
+)
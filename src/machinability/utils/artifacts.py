@@ -0,0 +1,221 @@
+"""Content-addressed artifact store with reference counting.
+
+Blobs (datasets, figures, pickled models) are stored once under
+``results/artifacts/`` by the BLAKE2b hash of their content::
+
+    objects/<2 hex>/<30 hex>   blob (written atomically)
+    refs/<digest>/<owner>      one empty file per reference
+
+Storing content that is already present only adds a reference file, so a
+sweep that logs the same processed data for every run costs one copy.
+Owners are free-form strings (e.g. ``"<run_id>:dataset.parquet"``);
+a blob is garbage once its last reference is released, and :meth:`gc`
+deletes such blobs. MLflow runs log ``cas://<digest>`` pointers instead of
+the files themselves (see ``BufferedRun.log_artifact``).
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+from src.machinability.utils.config import RESULTS_DIR
+
+ARTIFACT_DIR = RESULTS_DIR / "artifacts"
+POINTER_SCHEME = "cas://"
+
+_CHUNK = 1 << 20
+
+
+def _hasher():
+    return hashlib.blake2b(digest_size=16)
+
+
+def to_pointer(digest: str) -> str:
+    """Pointer string for a stored blob, e.g. for an MLflow tag."""
+    return POINTER_SCHEME + digest
+
+
+def from_pointer(pointer: str) -> str:
+    """Digest referenced by a ``cas://`` pointer."""
+    if not pointer.startswith(POINTER_SCHEME):
+        raise ValueError(f"Not an artifact pointer: {pointer!r}")
+    return pointer[len(POINTER_SCHEME) :]
+
+
+class ArtifactStore:
+    """Deduplicating blob store keyed by content hash.
+
+    Parameters
+    ----------
+    root : Path
+        Store directory (default: ``results/artifacts``).
+    """
+
+    def __init__(self, root: Path | None = None):
+        self.root = Path(root or ARTIFACT_DIR)
+        self._objects = self.root / "objects"
+        self._refs = self.root / "refs"
+
+    def _object_path(self, digest: str) -> Path:
+        if len(digest) != 32 or not all(c in "0123456789abcdef" for c in digest):
+            raise ValueError(f"Invalid artifact digest: {digest!r}")
+        return self._objects / digest[:2] / digest[2:]
+
+    # -- writing --------------------------------------------------------------
+
+    def put(self, source, owner: str) -> str:
+        """Store a file (path) or ``bytes`` and reference it from *owner*.
+
+        Returns
+        -------
+        str
+            Content digest (32 hex characters).
+        """
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            digest = _hasher()
+            digest.update(source)
+            digest = digest.hexdigest()
+            if not self._reuse(digest):
+                self._write_atomic(self._object_path(digest), lambda fh: fh.write(source))
+        else:
+            source = Path(source)
+            digest = self.hash_file(source)
+            if not self._reuse(digest):
+                with open(source, "rb") as src:
+                    self._write_atomic(
+                        self._object_path(digest),
+                        lambda fh: shutil.copyfileobj(src, fh, _CHUNK),
+                    )
+        self.add_ref(digest, owner)
+        return digest
+
+    def _reuse(self, digest: str) -> bool:
+        """Whether the blob exists; refreshes its mtime so :meth:`gc` keeps it."""
+        try:
+            os.utime(self._object_path(digest))
+        except FileNotFoundError:
+            return False
+        return True
+
+    @staticmethod
+    def hash_file(path: Path) -> str:
+        """Content digest of a file, read in 1 MiB chunks."""
+        h = _hasher()
+        with open(path, "rb") as fh:
+            while chunk := fh.read(_CHUNK):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def _write_atomic(self, path: Path, write) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                write(fh)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    # -- references -----------------------------------------------------------
+
+    def add_ref(self, digest: str, owner: str) -> None:
+        """Reference an existing blob from *owner* (idempotent)."""
+        if not self._object_path(digest).exists():
+            raise KeyError(f"Unknown artifact: {digest}")
+        ref_dir = self._refs / digest
+        ref_dir.mkdir(parents=True, exist_ok=True)
+        (ref_dir / quote(owner, safe="")).touch()
+
+    def release(self, digest: str, owner: str) -> None:
+        """Drop *owner*'s reference to a blob (no-op if absent)."""
+        (self._refs / digest / quote(owner, safe="")).unlink(missing_ok=True)
+
+    def release_owner(self, prefix: str) -> int:
+        """Drop every reference whose owner starts with *prefix*.
+
+        Returns the number of references released.
+        """
+        encoded = quote(prefix, safe="")
+        released = 0
+        for ref in self._refs.glob("*/*"):
+            if ref.name.startswith(encoded):
+                ref.unlink(missing_ok=True)
+                released += 1
+        return released
+
+    def owners(self, digest: str) -> list[str]:
+        """Owners currently referencing a blob."""
+        ref_dir = self._refs / digest
+        if not ref_dir.is_dir():
+            return []
+        return sorted(unquote(ref.name) for ref in ref_dir.iterdir())
+
+    def refcount(self, digest: str) -> int:
+        return len(self.owners(digest))
+
+    # -- reading --------------------------------------------------------------
+
+    def __contains__(self, digest: str) -> bool:
+        return self._object_path(digest).exists()
+
+    def path(self, digest: str) -> Path:
+        """Path of a stored blob (treat as read-only)."""
+        path = self._object_path(digest)
+        if not path.exists():
+            raise KeyError(f"Unknown artifact: {digest}")
+        return path
+
+    def read_bytes(self, digest: str) -> bytes:
+        return self.path(digest).read_bytes()
+
+    def resolve(self, pointer: str) -> Path:
+        """Path of the blob a ``cas://`` pointer refers to."""
+        return self.path(from_pointer(pointer))
+
+    # -- maintenance ----------------------------------------------------------
+
+    def gc(self, grace_seconds: float = 3600.0) -> dict:
+        """Delete unreferenced blobs.
+
+        Parameters
+        ----------
+        grace_seconds : float
+            Keep unreferenced blobs younger than this, so a blob written by
+            a concurrent :meth:`put` is not collected before its reference
+            file exists.
+
+        Returns
+        -------
+        dict
+            ``removed`` blob count and ``freed_bytes``.
+        """
+        removed = freed = 0
+        cutoff = time.time() - grace_seconds
+        for path in self._objects.glob("*/*"):
+            if path.name.startswith(".tmp-"):
+                continue
+            digest = path.parent.name + path.name
+            ref_dir = self._refs / digest
+            if ref_dir.is_dir() and any(ref_dir.iterdir()):
+                continue
+            stat = path.stat()
+            if stat.st_mtime > cutoff:
+                continue
+            path.unlink()
+            if ref_dir.is_dir():
+                ref_dir.rmdir()
+            removed += 1
+            freed += stat.st_size
+        return {"removed": removed, "freed_bytes": freed}
+
+    def stats(self) -> dict:
+        """Number of stored blobs and their total size in bytes."""
+        sizes = [
+            p.stat().st_size for p in self._objects.glob("*/*") if not p.name.startswith(".tmp-")
+        ]
+        return {"objects": len(sizes), "bytes": sum(sizes)}
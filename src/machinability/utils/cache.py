@@ -0,0 +1,361 @@
+"""On-disk memoization of pipeline stages keyed by content hashes.
+
+:func:`memoize` caches a function's return value under a key built from
+the function identity (module, qualified name and source) and a stable
+content hash of its arguments. DataFrames, Series and arrays are hashed
+from their raw buffers in 1 MiB chunks rather than pickled, so hashing a
+large table is cheap and independent of pickle details; sklearn
+estimators are hashed by class, parameters and fitted attributes.
+
+Values are pickled under ``results/cache/``. The cache is bounded by
+total size and entry age; a hit refreshes the entry's modification time,
+so eviction removes the least recently used entries first.
+
+Caching is opt-in: memoized functions behave exactly like the undecorated
+ones unless the ``MACHINABILITY_CACHE`` environment variable is set
+(``1`` for the default directory, or a directory path) or
+:func:`enable_cache` has been called.
+
+Usage::
+
+    from src.machinability.utils.cache import enable_cache, memoize
+
+    enable_cache()
+
+    @memoize
+    def clean(df: pd.DataFrame) -> pd.DataFrame:
+        ...
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.machinability.utils.config import RESULTS_DIR
+
+CACHE_DIR = RESULTS_DIR / "cache"
+CACHE_ENV = "MACHINABILITY_CACHE"
+
+_CHUNK = 1 << 20
+_MISSING = object()
+
+
+# ---------------------------------------------------------------------------
+# Content hashing
+# ---------------------------------------------------------------------------
+
+
+def _update_buffer(h, arr: np.ndarray) -> None:
+    flat = memoryview(np.ascontiguousarray(arr)).cast("B")
+    for start in range(0, len(flat), _CHUNK):
+        h.update(flat[start : start + _CHUNK])
+
+
+def _update(h, obj) -> None:
+    """Feed a type-tagged, stable representation of *obj* into *h*."""
+    if obj is None or isinstance(obj, (bool, int, float, complex, str)):
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        h.update(f"bytes:{len(obj)};".encode())
+        h.update(obj)
+    elif isinstance(obj, np.ndarray):
+        h.update(f"ndarray:{obj.dtype.str}:{obj.shape};".encode())
+        if obj.dtype.hasobject:
+            _update(h, obj.tolist())
+        else:
+            _update_buffer(h, obj)
+    elif isinstance(obj, np.generic):
+        _update(h, obj.item())
+    elif isinstance(obj, pd.DataFrame):
+        h.update(f"DataFrame:{obj.shape};".encode())
+        _update(h, obj.index)
+        _update(h, list(obj.columns))
+        for _, column in obj.items():
+            _update_values(h, column)
+    elif isinstance(obj, pd.Series):
+        h.update(b"Series;")
+        _update(h, obj.name)
+        _update(h, obj.index)
+        _update_values(h, obj)
+    elif isinstance(obj, pd.RangeIndex):
+        h.update(f"RangeIndex:{obj.start}:{obj.stop}:{obj.step}:{obj.name!r};".encode())
+    elif isinstance(obj, pd.Index):
+        h.update(f"Index:{obj.name!r};".encode())
+        _update_values(h, obj)
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"{type(obj).__name__}:{len(obj)};".encode())
+        for item in obj:
+            _update(h, item)
+    elif isinstance(obj, dict):
+        h.update(f"dict:{len(obj)};".encode())
+        for key in sorted(obj, key=repr):
+            _update(h, key)
+            _update(h, obj[key])
+    elif isinstance(obj, (set, frozenset)):
+        h.update(f"set:{len(obj)};".encode())
+        for digest in sorted(stable_hash(item) for item in obj):
+            h.update(digest.encode())
+    elif isinstance(obj, Path):
+        h.update(f"Path:{obj};".encode())
+        if obj.is_file():
+            with open(obj, "rb") as fh:
+                while chunk := fh.read(_CHUNK):
+                    h.update(chunk)
+    elif hasattr(obj, "get_params"):
+        # sklearn-style estimator: hyperparameters plus any fitted state
+        cls = type(obj)
+        h.update(f"estimator:{cls.__module__}.{cls.__qualname__};".encode())
+        _update(h, obj.get_params(deep=False))
+        _update(h, {k: v for k, v in vars(obj).items() if k.endswith("_")})
+    else:
+        h.update(f"pickle:{type(obj).__qualname__};".encode())
+        h.update(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _update_values(h, values) -> None:
+    """Hash the values of a Series or Index from its buffer where possible."""
+    h.update(f"{values.dtype};".encode())
+    arr = values.to_numpy()
+    if arr.dtype.hasobject or not isinstance(arr, np.ndarray):
+        arr = pd.util.hash_pandas_object(values, index=False).to_numpy()
+    _update_buffer(h, arr)
+
+
+def stable_hash(*objects) -> str:
+    """Content hash of *objects* that is stable across processes and sessions.
+
+    Returns
+    -------
+    str
+        Hex digest (32 characters).
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for obj in objects:
+        _update(h, obj)
+    return h.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Disk cache
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters of a cache or of one memoized function."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class DiskCache:
+    """Pickled values on disk with size- and age-bounded LRU eviction.
+
+    Parameters
+    ----------
+    root : Path
+        Cache directory (default: ``results/cache``).
+    max_bytes : int
+        Total size above which least recently used entries are evicted.
+    max_age : float
+        Seconds since last use after which an entry is evicted.
+    """
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        max_bytes: int = 1 << 30,
+        max_age: float = 7 * 24 * 3600.0,
+    ):
+        self.root = Path(root or CACHE_DIR)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.pkl"
+
+    def _count(self, field: str, n: int = 1) -> None:
+        with self._lock:
+            setattr(self.stats, field, getattr(self.stats, field) + n)
+
+    def get(self, key: str, default=None):
+        """Cached value for *key*, or *default* on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fh:
+                value = pickle.load(fh)
+        except FileNotFoundError:
+            self._count("misses")
+            return default
+        except Exception:  # truncated or unreadable entry: drop it
+            path.unlink(missing_ok=True)
+            self._count("misses")
+            return default
+        os.utime(path)  # mark as recently used
+        self._count("hits")
+        return value
+
+    def set(self, key: str, value) -> None:
+        """Store *value* under *key* (atomically), then enforce the bounds."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self._count("writes")
+        self.evict()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.root.glob("*/*.pkl"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def evict(self) -> int:
+        """Remove expired entries, then LRU entries until within ``max_bytes``.
+
+        Returns the number of entries removed.
+        """
+        entries = sorted(self._entries())
+        cutoff = time.time() - self.max_age
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for mtime, size, path in entries:
+            if mtime >= cutoff and total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        self._count("evictions", removed)
+        return removed
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def clear(self) -> None:
+        for _, _, path in self._entries():
+            path.unlink(missing_ok=True)
+
+
+_state = {"cache": None, "configured": False}
+
+
+def enable_cache(
+    root: Path | None = None,
+    max_bytes: int = 1 << 30,
+    max_age: float = 7 * 24 * 3600.0,
+) -> DiskCache:
+    """Turn on memoization for this process and return the active cache."""
+    _state["cache"] = DiskCache(root, max_bytes=max_bytes, max_age=max_age)
+    _state["configured"] = True
+    return _state["cache"]
+
+
+def disable_cache() -> None:
+    """Turn memoization off for this process (cached entries are kept)."""
+    _state["cache"] = None
+    _state["configured"] = True
+
+
+def get_cache() -> DiskCache | None:
+    """Active cache, configured from ``MACHINABILITY_CACHE`` on first use."""
+    if not _state["configured"]:
+        setting = os.environ.get(CACHE_ENV, "").strip()
+        if setting and setting.lower() not in ("0", "false", "no", "off"):
+            root = None if setting.lower() in ("1", "true", "yes", "on") else Path(setting)
+            enable_cache(root)
+        else:
+            _state["configured"] = True
+    return _state["cache"]
+
+
+# ---------------------------------------------------------------------------
+# Decorator
+# ---------------------------------------------------------------------------
+
+
+def _function_id(func) -> str:
+    try:
+        code = inspect.getsource(func)
+    except (OSError, TypeError):
+        code = func.__code__.co_code.hex()
+    return f"{func.__module__}.{func.__qualname__}:{stable_hash(code)}"
+
+
+def memoize(func=None, *, ignore: tuple[str, ...] = ()):
+    """Cache a function's results on disk when caching is enabled.
+
+    Parameters
+    ----------
+    func : callable
+        Function to wrap; arguments must be hashable by :func:`stable_hash`
+        and the return value picklable.
+    ignore : tuple of str
+        Argument names left out of the key (e.g. ``verbose``).
+
+    The wrapper exposes ``cache_stats`` (a per-function :class:`CacheStats`)
+    and ``uncached`` (the original function).
+    """
+    if func is None:
+        return functools.partial(memoize, ignore=ignore)
+
+    signature = inspect.signature(func)
+    stats = CacheStats()
+    identity = []
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = get_cache()
+        if cache is None:
+            return func(*args, **kwargs)
+        if not identity:
+            identity.append(_function_id(func))
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = {k: v for k, v in bound.arguments.items() if k not in ignore}
+        key = stable_hash(identity[0], arguments)
+
+        value = cache.get(key, _MISSING)
+        if value is not _MISSING:
+            stats.hits += 1
+            return value
+        stats.misses += 1
+        value = func(*args, **kwargs)
+        cache.set(key, value)
+        stats.writes += 1
+        return value
+
+    wrapper.cache_stats = stats
+    wrapper.uncached = func
+    return wrapper
@@ -10,9 +10,11 @@ DATA_RAW = REPO_ROOT / "data" / "raw"
 DATA_PROCESSED = REPO_ROOT / "data" / "processed"
 DATA_EXTERNAL = REPO_ROOT / "data" / "external"
 EVIDENCE_MATRIX = REPO_ROOT / "02_EVIDENCE_MATRIX" / "evidence_matrix.csv"
+LITERATURE_DIR = REPO_ROOT / "01_LITERATURE"
 NOTEBOOKS_DIR = REPO_ROOT / "notebooks"
 RESULTS_DIR = REPO_ROOT / "results"
 MODELS_DIR = REPO_ROOT / "04_MODELS"
+MODEL_REGISTRY_DIR = RESULTS_DIR / "models"
 
 # MLflow
 MLFLOW_TRACKING_URI = f"file://{REPO_ROOT / 'mlruns'}"
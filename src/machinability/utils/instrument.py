@@ -0,0 +1,312 @@
+"""Lightweight timing and memory instrumentation for hot paths.
+
+:func:`timed` (decorator) and :func:`stage` (context manager) record, per
+call, the wall time, process CPU time, growth of the peak RSS, the peak of
+traced allocations (when :mod:`tracemalloc` is tracing) and a row count.
+Records go to an in-process :class:`MetricsRegistry` (:data:`REGISTRY` by
+default), which keeps per-stage aggregates plus a bounded list of recent
+records and can be exported as Prometheus text or JSON.
+
+Usage::
+
+    from src.machinability.utils.instrument import REGISTRY, stage, timed
+
+    @timed(rows="df")
+    def clean(df):
+        ...
+
+    with stage("train") as record:
+        model.fit(X, y)
+        record.rows = len(X)
+
+    print(REGISTRY.to_prometheus())
+
+Recording costs a few microseconds per call. Allocation peaks are only
+measured while tracemalloc is tracing (``enable_tracemalloc()`` or
+``PYTHONTRACEMALLOC=1``); tracing itself slows allocation-heavy code.
+CPU time and RSS are process-wide, so concurrent threads are included.
+The tracemalloc peak is process-wide too: each stage resets it on entry,
+so stages running concurrently in other threads (e.g. two dashboard
+sessions) can lower or inflate each other's ``alloc_peak_bytes``.
+Nesting is tracked per thread; ``StageRecord.depth`` is 0 for outermost
+stages, so summing the depth-0 records of a thread gives its total time.
+"""
+
+import functools
+import inspect
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROMETHEUS_PREFIX = "machinability_stage"
+
+
+def max_rss_bytes() -> int | None:
+    """Peak resident set size of this process so far (``None`` if unknown)."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def enable_tracemalloc(frames: int = 1) -> None:
+    """Start tracing allocations so stages also record allocation peaks."""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+
+
+def count_rows(value) -> int | None:
+    """Row count of a result: ``len`` of frames and arrays, ``n`` of a stats dict."""
+    if isinstance(value, tuple) and value:
+        value = value[0]
+    if isinstance(value, dict):
+        n = value.get("n")
+        return int(n) if isinstance(n, int) else None
+    shape = getattr(value, "shape", None)
+    if shape:
+        return int(shape[0])
+    return None
+
+
+@dataclass
+class StageRecord:
+    """Measurements of one instrumented call."""
+
+    name: str
+    seq: int = 0
+    start: float = 0.0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    rss_growth_bytes: int | None = None
+    alloc_peak_bytes: int | None = None
+    rows: int | None = None
+    error: str | None = None
+    depth: int = 0
+    thread: int = field(default_factory=threading.get_ident)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class StageStats:
+    """Aggregate of all records of one stage."""
+
+    calls: int = 0
+    errors: int = 0
+    wall_s_total: float = 0.0
+    wall_s_max: float = 0.0
+    wall_s_last: float = 0.0
+    cpu_s_total: float = 0.0
+    rows_total: int = 0
+    alloc_peak_bytes_max: int = 0
+    rss_growth_bytes_total: int = 0
+
+    def add(self, record: StageRecord) -> None:
+        self.calls += 1
+        self.errors += record.error is not None
+        self.wall_s_total += record.wall_s
+        self.wall_s_max = max(self.wall_s_max, record.wall_s)
+        self.wall_s_last = record.wall_s
+        self.cpu_s_total += record.cpu_s
+        self.rows_total += record.rows or 0
+        self.alloc_peak_bytes_max = max(self.alloc_peak_bytes_max, record.alloc_peak_bytes or 0)
+        self.rss_growth_bytes_total += record.rss_growth_bytes or 0
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricsRegistry:
+    """Thread-safe store of stage records and per-stage aggregates.
+
+    Parameters
+    ----------
+    max_records : int
+        Number of recent records kept for :meth:`records`; aggregates
+        cover every call.
+    """
+
+    def __init__(self, max_records: int = 10_000):
+        self._lock = threading.Lock()
+        self._stats: dict[str, StageStats] = {}
+        self._records: deque[StageRecord] = deque(maxlen=max_records)
+        self._seq = 0
+
+    def add(self, record: StageRecord) -> None:
+        with self._lock:
+            self._seq += 1
+            record.seq = self._seq
+            self._stats.setdefault(record.name, StageStats()).add(record)
+            self._records.append(record)
+
+    def mark(self) -> int:
+        """Sequence number to pass to :meth:`records` as ``since``."""
+        with self._lock:
+            return self._seq
+
+    def records(self, since: int = 0, thread: int | None = None) -> list[StageRecord]:
+        """Recent records after the ``since`` mark, optionally from one thread."""
+        with self._lock:
+            return [
+                r for r in self._records if r.seq > since and (thread is None or r.thread == thread)
+            ]
+
+    def stats(self) -> dict[str, StageStats]:
+        """Copy of the per-stage aggregates."""
+        with self._lock:
+            return {name: StageStats(**asdict(s)) for name, s in self._stats.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._records.clear()
+
+    # -- export ---------------------------------------------------------------
+
+    def to_json(self, since: int | None = None, indent: int | None = 2) -> str:
+        """Aggregates, process peak RSS and (with ``since``) recent records as JSON."""
+        payload = {
+            "stages": {name: asdict(s) for name, s in sorted(self.stats().items())},
+            "process": {"max_rss_bytes": max_rss_bytes()},
+        }
+        if since is not None:
+            payload["records"] = [r.to_dict() for r in self.records(since)]
+        return json.dumps(payload, indent=indent)
+
+    def to_prometheus(self) -> str:
+        """Aggregates in the Prometheus text exposition format (0.0.4)."""
+        metrics = [
+            ("calls_total", "counter", "Calls of the stage.", "calls"),
+            ("errors_total", "counter", "Calls that raised.", "errors"),
+            ("wall_seconds_total", "counter", "Wall time spent in the stage.", "wall_s_total"),
+            ("cpu_seconds_total", "counter", "Process CPU time spent in the stage.", "cpu_s_total"),
+            ("rows_total", "counter", "Rows processed by the stage.", "rows_total"),
+            ("wall_seconds_max", "gauge", "Slowest call of the stage.", "wall_s_max"),
+            ("wall_seconds_last", "gauge", "Most recent call of the stage.", "wall_s_last"),
+            (
+                "alloc_peak_bytes_max",
+                "gauge",
+                "Largest traced allocation peak of a call (0 unless tracemalloc is tracing).",
+                "alloc_peak_bytes_max",
+            ),
+        ]
+        stats = sorted(self.stats().items())
+        lines = []
+        for suffix, kind, help_text, attr in metrics:
+            name = f"{PROMETHEUS_PREFIX}_{suffix}"
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            lines += [
+                f'{name}{{stage="{_escape_label(stage_name)}"}} {getattr(s, attr)}'
+                for stage_name, s in stats
+            ]
+        rss = max_rss_bytes()
+        if rss is not None:
+            name = "machinability_process_max_rss_bytes"
+            lines += [
+                f"# HELP {name} Peak resident set size of the process.",
+                f"# TYPE {name} gauge",
+                f"{name} {rss}",
+            ]
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+_local = threading.local()
+
+
+@contextmanager
+def stage(name: str, registry: MetricsRegistry | None = None, rows: int | None = None):
+    """Record the enclosed block as one call of stage *name*.
+
+    Yields the :class:`StageRecord`; set its ``rows`` inside the block.
+    Stages may be nested; an inner stage's allocation peak also counts
+    towards the enclosing one, and its ``depth`` is one more. The
+    allocation peak is reset process-wide on entry (see the module notes
+    on concurrent threads).
+    """
+    depth = _local.__dict__.get("depth", 0)
+    record = StageRecord(name, rows=rows, start=time.time(), depth=depth)
+    _local.depth = depth + 1
+    tracing = tracemalloc.is_tracing()
+    frames = _local.__dict__.setdefault("frames", [])
+    if tracing:
+        current, peak = tracemalloc.get_traced_memory()
+        if frames:
+            frames[-1]["peak"] = max(frames[-1]["peak"], peak)
+        tracemalloc.reset_peak()
+        frames.append({"base": current, "peak": 0})
+    rss0 = max_rss_bytes()
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    try:
+        yield record
+    except BaseException as exc:
+        record.error = type(exc).__name__
+        raise
+    finally:
+        _local.depth = depth
+        record.wall_s = time.perf_counter() - wall0
+        record.cpu_s = time.process_time() - cpu0
+        if rss0 is not None:
+            record.rss_growth_bytes = max_rss_bytes() - rss0
+        if tracing and tracemalloc.is_tracing():
+            frame = frames.pop()
+            peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+            record.alloc_peak_bytes = max(peak - frame["base"], 0)
+            if frames:
+                frames[-1]["peak"] = max(frames[-1]["peak"], peak)
+        elif tracing:
+            frames.pop()
+        (registry or REGISTRY).add(record)
+
+
+def timed(
+    func=None,
+    *,
+    name: str | None = None,
+    rows: str | None = None,
+    registry: MetricsRegistry | None = None,
+):
+    """Record every call of the decorated function as a stage.
+
+    Parameters
+    ----------
+    name : str, optional
+        Stage name (default: ``<module>.<qualname>`` with the module's
+        last component, e.g. ``loader.load_conductivity_data``).
+    rows : str, optional
+        Argument whose length is the row count. By default the count is
+        taken from the return value (see :func:`count_rows`).
+    registry : MetricsRegistry, optional
+        Target registry (default: :data:`REGISTRY`).
+    """
+    if func is None:
+        return functools.partial(timed, name=name, rows=rows, registry=registry)
+
+    stage_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+    signature = inspect.signature(func) if rows else None
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with stage(stage_name, registry) as record:
+            if rows:
+                arg = signature.bind_partial(*args, **kwargs).arguments.get(rows)
+                record.rows = len(arg) if arg is not None else None
+            result = func(*args, **kwargs)
+            if record.rows is None:
+                record.rows = count_rows(result)
+            return result
+
+    return wrapper
@@ -0,0 +1,296 @@
+"""Opt-in sampling profiler for dashboard reruns and CLI jobs.
+
+:class:`SamplingProfiler` samples the Python stack of one thread from a
+background thread every few milliseconds (``sys._current_frames``), so it
+needs no extra dependency and adds little overhead to the profiled code.
+Each sample is weighted by the measured time since the previous one.
+
+:func:`maybe_profile` wraps a block and, when profiling is requested,
+writes three files per run to ``results/profiles/``::
+
+    <timestamp>_<label>.collapsed.txt    folded stacks (flamegraph.pl, speedscope)
+    <timestamp>_<label>.speedscope.json  open in https://www.speedscope.app
+    <timestamp>_<label>.meta.json        label, duration, samples, argv, commit, ...
+
+Profiling is requested by the ``MACHINABILITY_PROFILE`` environment
+variable (``1`` for the default directory, or a directory path) or, in
+the dashboard, by the ``?profile=1`` query parameter.
+
+Native code that holds the GIL delays sampling; its time is attributed
+to the next sample taken, so treat short C-heavy frames with care.
+"""
+
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from src.machinability.utils.config import REPO_ROOT, RESULTS_DIR
+
+PROFILE_DIR = RESULTS_DIR / "profiles"
+PROFILE_ENV = "MACHINABILITY_PROFILE"
+QUERY_PARAM = "profile"
+
+_TRUE = ("1", "true", "yes", "on")
+_FALSE = ("", "0", "false", "no", "off")
+
+
+def _frame_key(code) -> tuple[str, str, int]:
+    path = Path(code.co_filename)
+    try:
+        filename = str(path.relative_to(REPO_ROOT))
+    except ValueError:
+        filename = code.co_filename
+    return code.co_name, filename, code.co_firstlineno
+
+
+class SamplingProfiler:
+    """Statistical profiler of a single thread.
+
+    Parameters
+    ----------
+    interval : float
+        Seconds between samples.
+    thread_id : int, optional
+        Thread to sample (default: the thread calling :meth:`start`).
+    """
+
+    def __init__(self, interval: float = 0.005, thread_id: int | None = None):
+        self.interval = interval
+        self.thread_id = thread_id
+        self.frames: list[tuple[str, str, int]] = []
+        self._frame_index: dict[tuple, int] = {}
+        self._stack_index: dict[tuple, int] = {}
+        self.stacks: list[tuple[int, ...]] = []
+        self.samples: list[int] = []  # stack ids in time order, repeats merged
+        self.n_samples = 0
+        self.weights: list[float] = []  # seconds per sample
+        self.started = self.stopped = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    # -- sampling -------------------------------------------------------------
+
+    def start(self) -> "SamplingProfiler":
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self.started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> "SamplingProfiler":
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.stopped = time.perf_counter()
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _run(self) -> None:
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            if frame is None:
+                break  # profiled thread has exited
+            self._record(frame, now - last)
+            last = now
+
+    def _record(self, frame, weight: float) -> None:
+        self.n_samples += 1
+        keys = []
+        while frame is not None:
+            keys.append(_frame_key(frame.f_code))
+            frame = frame.f_back
+        stack = []
+        for key in reversed(keys):  # root first
+            if key not in self._frame_index:
+                self._frame_index[key] = len(self.frames)
+                self.frames.append(key)
+            stack.append(self._frame_index[key])
+        stack = tuple(stack)
+        if stack not in self._stack_index:
+            self._stack_index[stack] = len(self.stacks)
+            self.stacks.append(stack)
+        stack_id = self._stack_index[stack]
+        if self.samples and self.samples[-1] == stack_id:
+            self.weights[-1] += weight
+        else:
+            self.samples.append(stack_id)
+            self.weights.append(weight)
+
+    # -- output ---------------------------------------------------------------
+
+    @property
+    def duration(self) -> float:
+        end = self.stopped if self.stopped is not None else time.perf_counter()
+        return end - self.started if self.started is not None else 0.0
+
+    def frame_name(self, index: int) -> str:
+        name, filename, line = self.frames[index]
+        return f"{name} ({filename}:{line})".replace(";", ":")
+
+    def to_collapsed(self) -> str:
+        """Folded stacks, one ``frame;frame;... <microseconds>`` line per stack."""
+        totals: dict[int, float] = {}
+        for stack_id, weight in zip(self.samples, self.weights):
+            totals[stack_id] = totals.get(stack_id, 0.0) + weight
+        lines = [
+            ";".join(self.frame_name(i) for i in self.stacks[stack_id]) + f" {round(total * 1e6)}"
+            for stack_id, total in sorted(totals.items())
+        ]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def to_speedscope(self, name: str) -> dict:
+        """Sampled profile in the speedscope file format (seconds)."""
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "exporter": "machinability",
+            "name": name,
+            "activeProfileIndex": 0,
+            "shared": {
+                "frames": [{"name": n, "file": f, "line": line} for n, f, line in self.frames]
+            },
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0.0,
+                    "endValue": sum(self.weights),
+                    "samples": [list(self.stacks[s]) for s in self.samples],
+                    "weights": self.weights,
+                }
+            ],
+        }
+
+
+# ---------------------------------------------------------------------------
+# Opt-in hook
+# ---------------------------------------------------------------------------
+
+
+def profile_dir_from_env() -> Path | None:
+    """Output directory requested by ``MACHINABILITY_PROFILE``, or ``None``."""
+    setting = os.environ.get(PROFILE_ENV, "").strip()
+    if setting.lower() in _FALSE:
+        return None
+    return PROFILE_DIR if setting.lower() in _TRUE else Path(setting)
+
+
+def profiling_requested(query_params=None) -> bool:
+    """Whether the environment or a ``?profile=`` query parameter asks for a profile."""
+    if profile_dir_from_env() is not None:
+        return True
+    if query_params is not None:
+        value = query_params.get(QUERY_PARAM)
+        return value is not None and str(value).strip().lower() not in _FALSE[1:]
+    return False
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def write_profile(
+    profiler: SamplingProfiler,
+    label: str,
+    out_dir: Path | None = None,
+    metadata: dict | None = None,
+) -> dict[str, Path]:
+    """Write collapsed, speedscope and metadata files for a finished profile.
+
+    Returns
+    -------
+    dict
+        Paths keyed by ``collapsed``, ``speedscope`` and ``meta``.
+    """
+    out_dir = Path(out_dir or profile_dir_from_env() or PROFILE_DIR)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    stem = f"{stamp}_{re.sub(r'[^A-Za-z0-9_.-]+', '-', label).strip('-') or 'profile'}"
+    paths = {
+        "collapsed": out_dir / f"{stem}.collapsed.txt",
+        "speedscope": out_dir / f"{stem}.speedscope.json",
+        "meta": out_dir / f"{stem}.meta.json",
+    }
+    paths["collapsed"].write_text(profiler.to_collapsed())
+    paths["speedscope"].write_text(json.dumps(profiler.to_speedscope(label)))
+    meta = {
+        "label": label,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "duration_s": profiler.duration,
+        "sampled_s": sum(profiler.weights),
+        "samples": profiler.n_samples,
+        "interval_s": profiler.interval,
+        "argv": sys.argv,
+        "pid": os.getpid(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "commit": _git_commit(),
+        **(metadata or {}),
+    }
+    paths["meta"].write_text(json.dumps(meta, indent=2, default=str) + "\n")
+    return paths
+
+
+@contextmanager
+def maybe_profile(
+    label: str,
+    enabled: bool | None = None,
+    out_dir: Path | None = None,
+    interval: float = 0.005,
+    metadata: dict | None = None,
+):
+    """Profile the enclosed block when profiling is requested.
+
+    Parameters
+    ----------
+    label : str
+        Run label, used in file names (e.g. ``"page-ML Models"``).
+    enabled : bool, optional
+        Force profiling on or off (default: :func:`profiling_requested`).
+    out_dir : Path, optional
+        Output directory (default: from ``MACHINABILITY_PROFILE``, else
+        ``results/profiles``).
+    interval : float
+        Seconds between samples.
+    metadata : dict, optional
+        Extra entries for the ``.meta.json`` file.
+
+    Yields the running :class:`SamplingProfiler` (``None`` when disabled);
+    after the block its ``paths`` attribute holds the written files. The
+    profile is written even if the block raises.
+    """
+    if not (profiling_requested() if enabled is None else enabled):
+        yield None
+        return
+    profiler = SamplingProfiler(interval=interval).start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        profiler.paths = write_profile(profiler, label, out_dir, metadata)
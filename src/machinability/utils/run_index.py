@@ -0,0 +1,367 @@
+"""Queryable SQLite index of the MLflow ``mlruns/`` file store.
+
+``mlflow.search_runs`` against the file store opens every ``meta.yaml``,
+param, metric and tag file of every run on each call. :class:`RunIndex`
+mirrors the same information into one SQLite database
+(``results/run_index.sqlite``) and, on :meth:`RunIndex.update`, re-reads
+only runs whose files changed since the last update (detected from file
+modification times), so comparisons across the whole experiment history
+become indexed SQL queries.
+
+Only the latest value of each metric is indexed (the value
+``search_runs`` reports); full metric histories stay in ``mlruns/``.
+
+Usage::
+
+    with RunIndex() as index:
+        index.update()
+        rf = index.runs(params={"model_type": "Random Forest"})
+        best = index.best_runs("r2", by=["model_type", "target_metric"])
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+
+import pandas as pd
+import yaml
+
+from src.machinability.utils.config import REPO_ROOT, RESULTS_DIR
+
+DEFAULT_INDEX_PATH = RESULTS_DIR / "run_index.sqlite"
+DEFAULT_MLRUNS_DIR = REPO_ROOT / "mlruns"
+
+# mlflow.entities.RunStatus values as written to the file store's meta.yaml
+_RUN_STATUS = {1: "RUNNING", 2: "SCHEDULED", 3: "FINISHED", 4: "FAILED", 5: "KILLED"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    experiment_id TEXT NOT NULL,
+    experiment TEXT,
+    run_name TEXT,
+    status TEXT,
+    start_time INTEGER,
+    end_time INTEGER,
+    lifecycle_stage TEXT,
+    signature TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS params (
+    run_id TEXT NOT NULL, key TEXT NOT NULL, value TEXT,
+    PRIMARY KEY (run_id, key)
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id TEXT NOT NULL, key TEXT NOT NULL, value REAL, step INTEGER, timestamp INTEGER,
+    PRIMARY KEY (run_id, key)
+);
+CREATE TABLE IF NOT EXISTS tags (
+    run_id TEXT NOT NULL, key TEXT NOT NULL, value TEXT,
+    PRIMARY KEY (run_id, key)
+);
+CREATE INDEX IF NOT EXISTS params_key_value ON params (key, value);
+CREATE INDEX IF NOT EXISTS metrics_key_value ON metrics (key, value);
+CREATE INDEX IF NOT EXISTS runs_experiment ON runs (experiment);
+"""
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _read_yaml(path: Path) -> dict:
+    with open(path, encoding="utf-8") as fh:
+        return yaml.load(fh, Loader=_Loader) or {}
+
+
+def _walk_files(directory: str, prefix: str = ""):
+    """Yield ``(key, path, stat)`` for the files below *directory*.
+
+    Nested directories form ``/``-separated keys (MLflow stores a metric
+    named ``a/b`` as ``metrics/a/b``).
+    """
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        key = prefix + entry.name
+        if entry.is_dir():
+            yield from _walk_files(entry.path, key + "/")
+        else:
+            yield key, entry.path, entry.stat()
+
+
+def _run_signature(run_dir: str) -> tuple[str, dict]:
+    """Change signature of a run plus its files grouped by kind."""
+    files: dict = {"params": [], "metrics": [], "tags": []}
+    latest = os.stat(os.path.join(run_dir, "meta.yaml")).st_mtime_ns
+    count = 0
+    for kind, listing in files.items():
+        for key, path, st in _walk_files(os.path.join(run_dir, kind)):
+            listing.append((key, path))
+            latest = max(latest, st.st_mtime_ns)
+            count += 1
+    return f"{latest}:{count}", files
+
+
+def _latest_metric(path: str) -> tuple[float, int, int] | None:
+    """Latest ``(value, step, timestamp)`` of a metric file, as MLflow orders them."""
+    best = None
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            parts = line.split()
+            if len(parts) < 2:
+                continue
+            timestamp, value = int(parts[0]), float(parts[1])
+            step = int(parts[2]) if len(parts) > 2 else 0
+            if best is None or (step, timestamp, value) > best:
+                best = (step, timestamp, value)
+    if best is None:
+        return None
+    step, timestamp, value = best
+    return value, step, timestamp
+
+
+def _read_text(path: str) -> str:
+    with open(path, encoding="utf-8") as fh:
+        return fh.read()
+
+
+class RunIndex:
+    """SQLite mirror of the runs in an MLflow file store.
+
+    Parameters
+    ----------
+    db_path : Path
+        Database file (created if missing; ``":memory:"`` for a throwaway
+        index).
+    mlruns_dir : Path
+        Root of the MLflow file store.
+    """
+
+    def __init__(self, db_path=DEFAULT_INDEX_PATH, mlruns_dir=DEFAULT_MLRUNS_DIR):
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.mlruns_dir = Path(mlruns_dir)
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "RunIndex":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # -- indexing -------------------------------------------------------------
+
+    def update(self) -> dict:
+        """Re-read new and changed runs and drop runs that no longer exist.
+
+        Returns
+        -------
+        dict
+            Counts of ``added``, ``updated``, ``removed`` and ``unchanged``
+            runs.
+        """
+        known = dict(self.conn.execute("SELECT run_id, signature FROM runs"))
+        counts = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        seen = set()
+        with self.conn:
+            for exp_dir in self._experiment_dirs():
+                exp_meta = _read_yaml(exp_dir / "meta.yaml")
+                exp_id = str(exp_meta.get("experiment_id", exp_dir.name))
+                for entry in os.scandir(exp_dir):
+                    if not entry.is_dir() or not os.path.exists(
+                        os.path.join(entry.path, "meta.yaml")
+                    ):
+                        continue
+                    run_id = entry.name
+                    seen.add(run_id)
+                    signature, files = _run_signature(entry.path)
+                    if known.get(run_id) == signature:
+                        counts["unchanged"] += 1
+                        continue
+                    counts["updated" if run_id in known else "added"] += 1
+                    self._index_run(
+                        run_id, exp_id, exp_meta.get("name"), entry.path, signature, files
+                    )
+            for run_id in set(known) - seen:
+                self._delete_run(run_id)
+                counts["removed"] += 1
+        return counts
+
+    def _experiment_dirs(self):
+        if not self.mlruns_dir.is_dir():
+            return []
+        return [
+            d
+            for d in self.mlruns_dir.iterdir()
+            if d.is_dir() and not d.name.startswith(".") and (d / "meta.yaml").exists()
+        ]
+
+    def _delete_run(self, run_id: str) -> None:
+        for table in ("runs", "params", "metrics", "tags"):
+            self.conn.execute(f"DELETE FROM {table} WHERE run_id = ?", (run_id,))
+
+    def _index_run(self, run_id, exp_id, exp_name, run_dir, signature, files) -> None:
+        meta = _read_yaml(Path(run_dir) / "meta.yaml")
+        self._delete_run(run_id)
+        status = meta.get("status")
+        self.conn.execute(
+            "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                run_id,
+                exp_id,
+                exp_name,
+                meta.get("run_name"),
+                _RUN_STATUS.get(status, status),
+                meta.get("start_time"),
+                meta.get("end_time"),
+                meta.get("lifecycle_stage"),
+                signature,
+            ),
+        )
+        self.conn.executemany(
+            "INSERT INTO params VALUES (?, ?, ?)",
+            [(run_id, key, _read_text(path)) for key, path in files["params"]],
+        )
+        self.conn.executemany(
+            "INSERT INTO tags VALUES (?, ?, ?)",
+            [(run_id, key, _read_text(path)) for key, path in files["tags"]],
+        )
+        metrics = []
+        for key, path in files["metrics"]:
+            latest = _latest_metric(path)
+            if latest is not None:
+                metrics.append((run_id, key, *latest))
+        self.conn.executemany("INSERT INTO metrics VALUES (?, ?, ?, ?, ?)", metrics)
+
+    # -- queries --------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    @staticmethod
+    def _where(experiment, params, status, include_deleted) -> tuple[str, list]:
+        clauses, args = [], []
+        if experiment is not None:
+            clauses.append("r.experiment = ?")
+            args.append(experiment)
+        if status is not None:
+            clauses.append("r.status = ?")
+            args.append(status)
+        if not include_deleted:
+            clauses.append("COALESCE(r.lifecycle_stage, 'active') != 'deleted'")
+        for key, value in (params or {}).items():
+            values = [value] if isinstance(value, str) or not hasattr(value, "__iter__") else value
+            values = [str(v) for v in values]
+            clauses.append(
+                "EXISTS (SELECT 1 FROM params p WHERE p.run_id = r.run_id AND p.key = ? "
+                f"AND p.value IN ({', '.join('?' * len(values))}))"
+            )
+            args.extend([key, *values])
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", args
+
+    def runs(
+        self,
+        experiment: str | None = None,
+        params: dict | None = None,
+        status: str | None = None,
+        include_deleted: bool = False,
+    ) -> pd.DataFrame:
+        """Runs matching the filters as one wide table.
+
+        Parameters
+        ----------
+        experiment : str, optional
+            Experiment name.
+        params : dict, optional
+            Parameter filters ``{key: value}``; a list of values matches any
+            of them. Values are compared as strings, as MLflow stores them.
+        status : str, optional
+            Run status, e.g. ``"FINISHED"``.
+        include_deleted : bool
+            Include runs in the ``deleted`` lifecycle stage.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per run with ``run_id``, ``experiment``, ``run_name``,
+            ``status``, ``start_time``, ``end_time`` and ``params.<key>``,
+            ``metrics.<key>``, ``tags.<key>`` columns (the
+            ``mlflow.search_runs`` naming), newest first.
+        """
+        where, args = self._where(experiment, params, status, include_deleted)
+        return self._frame(f"SELECT r.run_id FROM runs r{where}", args)
+
+    def best_runs(
+        self,
+        metric: str,
+        by,
+        mode: str = "max",
+        experiment: str | None = None,
+        params: dict | None = None,
+        status: str | None = None,
+    ) -> pd.DataFrame:
+        """Best run per group of parameter values.
+
+        Parameters
+        ----------
+        metric : str
+            Metric to rank runs by; runs without it are skipped.
+        by : list of str
+            Parameter keys that define the groups; runs missing any of them
+            are skipped.
+        mode : {"max", "min"}
+            Whether larger or smaller metric values are better.
+        experiment, params, status
+            Filters as in :meth:`runs`.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per group, in the format of :meth:`runs`.
+        """
+        if mode not in ("max", "min"):
+            raise ValueError(f"mode must be 'max' or 'min', got {mode!r}")
+        by = list(by)
+        where, args = self._where(experiment, params, status, include_deleted=False)
+        joins = "".join(
+            f" JOIN params g{i} ON g{i}.run_id = r.run_id AND g{i}.key = ?" for i in range(len(by))
+        )
+        partition = ", ".join(f"g{i}.value" for i in range(len(by))) or "NULL"
+        order = "DESC" if mode == "max" else "ASC"
+        sql = (
+            "SELECT run_id FROM ("
+            "SELECT r.run_id, ROW_NUMBER() OVER ("
+            f"PARTITION BY {partition} ORDER BY m.value {order}, r.start_time DESC) AS rank "
+            "FROM runs r JOIN metrics m ON m.run_id = r.run_id AND m.key = ?"
+            f"{joins}{where}) WHERE rank = 1"
+        )
+        return self._frame(sql, [metric, *by, *args])
+
+    def _frame(self, id_query: str, args: list) -> pd.DataFrame:
+        """Pivot the params, metrics and tags of the runs selected by *id_query*."""
+        self.conn.execute("DROP TABLE IF EXISTS temp.selected")
+        self.conn.execute(f"CREATE TEMP TABLE selected AS {id_query}", args)
+        base = pd.read_sql_query(
+            "SELECT r.run_id, experiment, run_name, status, start_time, end_time "
+            "FROM runs r JOIN temp.selected s ON s.run_id = r.run_id "
+            "ORDER BY start_time DESC",
+            self.conn,
+        )
+        frames = [base.set_index("run_id")]
+        for table in ("params", "metrics", "tags"):
+            long = pd.read_sql_query(
+                f"SELECT t.run_id, key, value FROM {table} t "
+                "JOIN temp.selected s ON s.run_id = t.run_id",
+                self.conn,
+            )
+            if long.empty:
+                continue
+            wide = long.pivot(index="run_id", columns="key", values="value")
+            wide.columns = [f"{table}.{key}" for key in wide.columns]
+            frames.append(wide)
+        self.conn.execute("DROP TABLE temp.selected")
+        return pd.concat(frames, axis=1, join="outer").loc[base["run_id"]].reset_index()
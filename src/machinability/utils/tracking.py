@@ -0,0 +1,278 @@
+"""Buffered, asynchronous MLflow logging for large sweeps.
+
+Every ``mlflow.log_param`` / ``log_metric`` call against the ``mlruns/``
+file store is a synchronous write of a tiny file; in a sweep of many
+runs those writes dominate the runtime. :class:`BufferedRunLogger` turns
+each logging call into an in-memory queue append. A background thread
+coalesces the queued values per run and writes them with one
+``MlflowClient.log_batch`` call per flush (at most every
+``flush_interval`` seconds, and when a run ends). Parameter keys are
+checked against the logging schemas once per run, when it ends.
+
+Usage::
+
+    with BufferedRunLogger() as logger:
+        for params in grid:
+            with logger.start_run(run_name="rf-sweep") as run:
+                run.log_params(params)
+                run.log_metrics({"r2": 0.85, "mape": 0.12})
+"""
+
+import os
+import queue
+import threading
+import time
+import warnings
+from collections import defaultdict
+
+from src.machinability.utils.artifacts import ArtifactStore, to_pointer
+from src.machinability.utils.config import MLFLOW_EXPERIMENT_NAME, MLFLOW_TRACKING_URI
+
+# Standard parameter sets for logging
+CUTTING_PARAMS_SCHEMA = {
+    "cutting_speed_m_min": "Cutting speed (m/min)",
+    "feed_mm_rev": "Feed rate (mm/rev)",
+    "depth_mm": "Depth of cut (mm)",
+    "tool_material": "Tool material / ISO code",
+    "coolant": "Coolant type (dry, flood, MQL)",
+}
+
+MODEL_PARAMS_SCHEMA = {
+    "model_type": "Algorithm name (RF, SVR, ANN, LinearRegression, etc.)",
+    "target_metric": "Target variable (tool_life_min, Ra_um, VB_mm, Fc_N)",
+    "features": "Input features used (comma-separated)",
+    "cv_folds": "Number of cross-validation folds",
+    "steel_grades_train": "Steel grades in training set",
+}
+
+DEFAULT_SCHEMA = {**CUTTING_PARAMS_SCHEMA, **MODEL_PARAMS_SCHEMA}
+
+# MLflow's per-request limits for log_batch (at most 1000 entities in total)
+_MAX_BATCH_METRICS = 800
+_MAX_BATCH_PARAMS = 100
+_MAX_BATCH_TAGS = 100
+
+
+class BufferedRun:
+    """Handle for one run of a :class:`BufferedRunLogger`.
+
+    Logging methods only enqueue values; use the handle as a context
+    manager (or call :meth:`end`) to finish the run.
+    """
+
+    def __init__(self, logger: "BufferedRunLogger", run_id: str):
+        self._logger = logger
+        self.run_id = run_id
+        self._param_keys: set[str] = set()
+        self._ended = False
+
+    def log_param(self, key: str, value) -> None:
+        self.log_params({key: value})
+
+    def log_params(self, params: dict) -> None:
+        self._param_keys.update(params)
+        self._logger._put(("params", self.run_id, {k: str(v) for k, v in params.items()}))
+
+    def log_metric(self, key: str, value: float, step: int = 0) -> None:
+        self.log_metrics({key: value}, step=step)
+
+    def log_metrics(self, metrics: dict, step: int = 0) -> None:
+        timestamp = int(time.time() * 1000)
+        rows = [(k, float(v), timestamp, step) for k, v in metrics.items()]
+        self._logger._put(("metrics", self.run_id, rows))
+
+    def set_tag(self, key: str, value) -> None:
+        self.set_tags({key: value})
+
+    def set_tags(self, tags: dict) -> None:
+        self._logger._put(("tags", self.run_id, {k: str(v) for k, v in tags.items()}))
+
+    def log_artifact(self, source, name: str) -> str:
+        """Store a file or ``bytes`` in the artifact store and tag a pointer.
+
+        The run gets the tag ``artifact.<name> = cas://<digest>``; the blob
+        itself is written once, however many runs log the same content.
+        Returns the digest.
+        """
+        digest = self._logger.artifact_store.put(source, owner=f"{self.run_id}:{name}")
+        self.set_tag(f"artifact.{name}", to_pointer(digest))
+        return digest
+
+    def end(self, status: str = "FINISHED") -> None:
+        """Validate the logged parameter keys and mark the run as finished."""
+        if self._ended:
+            return
+        self._ended = True
+        schema = self._logger.schema
+        if schema is not None:
+            unknown = sorted(self._param_keys - set(schema))
+            if unknown:
+                warnings.warn(
+                    f"Run {self.run_id} logged parameters outside the schema: {unknown}",
+                    stacklevel=2,
+                )
+        self._logger._put(("end", self.run_id, status))
+
+    def __enter__(self) -> "BufferedRun":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end("FAILED" if exc_type is not None else "FINISHED")
+
+
+def allow_file_store(tracking_uri: str) -> None:
+    """Let MLflow use the ``mlruns/`` file store unless the user decided otherwise.
+
+    MLflow 3 refuses ``file:`` tracking URIs unless ``MLFLOW_ALLOW_FILE_STORE``
+    is set. The project keeps the file store (the run index reads it
+    directly), so the variable defaults to ``true``; an explicit value in
+    the environment is left untouched.
+    """
+    if tracking_uri.startswith("file:") or "://" not in tracking_uri:
+        os.environ.setdefault("MLFLOW_ALLOW_FILE_STORE", "true")
+
+
+class BufferedRunLogger:
+    """Log MLflow params, metrics and tags through a background writer.
+
+    Parameters
+    ----------
+    tracking_uri : str
+        MLflow tracking URI (default: the project's ``mlruns/`` file store).
+    experiment_name : str
+        Experiment to create runs in (created if missing).
+    flush_interval : float
+        Maximum seconds values stay buffered before being written.
+    schema : dict or None
+        Allowed parameter keys; unknown keys trigger one warning per run.
+        Defaults to the keys of :data:`CUTTING_PARAMS_SCHEMA` and
+        :data:`MODEL_PARAMS_SCHEMA`; ``None`` disables the check.
+    artifact_store : ArtifactStore, optional
+        Store used by :meth:`BufferedRun.log_artifact` (default:
+        ``results/artifacts``).
+    """
+
+    def __init__(
+        self,
+        tracking_uri: str = MLFLOW_TRACKING_URI,
+        experiment_name: str = MLFLOW_EXPERIMENT_NAME,
+        flush_interval: float = 1.0,
+        schema: dict | None = DEFAULT_SCHEMA,
+        artifact_store: ArtifactStore | None = None,
+    ):
+        from mlflow.tracking import MlflowClient
+
+        allow_file_store(tracking_uri)
+        self.client = MlflowClient(tracking_uri=tracking_uri)
+        experiment = self.client.get_experiment_by_name(experiment_name)
+        self.experiment_id = (
+            experiment.experiment_id
+            if experiment is not None
+            else self.client.create_experiment(experiment_name)
+        )
+        self.flush_interval = flush_interval
+        self.schema = schema
+        self.artifact_store = artifact_store or ArtifactStore()
+        self.errors: list[Exception] = []
+        self._queue: queue.Queue = queue.Queue()
+        self._pending: dict = defaultdict(lambda: {"params": {}, "metrics": [], "tags": {}})
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    # -- public API -----------------------------------------------------------
+
+    def start_run(self, run_name: str | None = None, tags: dict | None = None) -> BufferedRun:
+        """Create a run (synchronously, to obtain its id) and return its handle."""
+        run = self.client.create_run(self.experiment_id, run_name=run_name, tags=tags)
+        return BufferedRun(self, run.info.run_id)
+
+    def flush(self) -> None:
+        """Block until everything logged so far has been written.
+
+        Raises the first error the background writer hit, if any.
+        """
+        if self._thread.is_alive():
+            done = threading.Event()
+            self._queue.put(("flush", None, done))
+            done.wait()
+        self._raise_errors()
+
+    def close(self) -> None:
+        """Flush and stop the background writer."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_errors()
+
+    def __enter__(self) -> "BufferedRunLogger":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # -- background writer ----------------------------------------------------
+
+    def _put(self, item: tuple) -> None:
+        if not self._thread.is_alive():
+            raise RuntimeError("BufferedRunLogger is closed")
+        self._queue.put(item)
+
+    def _raise_errors(self) -> None:
+        if self.errors:
+            errors, self.errors = self.errors, []
+            raise RuntimeError(f"{len(errors)} MLflow write(s) failed") from errors[0]
+
+    def _worker(self) -> None:
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(deadline - time.monotonic(), 0.0))
+            except queue.Empty:
+                item = ("flush", None, None)
+            if item is None:
+                self._write_all()
+                return
+            kind, run_id, payload = item
+            if kind == "end":
+                self._write(run_id)
+                self._safely(self.client.set_terminated, run_id, status=payload)
+            elif kind == "metrics":
+                self._pending[run_id]["metrics"].extend(payload)
+            elif kind in ("params", "tags"):  # later values replace earlier ones
+                self._pending[run_id][kind].update(payload)
+            if kind == "flush" or time.monotonic() >= deadline:
+                self._write_all()
+                deadline = time.monotonic() + self.flush_interval
+            if kind == "flush" and payload is not None:
+                payload.set()
+
+    def _write_all(self) -> None:
+        for run_id in list(self._pending):
+            self._write(run_id)
+
+    def _write(self, run_id: str) -> None:
+        from mlflow.entities import Metric, Param, RunTag
+
+        buffered = self._pending.pop(run_id, None)
+        if buffered is None:
+            return
+        metrics = [Metric(k, v, ts, step) for k, v, ts, step in buffered["metrics"]]
+        params = [Param(k, v) for k, v in buffered["params"].items()]
+        tags = [RunTag(k, v) for k, v in buffered["tags"].items()]
+        while metrics or params or tags:
+            self._safely(
+                self.client.log_batch,
+                run_id,
+                metrics=metrics[:_MAX_BATCH_METRICS],
+                params=params[:_MAX_BATCH_PARAMS],
+                tags=tags[:_MAX_BATCH_TAGS],
+            )
+            metrics = metrics[_MAX_BATCH_METRICS:]
+            params = params[_MAX_BATCH_PARAMS:]
+            tags = tags[_MAX_BATCH_TAGS:]
+
+    def _safely(self, func, *args, **kwargs) -> None:
+        try:
+            func(*args, **kwargs)
+        except Exception as exc:  # surfaced on the caller's thread by flush()/close()
+            self.errors.append(exc)
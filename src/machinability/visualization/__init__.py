@@ -1 +1,11 @@
 """Plotting utilities for research figures."""
+
+from src.machinability._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["plots"],
+    attributes={
+        "plots": ["learning_curve_plot", "scatter_with_regression", "steel_grade_comparison"],
+    },
+)
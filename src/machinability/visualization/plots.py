@@ -1,8 +1,17 @@
-"""Standard plots for conductivity-machinability research."""
+"""Standard plots for conductivity-machinability research.
+
+matplotlib and seaborn are imported when a plot is drawn, not when this
+module is imported.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import matplotlib.pyplot as plt
 import numpy as np
-import seaborn as sns
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
 
 def scatter_with_regression(
@@ -31,6 +40,8 @@ def scatter_with_regression(
     matplotlib.axes.Axes
     """
     if ax is None:
+        import matplotlib.pyplot as plt
+
         _, ax = plt.subplots(figsize=(8, 6))
 
     ax.scatter(x, y, alpha=0.7, edgecolors="k", linewidths=0.5)
@@ -82,6 +93,9 @@ def steel_grade_comparison(
     -------
     matplotlib.figure.Figure
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     fig, ax = plt.subplots(figsize=(10, 7))
     sns.scatterplot(data=df, x=x_col, y=y_col, hue=hue_col, style=hue_col, s=80, ax=ax)
     ax.set_xlabel(xlabel or x_col, fontsize=12)
@@ -90,3 +104,54 @@ def steel_grade_comparison(
     ax.grid(True, alpha=0.3)
     fig.tight_layout()
     return fig
+
+
+def learning_curve_plot(
+    summary,
+    metrics: tuple[str, ...] = ("r2", "mape", "fit_s"),
+    required_n: tuple[int, ...] | None = None,
+) -> plt.Figure:
+    """Learning curves (mean ± 1 SD over repeats) for each model.
+
+    Parameters
+    ----------
+    summary : pd.DataFrame
+        Output of :func:`~src.machinability.models.learning_curve.summarise_learning_curve`.
+    metrics : tuple of str
+        Metrics to plot, one panel each. Timing panels use a log scale.
+    required_n : tuple of int, optional
+        Sample sizes to mark with vertical lines (e.g. the hypothesis
+        table's minimum n).
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+    """
+    import matplotlib.pyplot as plt
+
+    labels = {
+        "r2": "R² (out-of-fold)",
+        "mape": "MAPE",
+        "rmse": "RMSE",
+        "fit_s": "Fit time per fold (s)",
+        "predict_s": "Predict time per fold (s)",
+        "peak_mb": "Peak memory (MB)",
+    }
+    fig, axes = plt.subplots(1, len(metrics), figsize=(5 * len(metrics), 4.5), squeeze=False)
+    for ax, metric in zip(axes[0], metrics):
+        for model, group in summary.groupby("model"):
+            group = group.sort_values("size")
+            mean = group[f"{metric}_mean"].to_numpy()
+            std = np.nan_to_num(group[f"{metric}_std"].to_numpy())
+            ax.plot(group["size"], mean, marker="o", label=model)
+            ax.fill_between(group["size"], mean - std, mean + std, alpha=0.2)
+        for n in required_n or ():
+            ax.axvline(n, color="grey", linestyle=":", linewidth=1)
+        if metric.endswith("_s"):
+            ax.set_yscale("log")
+        ax.set_xlabel("Training sample size n", fontsize=12)
+        ax.set_ylabel(labels.get(metric, metric), fontsize=12)
+        ax.grid(True, alpha=0.3)
+    axes[0][0].legend(fontsize=9)
+    fig.tight_layout()
+    return fig
@@ -0,0 +1,61 @@
+"""Tests for the content-addressed artifact store."""
+
+import pytest
+
+from src.machinability.utils.artifacts import ArtifactStore, from_pointer, to_pointer
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ArtifactStore(tmp_path / "artifacts")
+
+
+class TestArtifactStore:
+    def test_identical_content_stored_once(self, store, tmp_path):
+        data = tmp_path / "data.csv"
+        data.write_text("hardness,conductivity\n200,5.1\n")
+        digests = {store.put(data, owner=f"run{i}:data.csv") for i in range(5)}
+        assert len(digests) == 1
+        digest = digests.pop()
+        assert store.put(data.read_bytes(), owner="bytes") == digest
+        assert store.stats()["objects"] == 1
+        assert store.refcount(digest) == 6
+        assert store.read_bytes(digest) == data.read_bytes()
+
+    def test_gc_removes_only_unreferenced(self, store):
+        kept = store.put(b"model", owner="run1:model")
+        dropped = store.put(b"figure", owner="run1:fig")
+        store.release(dropped, "run1:fig")
+        assert store.gc(grace_seconds=3600)["removed"] == 0  # still within grace
+        result = store.gc(grace_seconds=0)
+        assert result == {"removed": 1, "freed_bytes": len(b"figure")}
+        assert kept in store
+        assert dropped not in store
+
+    def test_release_owner_prefix(self, store):
+        a = store.put(b"a", owner="run1:x")
+        b = store.put(b"b", owner="run1:y")
+        store.put(b"b", owner="run2:y")
+        assert store.release_owner("run1:") == 2
+        assert store.refcount(a) == 0
+        assert store.owners(b) == ["run2:y"]
+        store.gc(grace_seconds=0)
+        assert a not in store
+        assert b in store
+
+    def test_pointers(self, store):
+        digest = store.put(b"blob", owner="o")
+        pointer = to_pointer(digest)
+        assert pointer.startswith("cas://")
+        assert from_pointer(pointer) == digest
+        assert store.resolve(pointer).read_bytes() == b"blob"
+        with pytest.raises(ValueError):
+            from_pointer("file:///tmp/x")
+
+    def test_invalid_and_unknown_digests(self, store):
+        with pytest.raises(ValueError):
+            store.path("../../etc/passwd")
+        with pytest.raises(KeyError):
+            store.path("0" * 32)
+        with pytest.raises(KeyError):
+            store.add_ref("0" * 32, "owner")
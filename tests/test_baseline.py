@@ -0,0 +1,85 @@
+"""Tests for the hardness-only baseline and evaluation metrics."""
+
+import numpy as np
+import pytest
+
+from src.machinability.models.baseline import (
+    HardnessOnlyBaseline,
+    bootstrap_fits,
+    cv_fold_fits,
+    cv_predict,
+)
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(1)
+    hardness = rng.uniform(180, 340, size=60)
+    tool_life = 120 - 0.3 * hardness + rng.normal(0, 4, 60)
+    Ra = 0.3 + 0.004 * hardness + rng.normal(0, 0.1, 60)
+    Y = np.column_stack([tool_life, Ra])
+    return hardness.reshape(-1, 1), Y
+
+
+class TestHardnessOnlyBaseline:
+    def test_matches_polyfit(self, data):
+        X, Y = data
+        model = HardnessOnlyBaseline().fit(X, Y[:, 0])
+        slope, intercept = np.polyfit(X[:, 0], Y[:, 0], 1)
+        assert model.coef_[0] == pytest.approx(slope)
+        assert model.intercept_[0] == pytest.approx(intercept)
+        assert model.predict(X).shape == (60,)
+
+    def test_multi_target(self, data):
+        X, Y = data
+        model = HardnessOnlyBaseline().fit(X, Y)
+        assert model.predict(X).shape == (60, 2)
+        for j in range(2):
+            single = HardnessOnlyBaseline().fit(X, Y[:, j])
+            np.testing.assert_allclose(model.predict(X)[:, j], single.predict(X))
+
+    def test_partial_fit_equals_full_fit(self, data):
+        X, Y = data
+        inc = HardnessOnlyBaseline().partial_fit(X[:25], Y[:25]).partial_fit(X[25:], Y[25:])
+        full = HardnessOnlyBaseline().fit(X, Y)
+        np.testing.assert_allclose(inc.coef_, full.coef_)
+        np.testing.assert_allclose(inc.intercept_, full.intercept_)
+
+    def test_refit_resets_statistics(self, data):
+        X, Y = data
+        model = HardnessOnlyBaseline().fit(X, Y[:, 0]).fit(X[:10], Y[:10, 0])
+        assert model.n_ == 10
+
+    def test_constant_hardness(self):
+        model = HardnessOnlyBaseline().fit(np.full((5, 1), 250.0), np.arange(5.0))
+        np.testing.assert_allclose(model.predict([[250.0]]), [2.0])
+
+    def test_constant_hardness_slope_is_exactly_zero(self):
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            n = int(rng.integers(3, 500))
+            X = np.full((n, 1), rng.uniform(100, 400))
+            y = rng.normal(size=n)
+            assert HardnessOnlyBaseline().fit(X, y).coef_[0] == 0.0
+            assert not cv_fold_fits(X, y, np.arange(n) % 5)[0].any()
+
+
+class TestReplicatedFits:
+    def test_cv_fold_fits_match_polyfit(self, data):
+        X, Y = data
+        labels = np.arange(60) % 5
+        coef, intercept = cv_fold_fits(X, Y, labels)
+        for fold in range(5):
+            train = labels != fold
+            slopes, intercepts = np.polyfit(X[train, 0], Y[train], 1)
+            np.testing.assert_allclose(coef[fold], slopes)
+            np.testing.assert_allclose(intercept[fold], intercepts)
+        assert cv_predict(X, Y, labels).shape == (60, 2)
+
+    def test_bootstrap_shapes_and_spread(self, data):
+        X, Y = data
+        coef, intercept = bootstrap_fits(X, Y[:, 0], n_replicates=200, random_state=0)
+        assert coef.shape == intercept.shape == (200, 1)
+        full = HardnessOnlyBaseline().fit(X, Y[:, 0])
+        assert np.mean(coef) == pytest.approx(full.coef_[0], rel=0.05)
+        assert np.std(coef) > 0
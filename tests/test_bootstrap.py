@@ -0,0 +1,94 @@
+"""Tests for bootstrap-ensemble uncertainty."""
+
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+from sklearn.base import clone
+
+from src.machinability.models.baseline import HardnessOnlyBaseline
+from src.machinability.models.bootstrap import BootstrapEnsemble
+from src.machinability.models.factory import make_model
+from src.machinability.utils.config import REPO_ROOT
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.uniform(0, 1, size=(60, 2))
+    y = 3 * X[:, 0] - X[:, 1] + rng.normal(0, 0.1, 60)
+    return X, y
+
+
+def _reference(model, X, y, n_replicas, seed, X_new):
+    """Replica predictions fitted one by one, without compaction."""
+    idx = np.random.default_rng(seed).integers(len(X), size=(n_replicas, len(X)))
+    template = make_model(model) if isinstance(model, str) else model
+    return np.stack([clone(template).fit(X[i], y[i]).predict(X_new) for i in idx])
+
+
+class TestBootstrapEnsemble:
+    @pytest.mark.parametrize("model_name", ["Linear Regression", "SVR"])
+    def test_vectorised_predict_matches_replicas(self, data, model_name):
+        X, y = data
+        ens = BootstrapEnsemble(model_name, n_replicas=8, random_state=3).fit(X, y)
+        assert ens.estimators_ is None
+        expected = _reference(model_name, X, y, 8, 3, X[:10])
+        np.testing.assert_allclose(ens.predict_all(X[:10]), expected, atol=1e-8)
+
+    def test_process_pool_matches_serial(self, data):
+        X, y = data
+        serial = BootstrapEnsemble("Linear Regression", n_replicas=6, random_state=1).fit(X, y)
+        pooled = BootstrapEnsemble("Linear Regression", n_replicas=6, n_jobs=2, random_state=1).fit(
+            X, y
+        )
+        np.testing.assert_allclose(serial.coef_, pooled.coef_)
+
+    def test_tree_replicas_and_uncertainty(self, data):
+        X, y = data
+        ens = BootstrapEnsemble("Gradient Boosting", n_replicas=4, random_state=0).fit(X, y)
+        assert len(ens.estimators_) == 4
+        mean, lower, upper = ens.predict_interval(X[:5], alpha=0.2)
+        assert np.all(lower <= mean) and np.all(mean <= upper)
+        assert np.all(ens.predict_std(X[:5]) > 0)
+
+    def test_pooled_fit_leaves_resource_tracker_quiet(self):
+        code = (
+            "import numpy as np\n"
+            "from src.machinability.models.bootstrap import BootstrapEnsemble\n"
+            "X = np.random.default_rng(0).uniform(size=(40, 2))\n"
+            "BootstrapEnsemble('Linear Regression', n_replicas=6, n_jobs=2).fit(X, X[:, 0])\n"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True
+        )
+        assert proc.returncode == 0
+        assert "Traceback" not in proc.stderr and "leaked" not in proc.stderr
+
+    @pytest.mark.parametrize("model_name", ["Linear Regression", "Random Forest"])
+    def test_multi_output_target(self, data, model_name):
+        X, y = data
+        Y = np.column_stack([y, 2 * y])
+        ens = BootstrapEnsemble(model_name, n_replicas=3, random_state=0).fit(X, Y)
+        assert ens.predict_all(X[:7]).shape == (3, 7, 2)
+        assert ens.predict(X[:7]).shape == (7, 2)
+        expected = _reference(model_name, X, Y, 3, 0, X[:7])
+        np.testing.assert_allclose(ens.predict_all(X[:7]), expected, atol=1e-8)
+
+    @pytest.mark.parametrize("n_targets", [1, 3])
+    def test_baseline_replicas_are_not_compacted_as_linear(self, data, n_targets):
+        X, y = data
+        X = X[:, :1]  # the baseline takes the hardness column only
+        Y = y if n_targets == 1 else np.column_stack([y, 2 * y, y + 1])
+        ens = BootstrapEnsemble(HardnessOnlyBaseline(), n_replicas=4, random_state=1).fit(X, Y)
+        assert ens.kind_ == "generic"
+        expected = _reference(HardnessOnlyBaseline(), X, Y, 4, 1, X[:7])
+        np.testing.assert_allclose(ens.predict_all(X[:7]), expected)
+
+    def test_svr_predicts_in_row_blocks(self, data):
+        X, y = data
+        ens = BootstrapEnsemble("SVR", n_replicas=5, random_state=2).fit(X, y)
+        np.testing.assert_allclose(
+            ens.predict_all(X, chunk_size=7), ens.predict_all(X, chunk_size=1000), atol=1e-12
+        )
@@ -0,0 +1,145 @@
+"""Tests for the content-hash memoization layer."""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from src.machinability.analysis.correlation import correlation_matrix
+from src.machinability.models.factory import fit_model
+from src.machinability.utils import cache as cache_mod
+from src.machinability.utils.cache import (
+    DiskCache,
+    disable_cache,
+    enable_cache,
+    get_cache,
+    memoize,
+    stable_hash,
+)
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    yield enable_cache(tmp_path / "cache")
+    disable_cache()
+
+
+def _frame(seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "conductivity": rng.normal(5, 1, 50),
+            "hardness": rng.normal(200, 20, 50),
+            "grade": rng.choice(["AISI 1045", "AISI 4140"], 50),
+        }
+    )
+
+
+class TestStableHash:
+    def test_equal_content_equal_hash(self):
+        assert stable_hash(_frame()) == stable_hash(_frame().copy())
+        assert stable_hash(np.arange(10)) == stable_hash(np.arange(10).copy())
+
+    def test_content_changes_hash(self):
+        df = _frame()
+        changed = df.copy()
+        changed.loc[3, "hardness"] += 1e-9
+        assert stable_hash(df) != stable_hash(changed)
+        assert stable_hash(df) != stable_hash(df.rename(columns={"grade": "steel"}))
+        assert stable_hash(df) != stable_hash(df.iloc[::-1])
+        assert stable_hash(np.arange(10)) != stable_hash(np.arange(10.0))
+        assert stable_hash(np.zeros((2, 3))) != stable_hash(np.zeros((3, 2)))
+
+    def test_estimators_hashed_by_params(self):
+        assert stable_hash(LinearRegression()) == stable_hash(LinearRegression())
+        assert stable_hash(LinearRegression()) != stable_hash(LinearRegression(fit_intercept=False))
+
+    def test_stable_across_processes(self):
+        import subprocess
+        import sys
+
+        code = (
+            "from src.machinability.utils.cache import stable_hash;"
+            "print(stable_hash({'a': [1, 2.5, 'x'], 'b': None}))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        assert out == stable_hash({"b": None, "a": [1, 2.5, "x"]})
+
+
+class TestMemoize:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv(cache_mod.CACHE_ENV, raising=False)
+        monkeypatch.setitem(cache_mod._state, "configured", False)
+        monkeypatch.setitem(cache_mod._state, "cache", None)
+        assert get_cache() is None
+
+    def test_env_enables_cache(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(cache_mod.CACHE_ENV, str(tmp_path / "env-cache"))
+        monkeypatch.setitem(cache_mod._state, "configured", False)
+        monkeypatch.setitem(cache_mod._state, "cache", None)
+        assert get_cache().root == tmp_path / "env-cache"
+
+    def test_hits_and_misses(self, disk_cache):
+        calls = []
+
+        @memoize(ignore=("verbose",))
+        def scale(df, factor=2.0, verbose=False):
+            calls.append(factor)
+            return df.select_dtypes("number") * factor
+
+        first = scale(_frame())
+        again = scale(_frame(), verbose=True)
+        pd.testing.assert_frame_equal(first, again)
+        scale(_frame(), factor=3.0)
+        assert calls == [2.0, 3.0]
+        assert (scale.cache_stats.hits, scale.cache_stats.misses) == (1, 2)
+        assert disk_cache.stats.writes == 2
+
+    def test_wrapped_pipeline_stages(self, disk_cache):
+        df = _frame()
+        pd.testing.assert_frame_equal(correlation_matrix(df), correlation_matrix(df))
+        assert correlation_matrix.cache_stats.hits >= 1
+
+        X = df[["conductivity"]].to_numpy()
+        y = df["hardness"].to_numpy()
+        first = fit_model("Linear Regression", X, y)
+        second = fit_model("Linear Regression", X, y)
+        assert second is not first
+        np.testing.assert_allclose(first.predict(X), second.predict(X))
+        assert len(disk_cache) == 2
+
+
+class TestDiskCache:
+    def test_size_bound_evicts_least_recently_used(self, tmp_path):
+        cache = DiskCache(tmp_path, max_bytes=3500)
+        for i, key in enumerate(("aa1", "bb2", "cc3")):
+            cache.set(key, bytes(1000))
+            path = cache._path(key)
+            os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+        assert cache.get("aa1") is not None  # refreshes aa1
+        cache.set("dd4", bytes(1000))
+        assert cache.get("bb2") is None
+        assert cache.get("aa1") is not None
+        assert cache.size_bytes() <= 3500
+        assert cache.stats.evictions >= 1
+
+    def test_age_bound(self, tmp_path):
+        cache = DiskCache(tmp_path, max_age=60)
+        cache.set("old", 1)
+        past = time.time() - 3600
+        os.utime(cache._path("old"), (past, past))
+        cache.set("new", 2)
+        assert cache.get("old") is None
+        assert cache.get("new") == 2
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        cache.set("key", [1, 2])
+        cache._path("key").write_bytes(b"not a pickle")
+        assert cache.get("key", "default") == "default"
+        assert not cache._path("key").exists()
@@ -0,0 +1,192 @@
+"""Tests for the headless machinability command and the hypothesis checks."""
+
+import json
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+from src.machinability.cli import correlation_screen, load_data, main
+from src.machinability.models.hypotheses import (
+    INSUFFICIENT,
+    NOT_SUPPORTED,
+    SUPPORTED,
+    evaluate_hypotheses,
+)
+from src.machinability.utils.config import REPO_ROOT
+
+
+def _row(
+    model,
+    target="tool_life",
+    r2=0.8,
+    mape=10.0,
+    baseline_mape=20.0,
+    top=None,
+    features="conductivity, hardness",
+):
+    return {
+        "model": model,
+        "features": features,
+        "target": target,
+        "R2": r2,
+        "MAPE": mape,
+        "Baseline_MAPE": baseline_mape,
+        "top_features": top,
+    }
+
+
+class TestHypotheses:
+    def test_all_supported(self):
+        results = [
+            _row("Random Forest", r2=0.9, top=["conductivity", "hardness"]),
+            _row("Linear Regression", r2=0.7, mape=12.0),
+        ]
+        evaluated = evaluate_hypotheses(results)
+        assert {h: r.status for h, r in evaluated.items()} == dict.fromkeys(
+            ["H4a", "H4b", "H4c", "H4d"], SUPPORTED
+        )
+        assert evaluated["H4a"].passed is True
+
+    def test_not_supported_and_insufficient(self):
+        results = [_row("Linear Regression", r2=0.5, mape=30.0, baseline_mape=31.0)]
+        evaluated = evaluate_hypotheses(results)
+        assert evaluated["H4a"].status == NOT_SUPPORTED
+        assert evaluated["H4b"].status == NOT_SUPPORTED
+        assert evaluated["H4c"].status == INSUFFICIENT
+        assert evaluated["H4d"].passed is None
+
+    def test_top_features_callback(self):
+        results = [_row("Gradient Boosting", top=["conductivity"])]
+        evaluated = evaluate_hypotheses(results, top_features=lambda r: ["a", "b", "c"])
+        assert evaluated["H4d"].status == NOT_SUPPORTED
+        evaluated = evaluate_hypotheses(results, top_features=lambda r: None)
+        assert evaluated["H4d"].status == INSUFFICIENT
+
+
+class TestCommands:
+    def test_correlation_screen_parallel_matches_serial(self):
+        df = load_data("synthetic", n=120)
+        serial = correlation_screen(df, jobs=1)
+        parallel = correlation_screen(df, jobs=2)
+        pd.testing.assert_frame_equal(serial, parallel)
+        assert set(serial["steel_grade"]) >= {"all"}
+        assert serial["pearson_r"].between(-1, 1).all()
+
+    def test_correlate(self, tmp_path):
+        assert main(["correlate", "--n", "80", "--out", str(tmp_path)]) == 0
+        matrix = pd.read_parquet(tmp_path / "correlation_matrix.parquet")
+        assert "conductivity" in set(matrix["variable"])
+        payload = json.loads((tmp_path / "correlation.json").read_text())
+        assert payload["rows"] == 80
+        screen = pd.read_parquet(tmp_path / "correlation_screen.parquet")
+        assert len(payload["screen"]) == len(screen)
+
+    def test_train_then_hypotheses(self, tmp_path):
+        assert (
+            main(
+                [
+                    "train",
+                    "--n",
+                    "80",
+                    "--models",
+                    "Linear Regression",
+                    "Random Forest",
+                    "--targets",
+                    "tool_life",
+                    "--cv",
+                    "3",
+                    "--jobs",
+                    "2",
+                    "--out",
+                    str(tmp_path),
+                ]
+            )
+            == 0
+        )
+        metrics = pd.read_parquet(tmp_path / "metrics.parquet")
+        assert list(metrics["model"]) == ["Linear Regression", "Random Forest"]
+        assert {"R2", "MAPE", "CV_mean_R2", "Baseline_MAPE", "data_hash"} <= set(metrics.columns)
+        results = json.loads((tmp_path / "results.json").read_text())
+        assert all(len(r["top_features"]) == 2 for r in results)
+
+        assert main(["hypotheses", "--out", str(tmp_path)]) == 0
+        hypotheses = json.loads((tmp_path / "hypotheses.json").read_text())
+        assert set(hypotheses) == {"H4a", "H4b", "H4c", "H4d"}
+        assert hypotheses["H4c"]["status"] != INSUFFICIENT
+        assert "criterion" in hypotheses["H4a"]
+
+    def test_evidence(self, tmp_path):
+        matrix = tmp_path / "matrix.csv"
+        pd.DataFrame(
+            {
+                "paper_id": ["P1", "P1", "P2"],
+                "steel_grade": ["42CrMo4", "", "C45"],
+                "year": [2001, 2001, 2015],
+            }
+        ).to_csv(matrix, index=False)
+        assert main(["evidence", "--matrix", str(matrix), "--out", str(tmp_path)]) == 0
+        summary = json.loads((tmp_path / "evidence.json").read_text())
+        assert summary["rows"] == 3 and summary["unique_papers"] == 2
+        missing = pd.read_parquet(tmp_path / "evidence_missing.parquet")
+        assert missing.set_index("column").loc["steel_grade", "missing_count"] == 1
+
+    def test_pipeline_passes_jobs(self, monkeypatch):
+        from src.machinability import pipeline
+
+        seen = {}
+        monkeypatch.setattr(pipeline, "main", lambda argv: seen.setdefault("argv", argv) and 0)
+        assert main(["pipeline", "--jobs", "3", "--", "--dry-run"]) == 0
+        assert seen["argv"] == ["--dry-run", "--jobs", "3"]
+
+    def test_metrics_file(self, tmp_path):
+        out = tmp_path / "out"
+        assert (
+            main(
+                ["correlate", "--n", "60", "--out", str(out), "--metrics", str(tmp_path / "m.json")]
+            )
+            == 0
+        )
+        records = json.loads((tmp_path / "m.json").read_text())["records"]
+        rows = {r["name"]: r["rows"] for r in records}
+        assert rows["synthetic.generate_specimens"] == 60
+        assert [r["name"] for r in records][-1] == "cli.correlate"
+        assert main(["evidence", "--out", str(out), "--metrics", str(tmp_path / "m.prom")]) == 0
+        prom = (tmp_path / "m.prom").read_text()
+        assert 'stage="loader.load_evidence_matrix"' in prom
+        # Both formats cover the command only, not earlier runs in this process
+        assert 'stage="cli.correlate"' not in prom
+        assert 'machinability_stage_calls_total{stage="cli.evidence"} 1' in prom
+        stages = json.loads((tmp_path / "m.json").read_text())["stages"]
+        assert stages["cli.correlate"]["calls"] == 1 and "cli.evidence" not in stages
+
+    def test_train_fits_targets_jointly(self, tmp_path):
+        args = ["train", "--n", "60", "--models", "Linear Regression", "--cv", "3"]
+        args += ["--targets", "tool_life", "Ra", "Fc", "--out", str(tmp_path)]
+        assert main([*args, "--metrics", str(tmp_path / "m.json")]) == 0
+        stages = json.loads((tmp_path / "m.json").read_text())["stages"]
+        # One fit per CV fold plus the final fit, shared by the three targets
+        assert stages["multi_target.MultiTargetRegressor.fit"]["calls"] == 4
+        results = json.loads((tmp_path / "results.json").read_text())
+        assert [r["target"] for r in results] == ["tool_life", "Ra", "Fc"]
+        assert len({r["data_hash"] for r in results}) == 3
+        assert all(r["R2"] > 0.5 for r in results)
+
+    def test_requires_command(self):
+        with pytest.raises(SystemExit):
+            main([])
+
+
+def test_no_dashboard_imports(tmp_path):
+    code = (
+        "import sys\n"
+        "from src.machinability.cli import main\n"
+        f"main(['correlate', '--n', '40', '--out', {str(tmp_path)!r}])\n"
+        "loaded = sorted({m.split('.')[0] for m in sys.modules} & {'streamlit', 'plotly'})\n"
+        "print('loaded=' + ','.join(loaded))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip().splitlines()[-1] == "loaded="
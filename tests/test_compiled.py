@@ -0,0 +1,95 @@
+"""Tests for flat-array compiled tree ensembles."""
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+from sklearn.tree import DecisionTreeRegressor
+
+from src.machinability.models.bootstrap import BootstrapEnsemble
+from src.machinability.models.compiled import compile_ensemble, is_compilable, load_compiled
+from src.machinability.models.factory import make_model
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 4))
+    y = 2 * X[:, 0] + np.sin(X[:, 1]) + X[:, 2] * X[:, 3] + rng.normal(0, 0.1, 300)
+    return X, y
+
+
+class TestCompiledEnsemble:
+    @pytest.mark.parametrize("name", ["Random Forest", "Gradient Boosting"])
+    def test_matches_sklearn(self, data, name):
+        X, y = data
+        model = make_model(name).fit(X, y)
+        compiled = compile_ensemble(model)
+        np.testing.assert_allclose(compiled.predict(X), model.predict(X), rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(compiled.predict(X[0]), model.predict(X[:1]), atol=1e-12)
+
+    def test_single_tree_and_chunking(self, data):
+        X, y = data
+        tree = DecisionTreeRegressor(max_depth=6, random_state=0).fit(X, y)
+        compiled = compile_ensemble(tree)
+        assert compiled.n_trees == 1
+        np.testing.assert_allclose(compiled.predict(X, chunk_size=7), tree.predict(X))
+
+    def test_save_load_roundtrip(self, data, tmp_path):
+        X, y = data
+        model = make_model("Gradient Boosting").fit(X, y)
+        path = compile_ensemble(model).save(tmp_path / "gb.npz")
+        np.testing.assert_allclose(load_compiled(path).predict(X), model.predict(X), atol=1e-12)
+
+    def test_rejects_non_tree_models(self, data):
+        X, y = data
+        with pytest.raises(TypeError):
+            compile_ensemble(LinearRegression().fit(X, y))
+
+    def test_feature_count_checked(self, data):
+        X, y = data
+        compiled = compile_ensemble(DecisionTreeRegressor(max_depth=2).fit(X, y))
+        with pytest.raises(ValueError):
+            compiled.predict(X[:, :3])
+
+    @pytest.mark.parametrize("nan_in_training", [False, True])
+    def test_missing_values_follow_sklearn(self, data, nan_in_training):
+        X, y = data
+        X_nan = X.copy()
+        X_nan[::3, 0] = np.nan
+        X_nan[1::5, 2] = np.nan
+        forest = RandomForestRegressor(n_estimators=10, random_state=0)
+        forest.fit(X_nan if nan_in_training else X, y)
+        compiled = compile_ensemble(forest)
+        np.testing.assert_allclose(compiled.predict(X_nan), forest.predict(X_nan), atol=1e-12)
+
+    def test_invalid_inputs_rejected_like_sklearn(self, data, tmp_path):
+        X, y = data
+        X_nan, X_inf = X[:5].copy(), X[:5].copy()
+        X_nan[0, 1], X_inf[2, 0] = np.nan, np.inf
+        for name in ("Random Forest", "Gradient Boosting"):
+            model = make_model(name).fit(X, y)
+            compiled = compile_ensemble(model)
+            reloaded = load_compiled(compiled.save(tmp_path / "m.npz"))
+            for candidate in (compiled, reloaded):
+                with pytest.raises(ValueError, match="infinity"):
+                    candidate.predict(X_inf)
+                if name == "Gradient Boosting":
+                    with pytest.raises(ValueError, match="NaN"):
+                        model.predict(X_nan)
+                    with pytest.raises(ValueError, match="NaN"):
+                        candidate.predict(X_nan)
+                else:
+                    np.testing.assert_allclose(candidate.predict(X_nan), model.predict(X_nan))
+
+    def test_rejects_multi_output_and_non_compilable(self, data):
+        X, y = data
+        multi = RandomForestRegressor(n_estimators=3, random_state=0).fit(X, np.c_[y, -y])
+        assert not is_compilable(multi)
+        with pytest.raises(ValueError, match="multi-output"):
+            compile_ensemble(multi)
+        bagged = BootstrapEnsemble("Linear Regression", n_replicas=2).fit(X, y)
+        assert not is_compilable(bagged)
+        with pytest.raises(TypeError):
+            compile_ensemble(bagged)
+        assert is_compilable(make_model("Gradient Boosting").fit(X, y))
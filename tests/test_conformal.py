@@ -0,0 +1,73 @@
+"""Tests for conformal prediction intervals."""
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.model_selection import cross_validate
+
+from src.machinability.models.conformal import (
+    CVPlusRegressor,
+    SplitConformalRegressor,
+    conformal_quantile,
+    interval_coverage,
+)
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.uniform(3, 8, size=(2400, 1))
+    y = 10 * X[:, 0] + rng.normal(0, 2, 2400)
+    return X, y
+
+
+class TestConformalQuantile:
+    def test_finite_sample_rank(self):
+        # n = 9, alpha = 0.1 -> ceil(10 * 0.9) = 9th smallest
+        assert conformal_quantile(np.arange(1.0, 10.0), 0.1) == 9.0
+
+    def test_too_few_scores(self):
+        assert conformal_quantile(np.arange(5.0), 0.05) == np.inf
+
+
+class TestSplitConformal:
+    def test_coverage(self, data):
+        X, y = data
+        model = LinearRegression().fit(X[:400], y[:400])
+        conf = SplitConformalRegressor.calibrate(model, X[400:800], y[400:800])
+        _, lo, hi = conf.predict_interval(X[800:], alpha=0.1)
+        assert interval_coverage(y[800:], lo, hi) == pytest.approx(0.9, abs=0.04)
+
+
+class TestCVPlus:
+    def test_coverage_and_no_refit(self, data):
+        X, y = data
+        cv = cross_validate(
+            LinearRegression(),
+            X[:400],
+            y[:400],
+            cv=5,
+            return_estimator=True,
+            return_indices=True,
+        )
+        cvplus = CVPlusRegressor.from_cv_results(cv, X[:400], y[:400])
+        assert cvplus.fold_estimators[0] is cv["estimator"][0]
+        pred, lo, hi = cvplus.predict_interval(X[400:], alpha=0.1, chunk_size=300)
+        assert np.all(lo <= pred) and np.all(pred <= hi)
+        assert interval_coverage(y[400:], lo, hi) >= 0.86
+
+    def test_chunking_does_not_change_result(self, data):
+        X, y = data
+        cv = cross_validate(
+            LinearRegression(),
+            X[:100],
+            y[:100],
+            cv=4,
+            return_estimator=True,
+            return_indices=True,
+        )
+        cvplus = CVPlusRegressor.from_cv_results(cv, X[:100], y[:100])
+        a = cvplus.predict_interval(X[100:], chunk_size=7)
+        b = cvplus.predict_interval(X[100:], chunk_size=10_000)
+        for u, v in zip(a, b):
+            np.testing.assert_allclose(u, v)
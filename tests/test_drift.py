@@ -0,0 +1,51 @@
+"""Tests for the feature-distribution drift monitor."""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from src.machinability.models.drift import DriftReference, load_reference, save_reference
+
+FEATURES = ["conductivity", "hardness"]
+
+
+def _specimens(rng, n, conductivity=5.0):
+    return np.column_stack([rng.normal(conductivity, 0.5, n), rng.normal(260, 30, n)])
+
+
+@pytest.fixture
+def reference():
+    return DriftReference.from_data(_specimens(np.random.default_rng(0), 2000), FEATURES)
+
+
+class TestDriftReference:
+    def test_same_distribution_is_stable(self, reference):
+        report = reference.compare(_specimens(np.random.default_rng(1), 500))
+        assert not report.drifted.any()
+        assert report.out_of_distribution.mean() < 0.05
+
+    def test_shifted_conductivity_flagged(self, reference):
+        report = reference.compare(_specimens(np.random.default_rng(2), 500, conductivity=6.0))
+        assert report.drifted.tolist() == [True, False]
+        assert report.psi[0] > 0.25
+        assert report.summary()["features"]["conductivity"]["drifted"]
+
+    def test_ks_close_to_exact(self, reference):
+        rng = np.random.default_rng(3)
+        ref_raw = _specimens(np.random.default_rng(0), 2000)
+        batch = _specimens(rng, 400, conductivity=5.2)
+        exact = stats.ks_2samp(ref_raw[:, 0], batch[:, 0]).statistic
+        # evaluated on ten bin edges, so a lower bound that is close to exact
+        assert exact - 0.05 < reference.compare(batch).ks[0] <= exact + 1e-12
+
+    def test_ood_rows(self, reference):
+        X = np.array([[5.0, 260.0], [9.0, 260.0], [5.0, 420.0]])
+        assert reference.out_of_distribution(X).tolist() == [False, True, True]
+
+    def test_roundtrip_through_registry(self, reference, tmp_path):
+        assert load_reference("m", tmp_path) is None
+        save_reference(reference, "m", tmp_path)
+        loaded = load_reference("m", tmp_path)
+        X = _specimens(np.random.default_rng(4), 50)
+        np.testing.assert_allclose(loaded.compare(X).psi, reference.compare(X).psi)
+        np.testing.assert_allclose(loaded.mahalanobis(X), reference.mahalanobis(X))
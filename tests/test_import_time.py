@@ -0,0 +1,105 @@
+"""Import costs of the package, the CLI and the dashboard pages.
+
+Each case imports one module in a fresh interpreter under ``-X importtime``
+and checks that none of the listed heavy dependencies were loaded. The
+wall-clock budgets (several times the measured cost) depend on the
+machine and a warm disk cache, so they are marked ``import_budget`` and
+excluded from the default run::
+
+    pytest -m import_budget tests/test_import_time.py
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import src.machinability as machinability
+from src.machinability import models
+from src.machinability.utils.config import REPO_ROOT
+
+HEAVY = ("sklearn", "scipy", "matplotlib", "seaborn", "plotly.express", "streamlit")
+
+# module -> (budget in seconds, heavy modules it may load)
+BUDGETS = {
+    "src.machinability": (0.2, ()),
+    "src.machinability.models": (0.2, ()),
+    "src.machinability.analysis": (0.2, ()),
+    "src.machinability.data": (0.2, ()),
+    "src.machinability.utils": (0.2, ()),
+    "src.machinability.visualization": (0.2, ()),
+    "src.machinability.visualization.plots": (0.6, ()),
+    "src.machinability.models.factory": (1.5, ()),
+    "src.machinability.models.hypotheses": (1.5, ()),
+    "src.machinability.analysis.correlation": (1.5, ()),
+    "src.machinability.cli": (1.5, ()),
+    "gui.pages.models": (3.0, ("streamlit",)),
+}
+
+
+def import_profile(module: str) -> dict[str, float]:
+    """Cumulative import time in seconds per module, from ``-X importtime``."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        if cumulative.isdigit():
+            profile[name] = int(cumulative) / 1e6
+    return profile
+
+
+@pytest.mark.parametrize("module", list(BUDGETS))
+def test_no_heavy_imports(module):
+    _, allowed = BUDGETS[module]
+    profile = import_profile(module)
+    loaded = {
+        heavy
+        for heavy in HEAVY
+        if heavy not in allowed
+        for name in profile
+        if name == heavy or name.startswith(heavy + ".")
+    }
+    assert not loaded, f"{module} imports {sorted(loaded)}"
+
+
+@pytest.mark.import_budget
+@pytest.mark.parametrize("module", list(BUDGETS))
+def test_import_budget(module):
+    budget, _ = BUDGETS[module]
+    seconds = import_profile(module)[module]
+    assert seconds < budget, f"{module}: {seconds:.3f}s > {budget}s budget"
+
+
+class TestLazyAttributes:
+    def test_submodules_and_reexports(self):
+        from src.machinability.models.factory import make_model
+
+        assert models.make_model is make_model
+        assert machinability.models is models
+        assert "make_model" in dir(models) and "factory" in models.__all__
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError, match="no attribute 'nope'"):
+            models.nope
+
+    def test_model_map_resolves_classes(self):
+        from sklearn.ensemble import RandomForestRegressor
+
+        assert list(models.MODEL_MAP) == [
+            "Linear Regression",
+            "SVR",
+            "Random Forest",
+            "Gradient Boosting",
+        ]
+        assert models.MODEL_MAP["Random Forest"] is RandomForestRegressor
+        assert isinstance(models.make_model("Random Forest"), RandomForestRegressor)
+        with pytest.raises(KeyError):
+            models.MODEL_MAP["Lasso"]
@@ -0,0 +1,84 @@
+"""Tests for incremental retraining."""
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from src.machinability.models.incremental import (
+    FeatureMoments,
+    IncrementalTrainer,
+    RefitPolicy,
+)
+
+
+def _batch(rng, n, shift=0.0):
+    X = np.column_stack([rng.normal(5 + shift, 1, n), rng.normal(260, 40, n)])
+    y = 6 * X[:, 0] - 0.2 * X[:, 1] + 90 + rng.normal(0, 1, n)
+    return X, y
+
+
+class TestRefitPolicy:
+    def test_moments(self):
+        X = np.random.default_rng(0).normal(size=(50, 3))
+        m = FeatureMoments(3).update(X[:20]).update(X[20:])
+        np.testing.assert_allclose(m.mean, X.mean(axis=0))
+        np.testing.assert_allclose(m.var, X.var(axis=0, ddof=1))
+
+    def test_decisions(self):
+        rng = np.random.default_rng(1)
+        ref = FeatureMoments(2).update(_batch(rng, 200)[0])
+        policy = RefitPolicy()
+        assert not policy.decide(ref, 0, _batch(rng, 20)[0]).refit
+        shifted = policy.decide(ref, 0, _batch(rng, 20, shift=2.0)[0])
+        assert shifted.refit and shifted.reason == "mean shift"
+        assert policy.decide(ref, 190, _batch(rng, 20)[0]).reason == "data growth"
+
+
+class TestIncrementalTrainer:
+    def test_linear_updates_match_full_fit(self):
+        rng = np.random.default_rng(2)
+        X0, y0 = _batch(rng, 100)
+        X1, y1 = _batch(rng, 20)
+        trainer = IncrementalTrainer("Linear Regression").fit(X0, y0)
+        assert not trainer.update(X1, y1).refit
+        full = LinearRegression().fit(np.vstack([X0, X1]), np.concatenate([y0, y1]))
+        np.testing.assert_allclose(trainer.estimator_.coef_, full.coef_, rtol=1e-8)
+        np.testing.assert_allclose(trainer.predict(X1), full.predict(X1), rtol=1e-8)
+
+    def test_linear_keeps_no_raw_data(self):
+        rng = np.random.default_rng(6)
+        X0, y0 = _batch(rng, 100)
+        trainer = IncrementalTrainer("Linear Regression").fit(X0, y0)
+        batches = [_batch(rng, 20), _batch(rng, 20, shift=3.0)]
+        decisions = [trainer.update(X, y) for X, y in batches]
+        assert trainer.X_ is None and trainer.y_ is None and trainer.n_samples_ == 140
+        assert [d.refit for d in decisions] == [False, True]
+        assert trainer.reference_.n == 140 and trainer.added_since_refit_ == 0
+        X_all = np.vstack([X0] + [X for X, _ in batches])
+        y_all = np.concatenate([y0] + [y for _, y in batches])
+        full = LinearRegression().fit(X_all, y_all)
+        np.testing.assert_allclose(trainer.estimator_.coef_, full.coef_, rtol=1e-8)
+
+    @pytest.mark.parametrize("model", ["Random Forest", "Gradient Boosting"])
+    def test_trees_grow_with_warm_start(self, model):
+        rng = np.random.default_rng(3)
+        trainer = IncrementalTrainer(model, trees_per_batch=5).fit(*_batch(rng, 100))
+        first_tree = np.ravel(trainer.estimator_.estimators_)[0]
+        trainer.update(*_batch(rng, 20))
+        assert trainer.estimator_.n_estimators == 105
+        assert np.ravel(trainer.estimator_.estimators_)[0] is first_tree
+        assert [h["action"] for h in trainer.history_] == ["full fit", "incremental"]
+
+    def test_drift_triggers_full_refit(self):
+        rng = np.random.default_rng(4)
+        trainer = IncrementalTrainer("Random Forest").fit(*_batch(rng, 100))
+        decision = trainer.update(*_batch(rng, 20, shift=3.0))
+        assert decision.refit
+        assert trainer.estimator_.n_estimators == 100
+        assert trainer.reference_.n == 120
+        assert trainer.history_[-1]["reason"] == "mean shift"
+
+    def test_svr_always_refits(self):
+        rng = np.random.default_rng(5)
+        trainer = IncrementalTrainer("SVR").fit(*_batch(rng, 60))
+        assert trainer.update(*_batch(rng, 10)).reason == "no incremental form"
@@ -0,0 +1,167 @@
+"""Tests for the timing and memory instrumentation layer."""
+
+import json
+import threading
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.machinability.analysis.correlation import pearson_correlation
+from src.machinability.utils.instrument import (
+    REGISTRY,
+    MetricsRegistry,
+    count_rows,
+    stage,
+    timed,
+)
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+class TestStage:
+    def test_records_times_and_rows(self, registry):
+        with stage("work", registry) as record:
+            sum(range(100_000))
+            record.rows = 7
+        (rec,) = registry.records()
+        assert rec.name == "work" and rec.rows == 7 and rec.error is None
+        assert rec.wall_s > 0 and rec.cpu_s >= 0
+        assert rec.thread == threading.get_ident()
+
+    def test_error_is_recorded_and_raised(self, registry):
+        with pytest.raises(ValueError):
+            with stage("bad", registry):
+                raise ValueError("boom")
+        assert registry.records()[0].error == "ValueError"
+        assert registry.stats()["bad"].errors == 1
+
+    def test_depth_of_nested_stages(self, registry):
+        with stage("outer", registry):
+            with stage("inner", registry):
+                with stage("innermost", registry):
+                    pass
+            with stage("inner2", registry):
+                pass
+        with stage("next", registry):
+            pass
+        depths = {r.name: r.depth for r in registry.records()}
+        assert depths == {"outer": 0, "inner": 1, "innermost": 2, "inner2": 1, "next": 0}
+
+    def test_depth_restored_after_error(self, registry):
+        with pytest.raises(ValueError):
+            with stage("failing", registry):
+                raise ValueError
+        with stage("after", registry):
+            pass
+        assert [r.depth for r in registry.records()] == [0, 0]
+
+    def test_alloc_peak_nested(self, registry):
+        was_tracing = tracemalloc.is_tracing()
+        tracemalloc.start()
+        try:
+            with stage("outer", registry):
+                with stage("inner", registry):
+                    block = np.ones(2_000_000)  # 16 MB
+                    del block
+                small = np.ones(1000)
+                del small
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+        records = {r.name: r for r in registry.records()}
+        assert records["inner"].alloc_peak_bytes >= 16_000_000
+        assert records["outer"].alloc_peak_bytes >= records["inner"].alloc_peak_bytes
+
+    def test_no_alloc_peak_without_tracing(self, registry):
+        if tracemalloc.is_tracing():
+            pytest.skip("tracemalloc is tracing")
+        with stage("plain", registry):
+            pass
+        assert registry.records()[0].alloc_peak_bytes is None
+
+
+class TestTimed:
+    def test_rows_from_result_and_argument(self, registry):
+        @timed(registry=registry)
+        def make_frame(n):
+            return pd.DataFrame({"a": range(n)})
+
+        @timed(name="fit", rows="X", registry=registry)
+        def fit(X, y):
+            return "model"
+
+        make_frame(5)
+        fit(np.zeros((3, 2)), y=np.zeros(3))
+        made, fitted = registry.records()
+        assert made.name.startswith("test_instrument.") and made.name.endswith(".make_frame")
+        assert (made.rows, fitted.name, fitted.rows) == (5, "fit", 3)
+
+    def test_annotated_library_function(self):
+        mark = REGISTRY.mark()
+        x = pd.Series(np.arange(10.0))
+        pearson_correlation(x, x * 2)
+        (rec,) = [
+            r for r in REGISTRY.records(since=mark) if r.name == "correlation.pearson_correlation"
+        ]
+        assert rec.rows == 10
+
+    def test_count_rows(self):
+        assert count_rows(np.zeros((4, 2))) == 4
+        assert count_rows((pd.Series([1, 2]), "x")) == 2
+        assert count_rows({"r": 0.5, "n": 9}) == 9
+        assert count_rows("abc") is None
+
+
+class TestRegistry:
+    def test_mark_and_thread_filter(self, registry):
+        with stage("a", registry):
+            pass
+        mark = registry.mark()
+        with stage("b", registry):
+            pass
+
+        def other():
+            with stage("c", registry):
+                pass
+
+        worker = threading.Thread(target=other)
+        worker.start()
+        worker.join()
+        assert [r.name for r in registry.records(since=mark)] == ["b", "c"]
+        assert [r.name for r in registry.records(since=mark, thread=threading.get_ident())] == ["b"]
+
+    def test_aggregates_and_bounded_records(self):
+        registry = MetricsRegistry(max_records=2)
+        for _ in range(3):
+            with stage("s", registry, rows=10):
+                pass
+        stats = registry.stats()["s"]
+        assert stats.calls == 3 and stats.rows_total == 30
+        assert stats.wall_s_max >= stats.wall_s_last
+        assert len(registry.records()) == 2
+        registry.reset()
+        assert registry.stats() == {} and registry.records() == []
+
+    def test_json_export(self, registry):
+        with stage("s", registry, rows=1):
+            pass
+        payload = json.loads(registry.to_json(since=0))
+        assert payload["stages"]["s"]["calls"] == 1
+        assert payload["records"][0]["name"] == "s"
+        assert "records" not in json.loads(registry.to_json())
+
+    def test_prometheus_export(self, registry):
+        with stage('load "x"\\y', registry, rows=4):
+            pass
+        text = registry.to_prometheus()
+        assert "# TYPE machinability_stage_calls_total counter" in text
+        assert 'machinability_stage_calls_total{stage="load \\"x\\"\\\\y"} 1' in text
+        assert 'machinability_stage_rows_total{stage="load \\"x\\"\\\\y"} 4' in text
+        for line in text.splitlines():
+            if not line.startswith("#"):
+                float(line.rsplit(" ", 1)[1])
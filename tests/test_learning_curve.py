@@ -0,0 +1,74 @@
+"""Tests for the learning-curve engine."""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+
+from src.machinability.data.synthetic import generate_specimens  # noqa: E402
+from src.machinability.models.learning_curve import (  # noqa: E402
+    learning_curve,
+    main,
+    summarise_learning_curve,
+)
+from src.machinability.visualization.plots import learning_curve_plot  # noqa: E402
+
+
+@pytest.fixture
+def data():
+    df = generate_specimens(90, seed=0)
+    return df[["conductivity", "hardness"]].to_numpy(), df["tool_life"].to_numpy()
+
+
+class TestLearningCurve:
+    def test_table_layout(self, data):
+        X, y = data
+        results = learning_curve(
+            X, y, sizes=(15, 30, 500), models=["Linear Regression", "SVR"], n_repeats=2
+        )
+        assert len(results) == 2 * 2 * 2  # sizes x models x repeats; 500 > n is skipped
+        assert set(results["size"]) == {15, 30}
+        assert (results[["fit_s", "predict_s", "peak_mb"]] > 0).all().all()
+
+    def test_more_data_helps_and_is_reproducible(self, data):
+        X, y = data
+        kwargs = dict(sizes=(15, 90), models=["Linear Regression"], n_repeats=3)
+        first = learning_curve(X, y, **kwargs)
+        again = learning_curve(X, y, n_jobs=2, **kwargs)
+        np.testing.assert_allclose(first["r2"], again["r2"])
+        summary = summarise_learning_curve(first).set_index("size")
+        assert summary.loc[90, "rmse_mean"] < summary.loc[15, "rmse_mean"]
+        assert np.isnan(summary.loc[90, "rmse_std"]) or summary.loc[90, "rmse_std"] >= 0
+
+    def test_plot_and_cli(self, tmp_path):
+        main(
+            [
+                "--n",
+                "40",
+                "--sizes",
+                "15",
+                "30",
+                "--repeats",
+                "2",
+                "--n-jobs",
+                "1",
+                "--models",
+                "Linear Regression",
+                "Random Forest",
+                "--no-memory",
+                "--out",
+                str(tmp_path),
+            ]
+        )
+        assert (tmp_path / "learning_curve.png").exists()
+        assert (tmp_path / "learning_curve_summary.csv").exists()
+
+    def test_plot_returns_figure(self, data):
+        X, y = data
+        summary = summarise_learning_curve(
+            learning_curve(X, y, sizes=(15, 30), models=["Linear Regression"], n_repeats=2)
+        )
+        fig = learning_curve_plot(summary, metrics=("r2",), required_n=(15, 30))
+        assert len(fig.axes) == 1
@@ -0,0 +1,75 @@
+"""Tests for the literature-note and BibTeX parsers."""
+
+from src.machinability.data.literature import (
+    RQS,
+    extract_pillar,
+    load_bibtex,
+    load_notes,
+    parse_bib_entries,
+    parse_note,
+)
+
+BIB = """@article{smith_2020,
+  title = {Eddy current {testing} of steels},
+  author = {Smith, J.},
+  year = {2020}
+}
+
+@book{doe_1999,
+  title = {Machinability},
+  year = {1999}
+}
+"""
+
+NOTE = """# Paper note
+
+- **Title:** Conductivity and tool wear
+- **Authors:** A. Author
+- **Year:** circa 2014
+- **Journal/Publisher:** Wear
+- **Paper Type:** Experimental
+- **Pillar:** Multi (B + D)
+- **RQ Relevance:** RQ1: 4/5 | RQ3: 2/5
+
+## Tags
+`eddy-current` `42CrMo4`
+"""
+
+
+class TestBibtex:
+    def test_parse_entries(self):
+        entries = parse_bib_entries(BIB)
+        assert [e["key"] for e in entries] == ["smith_2020", "doe_1999"]
+        assert entries[0]["type"] == "article"
+        assert entries[0]["year"] == "2020"
+        assert entries[1]["_raw"].startswith("@book{doe_1999")
+
+    def test_missing_file(self, tmp_path):
+        assert load_bibtex(tmp_path / "library.bib") == ""
+        assert parse_bib_entries("") == []
+
+
+class TestNotes:
+    def test_parse_note(self, tmp_path):
+        path = tmp_path / "author_2014.md"
+        path.write_text(NOTE, encoding="utf-8")
+        note = parse_note(path)
+        assert note["title"] == "Conductivity and tool wear"
+        assert note["year"] == 2014
+        assert note["pillar"] == "Multi"
+        assert {rq: note[rq] for rq in RQS} == {"RQ1": 4, "RQ2": 0, "RQ3": 2, "RQ4": 0}
+        assert note["relevance_total"] == 6
+        assert note["tags"] == ["eddy-current", "42CrMo4"]
+
+    def test_load_notes_skips_template(self, tmp_path):
+        (tmp_path / "PAPER_NOTE_TEMPLATE.md").write_text(NOTE, encoding="utf-8")
+        assert load_notes(tmp_path).empty
+        (tmp_path / "a.md").write_text(NOTE, encoding="utf-8")
+        (tmp_path / "b.md").write_text("- **Pillar:** c", encoding="utf-8")
+        notes = load_notes(tmp_path)
+        assert list(notes["file"]) == ["a.md", "b.md"]
+        assert list(notes["pillar"]) == ["Multi", "C"]
+
+    def test_extract_pillar(self):
+        assert extract_pillar("no classification") == ""
+        assert extract_pillar("- **Pillar:** D (models)") == "D"
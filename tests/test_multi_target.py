@@ -0,0 +1,81 @@
+"""Tests for multi-target training and vectorised metrics."""
+
+import numpy as np
+import pytest
+from sklearn.base import clone
+from sklearn.metrics import mean_absolute_percentage_error, r2_score
+
+from src.machinability.data.synthetic import generate_specimens
+from src.machinability.models.baseline import evaluate_model
+from src.machinability.models.factory import make_model
+from src.machinability.models.multi_target import (
+    TARGETS,
+    MultiTargetRegressor,
+    train_multi_target,
+)
+from src.machinability.utils.cache import stable_hash
+
+FEATURES = ["conductivity", "hardness", "composition_C"]
+
+
+@pytest.fixture
+def specimens():
+    return generate_specimens(120, seed=0)
+
+
+class TestEvaluateModel:
+    def test_columns_match_sklearn(self):
+        rng = np.random.default_rng(0)
+        Y = rng.uniform(1, 10, size=(50, 3))
+        P = Y + rng.normal(0, 0.5, size=Y.shape)
+        metrics = evaluate_model(Y, P)
+        for k in range(3):
+            single = evaluate_model(Y[:, k], P[:, k])
+            assert isinstance(single["r2"], float)
+            assert metrics["r2"][k] == pytest.approx(r2_score(Y[:, k], P[:, k]))
+            assert metrics["mape"][k] == pytest.approx(
+                mean_absolute_percentage_error(Y[:, k], P[:, k])
+            )
+            assert metrics["rmse"][k] == pytest.approx(single["rmse"])
+
+    def test_shape_mismatch(self):
+        with pytest.raises(ValueError):
+            evaluate_model(np.zeros(5), np.zeros((5, 1)))
+
+
+class TestMultiTarget:
+    @pytest.mark.parametrize("model", ["Linear Regression", "Gradient Boosting"])
+    def test_matches_separate_fits(self, specimens, model):
+        X = specimens[FEATURES].to_numpy()
+        Y = specimens[list(TARGETS)].to_numpy()
+        joint = MultiTargetRegressor(model).fit(X, Y).predict(X)
+        for k in range(Y.shape[1]):
+            separate = make_model(model).fit(X, Y[:, k]).predict(X)
+            np.testing.assert_allclose(joint[:, k], separate, rtol=1e-6)
+
+    def test_target_view(self, specimens):
+        X = specimens[FEATURES].to_numpy()
+        Y = specimens[list(TARGETS)].to_numpy()
+        reg = MultiTargetRegressor("Linear Regression").fit(X, Y)
+        view = reg.target(1)
+        np.testing.assert_allclose(view.predict(X), reg.predict(X)[:, 1])
+        assert view.score(X, Y[:, 1]) == pytest.approx(r2_score(Y[:, 1], reg.predict(X)[:, 1]))
+        assert view.get_params() == {"regressor": reg, "index": 1}
+        assert "TargetView" in repr(view)
+        np.testing.assert_allclose(clone(view).predict(X), view.predict(X))
+        assert stable_hash(view) != stable_hash(reg.target(0))
+        with pytest.raises(TypeError, match="read-only"):
+            view.fit(X, Y[:, 1])
+
+    def test_forest_is_one_estimator(self, specimens):
+        X = specimens[FEATURES].to_numpy()
+        Y = specimens[list(TARGETS)].to_numpy()
+        reg = MultiTargetRegressor("Random Forest", scale=True).fit(X, Y)
+        assert len(reg.estimators_) == 1
+        assert reg.predict(X[:4]).shape == (4, 3)
+
+    def test_train_multi_target(self, specimens):
+        result = train_multi_target(specimens, FEATURES, model="Linear Regression", cv_folds=3)
+        assert list(result["metrics"].index) == list(TARGETS)
+        assert result["cv_r2"].shape == (3, 3)
+        assert (result["metrics"]["r2"] > 0.5).all()
@@ -0,0 +1,78 @@
+"""Tests for ONNX export and onnxruntime scoring."""
+
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+pytest.importorskip("skl2onnx")
+pytest.importorskip("onnxruntime")
+
+from src.machinability.models.baseline import HardnessOnlyBaseline  # noqa: E402
+from src.machinability.models.factory import MODEL_MAP, make_model  # noqa: E402
+from src.machinability.models.onnx_export import export_onnx  # noqa: E402
+from src.machinability.models.onnx_scoring import load_scorer  # noqa: E402
+from src.machinability.models.registry import save_model  # noqa: E402
+from src.machinability.utils.config import REPO_ROOT  # noqa: E402
+
+FEATURES = ["conductivity", "hardness"]
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = np.column_stack([rng.uniform(3, 8, 120), rng.uniform(180, 340, 120)])
+    y = 6.0 * X[:, 0] - 0.2 * X[:, 1] + 90 + rng.normal(0, 1, 120)
+    return X, y
+
+
+class TestOnnxExport:
+    @pytest.mark.parametrize("name", list(MODEL_MAP))
+    def test_factory_models_match_sklearn(self, data, tmp_path, name):
+        X, y = data
+        model = make_model(name).fit(X, y)
+        save_model(model, "m", FEATURES, "tool_life", registry_dir=tmp_path)
+        export_onnx("m", tmp_path)
+        scorer = load_scorer("m", tmp_path, batch_size=32)
+        np.testing.assert_allclose(scorer.predict(X), model.predict(X), rtol=1e-4, atol=1e-3)
+
+    def test_baseline_single_and_multi_target(self, data, tmp_path):
+        X, y = data
+        hardness = X[:, 1:]
+        for target, Y in (("tool_life", y), ("both", np.column_stack([y, 0.5 * y]))):
+            model = HardnessOnlyBaseline().fit(hardness, Y)
+            save_model(model, target, ["hardness"], target, registry_dir=tmp_path)
+            export_onnx(target, tmp_path)
+            scorer = load_scorer(target, tmp_path)
+            np.testing.assert_allclose(scorer.predict(hardness), model.predict(hardness), rtol=1e-5)
+
+    def test_scorer_is_memoised_and_scores_rows(self, data, tmp_path):
+        X, y = data
+        model = make_model("Linear Regression").fit(X, y)
+        save_model(model, "lr", FEATURES, "tool_life", registry_dir=tmp_path)
+        export_onnx("lr", tmp_path)
+        scorer = load_scorer("lr", tmp_path)
+        assert load_scorer("lr", tmp_path) is scorer
+        rows = [{"hardness": X[0, 1], "conductivity": X[0, 0]}]
+        np.testing.assert_allclose(scorer.predict_rows(rows), model.predict(X[:1]), rtol=1e-5)
+        with pytest.raises(ValueError):
+            scorer.predict_rows([{"hardness": 200.0}])
+
+    def test_unexported_model_raises(self, data, tmp_path):
+        X, y = data
+        save_model(
+            make_model("Linear Regression").fit(X, y), "lr", FEATURES, "t", registry_dir=tmp_path
+        )
+        with pytest.raises(FileNotFoundError):
+            load_scorer("lr", tmp_path)
+
+    def test_scoring_module_avoids_heavy_imports(self):
+        code = (
+            "import sys; import src.machinability.models.onnx_scoring; "
+            "print(sorted({'sklearn', 'pandas', 'streamlit'} & set(sys.modules)))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "[]"
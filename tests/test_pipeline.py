@@ -0,0 +1,173 @@
+"""Tests for the incremental raw-to-results pipeline."""
+
+import joblib
+import pandas as pd
+import pytest
+
+from src.machinability.data.synthetic import write_raw_csvs
+from src.machinability.models.multi_target import MultiTargetRegressor
+from src.machinability.pipeline import Pipeline, Stage, build_pipeline, main
+
+
+def _copy(inputs, outputs):
+    outputs["out"].write_text(inputs["src"].read_text())
+
+
+def _concat(inputs, outputs, sep="+"):
+    outputs["out"].write_text(sep.join(inputs[k].read_text() for k in sorted(inputs)))
+
+
+def _fail(inputs, outputs):
+    raise RuntimeError("boom")
+
+
+@pytest.fixture
+def chain(tmp_path):
+    src = tmp_path / "src.txt"
+    src.write_text("a")
+
+    def make(tail=_concat, params=None):
+        stages = [
+            Stage("copy", _copy, {"src": src}, {"out": tmp_path / "b.txt"}),
+            Stage("lower", _copy, {"src": tmp_path / "b.txt"}, {"out": tmp_path / "c.txt"}),
+            Stage("side", _copy, {"src": src}, {"out": tmp_path / "d.txt"}),
+            Stage(
+                "join",
+                tail,
+                {"c": tmp_path / "c.txt", "d": tmp_path / "d.txt"},
+                {"out": tmp_path / "e.txt"},
+                params or {},
+            ),
+        ]
+        return Pipeline(stages, tmp_path / "state.json")
+
+    return src, make
+
+
+class TestPipeline:
+    def test_order_and_dependencies(self, chain):
+        _, make = chain
+        pipe = make()
+        assert pipe.order.index("copy") < pipe.order.index("lower") < pipe.order.index("join")
+        assert pipe.deps["join"] == {"lower", "side"}
+        assert pipe.ancestors(["lower"]) == {"copy", "lower"}
+
+    def test_incremental_rebuilds(self, chain, tmp_path):
+        src, make = chain
+        assert set(make().run(jobs=1, log=lambda _: None).values()) == {"built"}
+        assert set(make().run(jobs=1, log=lambda _: None).values()) == {"up to date"}
+
+        src.write_text("x")
+        outcome = make().run(jobs=1, log=lambda _: None)
+        assert outcome == {"copy": "built", "side": "built", "lower": "built", "join": "built"}
+        assert (tmp_path / "e.txt").read_text() == "x+x"
+
+        outcome = make(params={"sep": "-"}).run(jobs=1, log=lambda _: None)
+        assert outcome["join"] == "built"
+        assert outcome["copy"] == "up to date"
+
+    def test_identical_upstream_output_does_not_propagate(self, chain, tmp_path):
+        src, make = chain
+        make().run(jobs=1, log=lambda _: None)
+        outcome = make().run(force={"copy"}, jobs=1, log=lambda _: None)
+        assert outcome["copy"] == "built"
+        assert outcome["lower"] == "up to date"
+
+    def test_modified_or_missing_output_rebuilds(self, chain, tmp_path):
+        _, make = chain
+        make().run(jobs=1, log=lambda _: None)
+        (tmp_path / "e.txt").write_text("edited")
+        assert make().stale_reason("join") == "output 'out' modified"
+        (tmp_path / "d.txt").unlink()
+        pipe = make()
+        assert pipe.plan()["side"] == "output 'out' missing"
+        assert pipe.plan()["join"] == "upstream rebuilt"
+        assert pipe.run(jobs=1, log=lambda _: None)["side"] == "built"
+
+    def test_failure_skips_dependents(self, chain):
+        _, make = chain
+        outcome = make(tail=_fail).run(jobs=2, log=lambda _: None)
+        assert outcome["join"] == "failed"
+        assert outcome["copy"] == "built"
+        # the failed stage is retried next time; the others are up to date
+        assert make(tail=_fail).plan()["join"] == "never built"
+
+    def test_negative_jobs_means_all_cores(self, chain):
+        _, make = chain
+        assert set(make().run(jobs=-1, log=lambda _: None).values()) == {"built"}
+
+    def test_cycle_and_duplicate_outputs_rejected(self, tmp_path):
+        a, b = tmp_path / "a", tmp_path / "b"
+        with pytest.raises(ValueError, match="cycle"):
+            Pipeline(
+                [
+                    Stage("x", _copy, {"src": a}, {"out": b}),
+                    Stage("y", _copy, {"src": b}, {"out": a}),
+                ],
+                tmp_path / "s.json",
+            )
+        with pytest.raises(ValueError, match="produced by"):
+            Pipeline(
+                [
+                    Stage("x", _copy, {"src": a}, {"out": b}),
+                    Stage("y", _copy, {"src": a}, {"out": b}),
+                ],
+                tmp_path / "s.json",
+            )
+
+
+class TestDefaultPipeline:
+    def test_raw_to_results(self, tmp_path):
+        raw, proc, res = tmp_path / "raw", tmp_path / "proc", tmp_path / "res"
+        write_raw_csvs(raw, n=60)
+        pipe = build_pipeline(raw, proc, res, models=["Linear Regression"])
+        outcome = pipe.run(jobs=2, log=lambda _: None)
+        assert set(outcome.values()) == {"built"}
+        metrics = pd.read_csv(res / "metrics.csv")
+        assert set(metrics["model"]) == {"Linear Regression", "HardnessOnly"}
+        assert set(metrics["target"]) == {"tool_life", "Ra", "Fc"}
+        bundle = joblib.load(res / "models.joblib")
+        assert isinstance(bundle["models"]["Linear Regression"], MultiTargetRegressor)
+        assert (metrics["r2"] > 0.5).all()
+        merged = pd.read_csv(proc / "merged.csv")
+        assert len(merged) == 60
+        assert (res / "figures" / "model_r2.png").exists()
+
+        # Same synthetic content rewritten: nothing to do
+        write_raw_csvs(raw, n=60)
+        assert (
+            main(
+                [
+                    "--raw",
+                    str(raw),
+                    "--processed",
+                    str(proc),
+                    "--results",
+                    str(res),
+                    "--models",
+                    "Linear Regression",
+                    "-j",
+                    "1",
+                ]
+            )
+            == 0
+        )
+        pipe = build_pipeline(raw, proc, res, models=["Linear Regression"])
+        assert not any(pipe.plan().values())
+
+        # New machining data only touches its branch and everything downstream
+        mach = pd.read_csv(raw / "machining.csv")
+        mach.loc[0, "value"] += 1.0
+        mach.to_csv(raw / "machining.csv", index=False)
+        outcome = build_pipeline(raw, proc, res, models=["Linear Regression"]).run(
+            jobs=1, log=lambda _: None
+        )
+        assert outcome["ingest_machining"] == "built"
+        assert outcome["correct_conductivity"] == "up to date"
+        assert outcome["evaluate"] == "built"
+
+    def test_missing_raw_input_fails(self, tmp_path):
+        pipe = build_pipeline(tmp_path / "raw", tmp_path / "proc", tmp_path / "res")
+        outcome = pipe.run(jobs=1, log=lambda _: None)
+        assert outcome["ingest_machining"] == "failed"
+        assert outcome["figures"] == "skipped"
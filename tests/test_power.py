@@ -0,0 +1,69 @@
+"""Tests for the Monte Carlo power analysis."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from src.machinability.analysis.power import (
+    POWER_DESIGNS,
+    _pillai_trace,
+    bland_altman_power,
+    fisher_z_power,
+    manova_power,
+    pearson_power,
+    power_curve,
+    required_sample_size,
+    sobel_power,
+)
+
+
+def _analytic_pearson_power(rho, n, alpha=0.05):
+    """Fisher-z normal approximation of two-sided correlation power."""
+    shift = np.arctanh(rho) * np.sqrt(n - 3)
+    crit = stats.norm.ppf(1 - alpha / 2)
+    return stats.norm.sf(crit - shift) + stats.norm.cdf(-crit - shift)
+
+
+class TestPower:
+    def test_pearson_matches_analytic(self):
+        power = pearson_power([0.5, 0.7], [15, 30], n_sims=4000, seed=0)
+        for i, rho in enumerate([0.5, 0.7]):
+            for j, n in enumerate([15, 30]):
+                assert power[i, j] == pytest.approx(_analytic_pearson_power(rho, n), abs=0.04)
+
+    @pytest.mark.parametrize(
+        "test, null",
+        [
+            (pearson_power, [0.0]),
+            (fisher_z_power, [(0.6, 0.6, 0.6)]),
+            (manova_power, [0.0]),
+            (bland_altman_power, [0.0]),
+        ],
+    )
+    def test_type_one_error_at_alpha(self, test, null):
+        power = test(null, [20], n_sims=4000, seed=1)
+        assert power[0, 0] == pytest.approx(0.05, abs=0.015)
+
+    def test_sobel_conservative_and_increasing(self):
+        power = sobel_power([(0.0, 0.5), (0.5, 0.5)], [30, 100], n_sims=2000, seed=2)
+        assert power[0].max() < 0.05
+        assert power[1, 1] > power[1, 0] > 0.3
+
+    def test_pillai_matches_statsmodels(self):
+        from statsmodels.multivariate.manova import MANOVA
+
+        rng = np.random.default_rng(3)
+        Y = rng.standard_normal((3, 12, 2)) + np.array([0.0, 0.5, 1.0])[:, None, None]
+        df = pd.DataFrame(Y.reshape(-1, 2), columns=["a", "b"])
+        df["group"] = np.repeat(["x", "y", "z"], 12)
+        table = MANOVA.from_formula("a + b ~ group", df).mv_test().results["group"]["stat"]
+        assert _pillai_trace(Y) == pytest.approx(table.loc["Pillai's trace", "Value"])
+
+    def test_curve_and_required_n(self):
+        curve = power_curve("H1a-b", sizes=[10, 15, 40], n_sims=500)
+        assert set(curve.columns) == {"hypothesis", "effect", "n", "power"}
+        assert len(curve) == len(POWER_DESIGNS["H1a-b"]["effects"]) * 3
+        table = required_sample_size(curve).set_index("effect")
+        assert table.loc["0.8", "n"] <= table.loc["0.5", "n"]
+        assert (table["stated_n"] == 15).all()
@@ -0,0 +1,110 @@
+"""Tests for the opt-in sampling profiler."""
+
+import json
+import time
+
+import pytest
+
+from src.machinability.cli import main
+from src.machinability.utils.profiling import (
+    PROFILE_DIR,
+    PROFILE_ENV,
+    SamplingProfiler,
+    maybe_profile,
+    profile_dir_from_env,
+    profiling_requested,
+)
+
+
+def sleepy_leaf():
+    time.sleep(0.05)
+
+
+def sleepy_root():
+    for _ in range(3):
+        sleepy_leaf()
+
+
+@pytest.fixture(autouse=True)
+def no_profile_env(monkeypatch):
+    monkeypatch.delenv(PROFILE_ENV, raising=False)
+
+
+class TestSamplingProfiler:
+    def test_samples_call_stacks(self):
+        with SamplingProfiler(interval=0.002) as profiler:
+            sleepy_root()
+        assert profiler.n_samples > 10
+        assert len(profiler.weights) == len(profiler.samples)
+        assert 0.1 < sum(profiler.weights) <= profiler.duration + 0.01
+        names = [profiler.frame_name(i) for i in profiler.stacks[profiler.samples[-1]]]
+        assert any(n.startswith("sleepy_root (tests/test_profiling.py:") for n in names)
+
+    def test_collapsed_and_speedscope(self):
+        with SamplingProfiler(interval=0.002) as profiler:
+            sleepy_root()
+        lines = profiler.to_collapsed().splitlines()
+        stacks, counts = zip(*(line.rsplit(" ", 1) for line in lines))
+        assert all(int(c) >= 0 for c in counts)
+        assert any(
+            "sleepy_root" in s and s.index("sleepy_root") < s.index("sleepy_leaf") for s in stacks
+        )
+        doc = profiler.to_speedscope("run")
+        (prof,) = doc["profiles"]
+        assert prof["type"] == "sampled" and len(prof["samples"]) == len(prof["weights"])
+        n_frames = len(doc["shared"]["frames"])
+        assert all(0 <= i < n_frames for sample in prof["samples"] for i in sample)
+
+
+class TestOptIn:
+    def test_env_setting(self, monkeypatch, tmp_path):
+        assert profile_dir_from_env() is None and not profiling_requested()
+        monkeypatch.setenv(PROFILE_ENV, "1")
+        assert profile_dir_from_env() == PROFILE_DIR and profiling_requested()
+        monkeypatch.setenv(PROFILE_ENV, str(tmp_path))
+        assert profile_dir_from_env() == tmp_path
+        monkeypatch.setenv(PROFILE_ENV, "off")
+        assert not profiling_requested()
+
+    def test_query_param(self):
+        assert profiling_requested({"profile": "1"})
+        assert profiling_requested({"profile": ""})
+        assert not profiling_requested({"profile": "0"})
+        assert not profiling_requested({"page": "models"})
+
+    def test_disabled_writes_nothing(self, tmp_path):
+        with maybe_profile("off", out_dir=tmp_path) as profiler:
+            pass
+        assert profiler is None and not any(tmp_path.iterdir())
+
+
+class TestWriteProfile:
+    def test_files_and_metadata(self, tmp_path):
+        with maybe_profile(
+            "page-ML Models",
+            enabled=True,
+            out_dir=tmp_path,
+            interval=0.002,
+            metadata={"page": "ML Models"},
+        ) as profiler:
+            sleepy_root()
+        paths = profiler.paths
+        assert paths["speedscope"].name.endswith("_page-ML-Models.speedscope.json")
+        assert "sleepy_leaf" in paths["collapsed"].read_text()
+        json.loads(paths["speedscope"].read_text())
+        meta = json.loads(paths["meta"].read_text())
+        assert meta["label"] == "page-ML Models" and meta["page"] == "ML Models"
+        assert meta["samples"] == profiler.n_samples and meta["duration_s"] > 0.1
+        assert {"argv", "pid", "python", "commit", "created"} <= set(meta)
+
+    def test_written_when_block_raises(self, tmp_path):
+        with pytest.raises(RuntimeError):
+            with maybe_profile("boom", enabled=True, out_dir=tmp_path) as profiler:
+                raise RuntimeError
+        assert profiler.paths["meta"].exists()
+
+    def test_cli_profile_from_env(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(PROFILE_ENV, str(tmp_path / "profiles"))
+        assert main(["correlate", "--n", "40", "--out", str(tmp_path / "out")]) == 0
+        (meta,) = (tmp_path / "profiles").glob("*_cli-correlate.meta.json")
+        assert json.loads(meta.read_text())["command"] == "correlate"
@@ -0,0 +1,83 @@
+"""Tests for the persistent model registry."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+
+from src.machinability.models.multi_target import MultiTargetRegressor
+from src.machinability.models.registry import (
+    default_model_name,
+    list_models,
+    load_metadata,
+    load_model,
+    predict_batch,
+    save_model,
+)
+
+
+@pytest.fixture
+def registry(tmp_path):
+    X = np.column_stack([np.linspace(3, 8, 50), np.linspace(180, 340, 50)])
+    y = 2.0 * X[:, 0] - 0.1 * X[:, 1] + 50
+    model = LinearRegression().fit(X, y)
+    save_model(
+        model,
+        "lr_tool_life",
+        ["conductivity", "hardness"],
+        "tool_life",
+        metrics={"r2": 1.0},
+        data_digest="abc",
+        registry_dir=tmp_path,
+    )
+    return tmp_path, model
+
+
+class TestRegistry:
+    def test_roundtrip_metadata(self, registry):
+        root, _ = registry
+        meta = load_metadata("lr_tool_life", registry_dir=root)
+        assert meta["features"] == ["conductivity", "hardness"]
+        assert meta["metrics"] == {"r2": 1.0}
+        assert list_models(root)["name"].tolist() == ["lr_tool_life"]
+
+    def test_load_is_memoised(self, registry):
+        root, _ = registry
+        assert load_model("lr_tool_life", root) is load_model("lr_tool_life", root)
+
+    def test_predict_batch_chunks_match_direct(self, registry):
+        root, model = registry
+        df = pd.DataFrame(
+            {"hardness": np.linspace(200, 300, 1001), "conductivity": np.linspace(4, 7, 1001)}
+        )
+        pred = predict_batch("lr_tool_life", df, chunk_size=64, registry_dir=root)
+        expected = model.predict(df[["conductivity", "hardness"]].to_numpy())
+        np.testing.assert_allclose(pred, expected)
+
+    @pytest.mark.parametrize("factory", ["forest", "multi_target"])
+    def test_predict_batch_multi_output(self, factory):
+        X = np.random.default_rng(0).normal(size=(200, 2))
+        Y = np.column_stack([X[:, 0], 2 * X[:, 1], X.sum(axis=1)])
+        if factory == "forest":
+            model = RandomForestRegressor(n_estimators=5, random_state=0).fit(X, Y)
+        else:
+            model = MultiTargetRegressor("Linear Regression").fit(X, Y)
+        pred = predict_batch(model, X, chunk_size=64)
+        assert pred.shape == (200, 3)
+        np.testing.assert_allclose(pred, model.predict(X))
+
+    def test_missing_feature_column(self, registry):
+        root, _ = registry
+        with pytest.raises(ValueError, match="Missing feature columns"):
+            predict_batch("lr_tool_life", pd.DataFrame({"hardness": [1.0]}), registry_dir=root)
+
+    def test_unknown_and_invalid_names(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_model("nope", tmp_path)
+        with pytest.raises(ValueError):
+            load_model("../escape", tmp_path)
+
+    def test_default_name(self):
+        name = default_model_name("Random Forest", "Ra", "0123456789")
+        assert name == "random-forest_Ra_01234567"
@@ -0,0 +1,99 @@
+"""Tests for the SQLite index of MLflow runs."""
+
+import pytest
+
+pytest.importorskip("mlflow")
+
+from src.machinability.utils.run_index import RunIndex  # noqa: E402
+from src.machinability.utils.tracking import BufferedRunLogger  # noqa: E402
+
+
+@pytest.fixture
+def mlruns(tmp_path, monkeypatch):
+    monkeypatch.setenv("MLFLOW_ALLOW_FILE_STORE", "true")
+    root = tmp_path / "mlruns"
+    logger = BufferedRunLogger(f"file://{root}", "sweep", schema=None)
+    for model, r2s in (("Random Forest", [0.8, 0.9]), ("SVR", [0.6, 0.7])):
+        for target in ("tool_life", "Ra"):
+            for r2 in r2s:
+                with logger.start_run(run_name=f"{model}-{target}") as run:
+                    run.log_params({"model_type": model, "target_metric": target})
+                    run.log_metric("r2", r2 - 0.1, step=0)
+                    run.log_metric("r2", r2, step=1)
+                    run.set_tag("stage", "test")
+    logger.close()
+    return root, logger
+
+
+@pytest.fixture
+def index(mlruns, tmp_path):
+    with RunIndex(tmp_path / "index.sqlite", mlruns[0]) as idx:
+        idx.update()
+        yield idx
+
+
+class TestUpdate:
+    def test_indexes_all_runs(self, index):
+        assert len(index) == 8
+
+    def test_unchanged_runs_are_skipped(self, index):
+        assert index.update() == {"added": 0, "updated": 0, "removed": 0, "unchanged": 8}
+
+    def test_changed_added_and_removed_runs(self, index, mlruns):
+        root, logger = mlruns
+        client = logger.client
+        run_id = index.runs()["run_id"].iloc[0]
+        client.log_metric(run_id, "rmse", 1.5)
+        new = client.create_run(logger.experiment_id)
+        client.log_param(new.info.run_id, "model_type", "Linear Regression")
+        counts = index.update()
+        assert counts["added"] == 1
+        assert counts["updated"] == 1
+        assert index.runs().set_index("run_id").loc[run_id, "metrics.rmse"] == 1.5
+
+        client.delete_run(new.info.run_id)
+        index.update()
+        assert len(index.runs()) == 8
+        assert len(index.runs(include_deleted=True)) == 9
+
+    def test_missing_store(self, tmp_path):
+        with RunIndex(":memory:", tmp_path / "absent") as idx:
+            assert idx.update()["added"] == 0
+            assert idx.runs().empty
+
+
+class TestQueries:
+    def test_matches_client_search(self, index, mlruns):
+        _, logger = mlruns
+        expected = {
+            run.info.run_id: run.data for run in logger.client.search_runs([logger.experiment_id])
+        }
+        got = index.runs(experiment="sweep").set_index("run_id")
+        assert set(got.index) == set(expected)
+        for run_id, data in expected.items():
+            assert got.loc[run_id, "metrics.r2"] == data.metrics["r2"]
+            assert got.loc[run_id, "params.model_type"] == data.params["model_type"]
+            assert got.loc[run_id, "tags.stage"] == data.tags["stage"]
+        assert (got["status"] == "FINISHED").all()
+
+    def test_param_filters(self, index):
+        rf = index.runs(params={"model_type": "Random Forest", "target_metric": "Ra"})
+        assert len(rf) == 2
+        assert len(index.runs(params={"target_metric": ["Ra", "tool_life"]})) == 8
+        assert index.runs(experiment="other").empty
+
+    def test_latest_metric_value(self, index):
+        assert set(index.runs()["metrics.r2"].round(2)) == {0.6, 0.7, 0.8, 0.9}
+
+    def test_best_runs(self, index):
+        best = index.best_runs("r2", by=["model_type", "target_metric"])
+        assert len(best) == 4
+        by_model = best.groupby("params.model_type")["metrics.r2"].max().round(2)
+        assert by_model.to_dict() == {"Random Forest": 0.9, "SVR": 0.7}
+        worst = index.best_runs("r2", by=["model_type"], mode="min")
+        assert worst.set_index("params.model_type")["metrics.r2"].round(2).to_dict() == {
+            "Random Forest": 0.8,
+            "SVR": 0.6,
+        }
+        with pytest.raises(ValueError):
+            index.best_runs("r2", by=["model_type"], mode="median")
@@ -0,0 +1,248 @@
+"""Tests for the local prediction server (localhost only)."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+
+from src.machinability.models.bootstrap import BootstrapEnsemble
+from src.machinability.models.compiled import CompiledTreeEnsemble
+from src.machinability.models.drift import DriftReference, save_reference
+from src.machinability.models.registry import save_model
+from src.machinability.models.server import ARROW_CONTENT_TYPE, MicroBatcher, PredictionServer
+
+FEATURES = ["conductivity", "hardness"]
+
+
+@pytest.fixture
+def model():
+    X = np.column_stack([np.linspace(3, 8, 40), np.linspace(180, 340, 40) ** 1.1])
+    y = 6.0 * X[:, 0] - 0.2 * X[:, 1] + 90
+    return LinearRegression().fit(X, y)
+
+
+@pytest.fixture
+def server(model, tmp_path):
+    save_model(model, "lr", FEATURES, "tool_life", registry_dir=tmp_path)
+    srv = PredictionServer.from_registry(registry_dir=tmp_path, port=0, max_wait_ms=20)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _post(srv, path, body: bytes, content_type="application/json"):
+    host, port = srv.server_address[:2]
+    req = urllib.request.Request(
+        f"http://{host}:{port}{path}", data=body, headers={"Content-Type": content_type}
+    )
+    with urllib.request.urlopen(req, timeout=10) as resp:
+        return resp.read()
+
+
+def _get(srv, path):
+    host, port = srv.server_address[:2]
+    with urllib.request.urlopen(f"http://{host}:{port}{path}", timeout=10) as resp:
+        return json.loads(resp.read())
+
+
+class TestMicroBatcher:
+    def test_coalesces_concurrent_requests(self, model):
+        batcher = MicroBatcher(model, max_wait_ms=50)
+        X = np.array([[5.0, 400.0], [6.0, 500.0]])
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda _: batcher.predict(X), range(16)))
+        batcher.close()
+        for res in results:
+            np.testing.assert_allclose(res, model.predict(X))
+        assert batcher.batches < 16
+        assert batcher.batched_rows == 32
+
+    def test_failing_request_does_not_fail_its_batch(self, model):
+        batcher = MicroBatcher(model, max_wait_ms=50)
+        good, bad = np.array([[5.0, 400.0]]), np.array([[np.nan, 400.0]])
+        futures = [batcher.submit(good if i % 2 else bad) for i in range(8)]
+        outcomes = [f.exception() or f.result() for f in futures]
+        batcher.close()
+        for i, outcome in enumerate(outcomes):
+            if i % 2:
+                np.testing.assert_allclose(outcome, model.predict(good))
+            else:
+                assert isinstance(outcome, ValueError)
+
+    def test_multi_output_predictions_keep_rows(self):
+        X = np.random.default_rng(0).normal(size=(40, 2))
+        forest = RandomForestRegressor(n_estimators=5, random_state=0).fit(X, X * [1.0, -1.0])
+        batcher = MicroBatcher(forest, max_wait_ms=50)
+        with ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(batcher.predict, [X[:2], X[2:5], X[5:6]]))
+        batcher.close()
+        for res, rows in zip(results, [X[:2], X[2:5], X[5:6]]):
+            np.testing.assert_allclose(res, forest.predict(rows))
+
+
+class _Exploding(LinearRegression):
+    def predict(self, X):
+        raise RuntimeError("boom")
+
+
+class TestPredictionServer:
+    def test_json_predict_and_metrics(self, server, model):
+        rows = [{"conductivity": 5.0, "hardness": 400.0}, {"conductivity": 7.0, "hardness": 350.0}]
+        out = json.loads(_post(server, "/predict/lr", json.dumps({"rows": rows}).encode()))
+        expected = model.predict(np.array([[5.0, 400.0], [7.0, 350.0]]))
+        np.testing.assert_allclose(out["predictions"], expected)
+
+        metrics = _get(server, "/metrics")
+        assert metrics["requests"] == 1
+        assert metrics["rows"] == 2
+        assert metrics["latency_ms"]["p95"] > 0
+
+    def test_evaluate(self, server, model):
+        rows = [
+            {"conductivity": c, "hardness": h, "tool_life": float(model.predict([[c, h]])[0])}
+            for c, h in [(4.0, 300.0), (5.0, 320.0), (6.0, 360.0)]
+        ]
+        out = json.loads(_post(server, "/evaluate/lr", json.dumps({"rows": rows}).encode()))
+        assert out["r2"] == pytest.approx(1.0)
+
+    def test_bad_request(self, server):
+        with pytest.raises(urllib.error.HTTPError) as info:
+            _post(server, "/predict/lr", json.dumps({"rows": [{"hardness": 1.0}]}).encode())
+        assert info.value.code == 400
+        assert _get(server, "/health")["models"] == ["lr"]
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"rows": [{"conductivity": None, "hardness": 400.0}]},
+            {"rows": [[5.0, 400.0]]},
+            {"rows": 5},
+            {"rows": []},
+            {"instances": [[5.0, "nan"]]},
+            {"instances": [[5.0]]},
+            [1, 2],
+            "rows",
+        ],
+    )
+    def test_malformed_payloads_are_rejected(self, server, payload):
+        with pytest.raises(urllib.error.HTTPError) as info:
+            _post(server, "/predict/lr", json.dumps(payload).encode())
+        assert info.value.code == 400
+        assert _get(server, "/metrics")["errors"] == 1
+
+    def test_invalid_content_length_is_rejected(self, server):
+        import http.client
+
+        host, port = server.server_address[:2]
+        conn = http.client.HTTPConnection(host, port, timeout=10)
+        conn.putrequest("POST", "/predict/lr")
+        conn.putheader("Content-Type", "application/json")
+        conn.putheader("Content-Length", "abc")
+        conn.endheaders()
+        assert conn.getresponse().status == 400
+        conn.close()
+        assert _get(server, "/metrics")["errors"] == 1
+
+    def test_model_failure_returns_500_and_is_counted(self, tmp_path):
+        X = np.random.default_rng(0).normal(size=(20, 2))
+        save_model(
+            _Exploding().fit(X, X[:, 0]), "bad", FEATURES, "tool_life", registry_dir=tmp_path
+        )
+        srv = PredictionServer.from_registry(registry_dir=tmp_path, port=0)
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        try:
+            with pytest.raises(urllib.error.HTTPError) as info:
+                _post(srv, "/predict/bad", json.dumps({"instances": [[1.0, 2.0]]}).encode())
+            assert info.value.code == 500
+            assert "RuntimeError" in json.loads(info.value.read())["error"]
+            assert _get(srv, "/metrics")["errors"] == 1
+        finally:
+            srv.shutdown()
+            srv.server_close()
+
+    def test_multi_output_json_predict(self, tmp_path):
+        X = np.random.default_rng(0).normal(size=(40, 2))
+        forest = RandomForestRegressor(n_estimators=5, random_state=0).fit(X, X * [1.0, -1.0])
+        save_model(forest, "rf2", FEATURES, "tool_life", registry_dir=tmp_path)
+        srv = PredictionServer.from_registry(registry_dir=tmp_path, port=0)
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        try:
+            body = json.dumps({"instances": X[:2].tolist()}).encode()
+            out = json.loads(_post(srv, "/predict/rf2", body))
+            np.testing.assert_allclose(out["predictions"], forest.predict(X[:2]))
+        finally:
+            srv.shutdown()
+            srv.server_close()
+
+    def test_bad_request_does_not_fail_concurrent_ones(self, server, model):
+        good = json.dumps({"rows": [{"conductivity": 5.0, "hardness": 400.0}]}).encode()
+        bad = json.dumps({"rows": [{"conductivity": None, "hardness": 400.0}]}).encode()
+
+        def post(body):
+            try:
+                return json.loads(_post(server, "/predict/lr", body))["predictions"]
+            except urllib.error.HTTPError as exc:
+                return exc.code
+
+        with ThreadPoolExecutor(8) as pool:
+            outcomes = list(pool.map(post, [good, bad] * 4))
+        assert outcomes[1::2] == [400] * 4
+        for predictions in outcomes[::2]:
+            np.testing.assert_allclose(predictions, model.predict([[5.0, 400.0]]))
+
+    def test_arrow_roundtrip(self, server, model):
+        pa = pytest.importorskip("pyarrow")
+        table = pa.table({"hardness": [400.0, 350.0], "conductivity": [5.0, 7.0]})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        body = _post(server, "/predict/lr", sink.getvalue().to_pybytes(), ARROW_CONTENT_TYPE)
+        result = pa.ipc.open_stream(body).read_all()
+        expected = model.predict(np.array([[5.0, 400.0], [7.0, 350.0]]))
+        np.testing.assert_allclose(result.column("prediction").to_numpy(), expected)
+
+    def test_tree_models_served_compiled(self, tmp_path):
+        X = np.random.default_rng(0).normal(size=(50, 2))
+        forest = RandomForestRegressor(n_estimators=5, random_state=0).fit(X, X[:, 0])
+        save_model(forest, "rf", FEATURES, "tool_life", registry_dir=tmp_path)
+        srv = PredictionServer.from_registry(registry_dir=tmp_path, port=0)
+        try:
+            batcher = srv.batchers["rf"]
+            assert isinstance(batcher.model, CompiledTreeEnsemble)
+            np.testing.assert_allclose(batcher.predict(X), forest.predict(X))
+        finally:
+            srv.server_close()
+
+    def test_non_tree_ensembles_served_uncompiled(self, tmp_path):
+        X = np.random.default_rng(0).normal(size=(50, 2))
+        bagged = BootstrapEnsemble("Linear Regression", n_replicas=3).fit(X, X[:, 0])
+        save_model(bagged, "bagged", FEATURES, "tool_life", registry_dir=tmp_path)
+        srv = PredictionServer.from_registry(registry_dir=tmp_path, port=0)
+        try:
+            assert isinstance(srv.batchers["bagged"].model, BootstrapEnsemble)
+            np.testing.assert_allclose(srv.batchers["bagged"].predict(X), bagged.predict(X))
+        finally:
+            srv.server_close()
+
+    def test_out_of_distribution_flags(self, model, tmp_path):
+        save_model(model, "lr", FEATURES, "tool_life", registry_dir=tmp_path)
+        X_train = np.column_stack([np.linspace(3, 8, 40), np.linspace(180, 340, 40)])
+        save_reference(DriftReference.from_data(X_train, FEATURES), "lr", tmp_path)
+        srv = PredictionServer.from_registry(registry_dir=tmp_path, port=0)
+        thread = threading.Thread(target=srv.serve_forever, daemon=True)
+        thread.start()
+        try:
+            body = json.dumps({"instances": [[5.0, 260.0], [5.0, 900.0]]}).encode()
+            out = json.loads(_post(srv, "/predict/lr", body))
+            assert out["out_of_distribution"] == [False, True]
+        finally:
+            srv.shutdown()
+            srv.server_close()
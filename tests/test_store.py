@@ -0,0 +1,81 @@
+"""Tests for the fitted-model store."""
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+
+from src.machinability.models.store import ModelStore, data_hash, model_key
+
+
+@pytest.fixture
+def fitted():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(60, 3))
+    y = 5 * X[:, 0] + 0.1 * rng.normal(size=60)
+    model = RandomForestRegressor(n_estimators=20, random_state=0).fit(X[:40], y[:40])
+    return model, X, y
+
+
+class TestDataHash:
+    def test_stable(self):
+        a = np.arange(10.0)
+        assert data_hash(a) == data_hash(a.copy())
+
+    def test_shape_sensitive(self):
+        a = np.arange(12.0)
+        assert data_hash(a) != data_hash(a.reshape(3, 4))
+
+
+class TestModelStore:
+    def test_lookup_by_comma_separated_features(self, fitted):
+        model, X, y = fitted
+        store = ModelStore()
+        digest = data_hash(X[:40], y[:40])
+        store.put("Random Forest", ["a", "b", "c"], "tool_life", digest, model)
+        key = model_key("Random Forest", "a, b, c", "tool_life", digest)
+        assert key in store
+        assert store.estimator(key) is model
+
+    def test_permutation_importance_cached_and_ranked(self, fitted):
+        model, X, y = fitted
+        store = ModelStore()
+        key = store.put(
+            "Random Forest",
+            ["a", "b", "c"],
+            "tool_life",
+            data_hash(X[:40], y[:40]),
+            model,
+            X_test=X[40:],
+            y_test=y[40:],
+        )
+        first = store.permutation_importances(key, n_jobs=1)
+        assert store.permutation_importances(key) is first
+        other = store.permutation_importances(key, n_repeats=2, random_state=0, n_jobs=1)
+        assert other is not first and other != first
+        assert store.permutation_importances(key, n_repeats=2, random_state=0) is other
+        assert store.top_features(key, k=1) == ["a"]
+        assert store.top_features(key, k=1, kind="impurity") == ["a"]
+
+    def test_shap_values_cached_per_input(self, fitted):
+        model, X, y = fitted
+        store = ModelStore()
+        key = store.put(
+            "Random Forest",
+            ["a", "b", "c"],
+            "tool_life",
+            "x",
+            model,
+            X_test=X[40:],
+            y_test=y[40:],
+        )
+        phi, base = store.shap_values(key)
+        assert phi.shape == (20, 3)
+        assert store.shap_values(key)[0] is phi
+        assert store.shap_values(key, X[:5])[0].shape == (5, 3)
+
+    def test_permutation_requires_test_split(self, fitted):
+        model, X, y = fitted
+        store = ModelStore()
+        key = store.put("Random Forest", ["a", "b", "c"], "tool_life", "x", model)
+        with pytest.raises(ValueError):
+            store.permutation_importances(key)
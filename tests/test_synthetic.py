@@ -0,0 +1,60 @@
+"""Tests for the synthetic specimen generator."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.machinability.data.synthetic import (
+    COLUMNS,
+    generate_specimens,
+    iter_specimen_chunks,
+    write_parquet,
+)
+
+
+class TestGenerateSpecimens:
+    def test_columns_and_reproducibility(self):
+        a = generate_specimens(200, seed=7)
+        b = generate_specimens(200, seed=7)
+        assert list(a.columns) == COLUMNS
+        pd.testing.assert_frame_equal(a, b)
+
+    def test_conductivity_correlates_with_tool_life(self):
+        df = generate_specimens(5000, seed=0)
+        assert df["conductivity"].corr(df["tool_life"]) > 0.5
+
+    def test_grades_and_heat_treatments(self):
+        df = generate_specimens(
+            3000, grades=["AISI 4140"], heat_treatments=["annealed", "Q&T"], seed=1
+        )
+        assert set(df["steel_grade"]) == {"AISI 4140"}
+        means = df.groupby("heat_treatment")["hardness"].mean()
+        assert means["Q&T"] > means["annealed"] + 50
+
+    def test_noise_free(self):
+        df = generate_specimens(100, noise=0.0, grades=["AISI 1045"], seed=2)
+        assert df["conductivity"].nunique() == 1
+
+    def test_missing_rate(self):
+        df = generate_specimens(20_000, missing_rate=0.1, seed=3)
+        frac = df[COLUMNS[2:]].isna().to_numpy().mean()
+        assert frac == pytest.approx(0.1, abs=0.01)
+        assert df["steel_grade"].notna().all()
+
+    def test_unknown_grade(self):
+        with pytest.raises(ValueError):
+            generate_specimens(10, grades=["AISI 9999"])
+
+
+class TestChunkedOutput:
+    def test_chunks_sum_to_n(self):
+        sizes = [len(c) for c in iter_specimen_chunks(2500, chunk_size=1000)]
+        assert sizes == [1000, 1000, 500]
+
+    def test_write_parquet(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        path = write_parquet(tmp_path / "specimens.parquet", 2500, chunk_size=1000, seed=5)
+        df = pd.read_parquet(path)
+        assert len(df) == 2500
+        expected = pd.concat(iter_specimen_chunks(2500, chunk_size=1000, seed=5))
+        np.testing.assert_allclose(df["tool_life"], expected["tool_life"])
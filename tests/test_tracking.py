@@ -0,0 +1,113 @@
+"""Tests for buffered MLflow logging."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("mlflow")
+
+from src.machinability.utils.config import REPO_ROOT  # noqa: E402
+from src.machinability.utils.tracking import BufferedRunLogger  # noqa: E402
+
+
+@pytest.fixture
+def logger(tmp_path, monkeypatch):
+    monkeypatch.setenv("MLFLOW_ALLOW_FILE_STORE", "true")
+    with BufferedRunLogger(f"file://{tmp_path}", "test", flush_interval=60) as log:
+        yield log
+
+
+class TestBufferedRunLogger:
+    def test_values_written_in_batches(self, logger):
+        with logger.start_run(run_name="r1") as run:
+            run.log_params({"model_type": "RF", "cv_folds": 5})
+            for step in range(3):
+                run.log_metric("r2", 0.5 + step / 10, step=step)
+            run.set_tag("stage", "sweep")
+        logger.flush()
+        data = logger.client.get_run(run.run_id)
+        assert data.info.status == "FINISHED"
+        assert data.data.params == {"model_type": "RF", "cv_folds": "5"}
+        assert data.data.metrics["r2"] == pytest.approx(0.7)
+        assert data.data.tags["stage"] == "sweep"
+        history = logger.client.get_metric_history(run.run_id, "r2")
+        assert [m.step for m in history] == [0, 1, 2]
+
+    def test_buffered_until_flush(self, logger):
+        run = logger.start_run()
+        run.log_metric("mape", 0.1)
+        assert "mape" not in logger.client.get_run(run.run_id).data.metrics
+        logger.flush()
+        assert logger.client.get_run(run.run_id).data.metrics["mape"] == 0.1
+
+    def test_schema_checked_once_per_run(self, logger):
+        with pytest.warns(UserWarning, match="n_estimators") as record:
+            with logger.start_run() as run:
+                for value in range(5):
+                    run.log_params({"n_estimators": 100, f"extra_{value}": value})
+        assert len(record) == 1
+
+    def test_failed_run_status(self, logger):
+        with pytest.raises(ZeroDivisionError):
+            with logger.start_run() as run:
+                1 / 0
+        logger.flush()
+        assert logger.client.get_run(run.run_id).info.status == "FAILED"
+
+    def test_write_errors_surface_on_flush(self, logger):
+        run = logger.start_run()
+        run.log_param("model_type", "RF")
+        logger.flush()
+        run.log_param("model_type", "SVR")  # MLflow params are immutable
+        with pytest.raises(RuntimeError):
+            logger.flush()
+
+    def test_large_batches_are_chunked(self, logger):
+        with logger.start_run() as run:
+            for step in range(1500):
+                run.log_metric("loss", 1.0 / (step + 1), step=step)
+        logger.flush()
+        assert len(logger.client.get_metric_history(run.run_id, "loss")) == 1500
+
+    def test_closed_logger_rejects_values(self, logger):
+        run = logger.start_run()
+        logger.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            run.log_metric("r2", 0.9)
+
+    def test_log_artifact_pointer(self, tmp_path, monkeypatch):
+        from src.machinability.utils.artifacts import ArtifactStore
+
+        monkeypatch.setenv("MLFLOW_ALLOW_FILE_STORE", "true")
+        store = ArtifactStore(tmp_path / "artifacts")
+        with BufferedRunLogger(
+            f"file://{tmp_path / 'mlruns'}", "test", artifact_store=store
+        ) as logger:
+            runs = []
+            for _ in range(3):
+                with logger.start_run() as run:
+                    run.log_artifact(b"processed data", "data.csv")
+                runs.append(run.run_id)
+        tags = {logger.client.get_run(r).data.tags["artifact.data.csv"] for r in runs}
+        assert len(tags) == 1
+        assert store.resolve(tags.pop()).read_bytes() == b"processed data"
+        assert store.stats()["objects"] == 1
+
+
+def test_default_file_store_works_without_opt_in(tmp_path):
+    # A fresh interpreter with MLFLOW_ALLOW_FILE_STORE unset, as on the models page
+    env = {k: v for k, v in os.environ.items() if k != "MLFLOW_ALLOW_FILE_STORE"}
+    code = (
+        "from src.machinability.utils.tracking import BufferedRunLogger\n"
+        f"with BufferedRunLogger('file://{tmp_path}', 'test', schema=None) as log:\n"
+        "    with log.start_run() as run:\n"
+        "        run.log_metric('r2', 0.5)\n"
+        "print(log.client.get_run(run.run_id).data.metrics['r2'])\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=REPO_ROOT, env=env, capture_output=True, text=True
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip().splitlines()[-1] == "0.5"
@@ -0,0 +1,78 @@
+"""Tests for batched TreeSHAP attributions."""
+
+import itertools
+import math
+
+import numpy as np
+import pytest
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+from sklearn.tree import DecisionTreeRegressor
+
+from src.machinability.models.treeshap import _tree_arrays, tree_shap_values
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 4))
+    y = 2 * X[:, 0] + X[:, 1] * X[:, 2] + (X[:, 0] > 0) * X[:, 3]
+    return X, y
+
+
+def _brute_force_shap(tree, x):
+    """Exact Shapley values of the path-dependent conditional expectation."""
+    a = _tree_arrays(tree)
+    n_features = len(x)
+
+    def expectation(node, subset):
+        if a["left"][node] == -1:
+            return a["value"][node]
+        f, left, right = a["feature"][node], a["left"][node], a["right"][node]
+        if f in subset:
+            return expectation(left if x[f] <= a["threshold"][node] else right, subset)
+        return (
+            a["cover"][left] * expectation(left, subset)
+            + a["cover"][right] * expectation(right, subset)
+        ) / a["cover"][node]
+
+    phi = np.zeros(n_features)
+    for i in range(n_features):
+        others = [j for j in range(n_features) if j != i]
+        for k in range(n_features):
+            weight = math.factorial(k) * math.factorial(n_features - k - 1)
+            weight /= math.factorial(n_features)
+            for subset in itertools.combinations(others, k):
+                s = set(subset)
+                phi[i] += weight * (expectation(0, s | {i}) - expectation(0, s))
+    return phi
+
+
+class TestTreeShap:
+    def test_matches_brute_force_shapley(self, data):
+        X, y = data
+        tree = DecisionTreeRegressor(max_depth=5, random_state=0).fit(X, y)
+        phi, _ = tree_shap_values(tree, X[:4])
+        for i in range(4):
+            expected = _brute_force_shap(tree, X[i].astype(np.float32))
+            np.testing.assert_allclose(phi[i], expected, atol=1e-9)
+
+    @pytest.mark.parametrize(
+        "model",
+        [
+            RandomForestRegressor(n_estimators=10, max_depth=6, random_state=0),
+            GradientBoostingRegressor(n_estimators=20, random_state=0),
+        ],
+    )
+    def test_additivity(self, data, model):
+        X, y = data
+        model.fit(X, y)
+        phi, base = tree_shap_values(model, X[:50], row_chunk_size=16)
+        np.testing.assert_allclose(base + phi.sum(axis=1), model.predict(X[:50]), atol=1e-8)
+
+    def test_parallel_matches_serial(self, data):
+        X, y = data
+        model = RandomForestRegressor(n_estimators=6, max_depth=4, random_state=0).fit(X, y)
+        serial, base_serial = tree_shap_values(model, X[:20])
+        parallel, base_parallel = tree_shap_values(model, X[:20], n_jobs=2)
+        np.testing.assert_allclose(serial, parallel)
+        assert base_serial == pytest.approx(base_parallel)